@@ -2,9 +2,88 @@
 This module is the Algorithm base class created just for generalize the solution process, and
 have generic methods that will be implemented by the classes who inherited this base class.
 """
-import time
+from timeit import default_timer
+from solve_metrics import SolveMetrics, collector
+
+SOLVED = "solved"
+UNSOLVED = "unsolved"
+INVALID = "invalid"
+BUDGET_EXCEEDED = "budget_exceeded"
+
+class SearchBudgetExceeded(Exception):
+    """ Raised by count_node when the deadline or the node budget of a search is exhausted."""
+    pass
 
 class Algorithm(object):
+    enumerates_solutions = False
+    board_sizes = (9,)
+    time_limit = None
+    max_nodes = None
+    deadline = None
+    search_puzzle = None
+    nodes, guesses, backtracks, propagations, max_depth = 0, 0, 0, 0, 0
+    search_time = 0.0
+    budget_exceeded = False
+    metrics = None
+
+    def set_search_limits(self, time_limit=None, max_nodes=None):
+        """ Bounds every following search of the algorithm, None means no limit.
+        Keyword arguments:
+            time_limit -- maximum wall-clock seconds of a search.
+            max_nodes -- maximum number of nodes (guesses or branches) visited by a search.
+        """
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+
+    def start_search(self, grid_basic_format=None):
+        """ Resets the search counters and sets the deadline of a new search.
+        Keyword arguments:
+            grid_basic_format -- the puzzle searched, kept for the SolveMetrics record.
+        """
+        self.search_puzzle = str(grid_basic_format) if grid_basic_format is not None else None
+        self.nodes, self.guesses, self.backtracks, self.propagations = 0, 0, 0, 0
+        self.max_depth = 0
+        self.search_time = 0.0
+        self.budget_exceeded = False
+        self.deadline = default_timer() + self.time_limit if self.time_limit is not None else None
+
+    def count_node(self, depth=0):
+        """ Counts a node of the search, the algorithms call it every time they branch or guess.
+        It raises SearchBudgetExceeded when the node budget or the deadline is exhausted, so the
+        search stops cooperatively.
+        Keyword arguments:
+            depth -- number of branch points above the node, it keeps max_depth up to date.
+        """
+        self.nodes += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchBudgetExceeded("Node budget of %d exceeded" % (self.max_nodes))
+        if self.deadline is not None and default_timer() > self.deadline:
+            raise SearchBudgetExceeded("Time limit of %s sec exceeded" % (self.time_limit))
+
+    def abandon_search(self, grid_basic_format):
+        """ Generic method called when a search exceeds its budget, the classes who inherit the
+        Algorithm object override it to leave the unsolved puzzle as the grid retrieved.
+        """
+        pass
+
+    def search_metrics(self):
+        """ Returns the SolveMetrics record of the current (or last) search, also when it was
+        stopped before the end."""
+        return SolveMetrics(self.__class__.__name__, self.search_puzzle, self.search_time,\
+            self.nodes, self.guesses, self.backtracks, self.propagations, self.max_depth,\
+            self.budget_exceeded)
+
+    def adopt_search_counters(self, metrics):
+        """ Copies the counters of a search performed by another algorithm, it is used by the
+        algorithms that delegate the search to other ones.
+        Keyword arguments:
+            metrics -- SolveMetrics record of the delegated search.
+        """
+        self.nodes, self.guesses, self.backtracks = metrics.nodes, metrics.guesses,\
+            metrics.backtracks
+        self.propagations, self.max_depth = metrics.propagations, metrics.max_depth
 
     def solve_sudoku(self, grid_basic_format):
         """ Generic method that needs to be implemented in the classes who inherit the
@@ -18,15 +97,43 @@ class Algorithm(object):
         """
         raise NotImplementedError("Retrieve method not implemented in Base Class")
 
-def elapsed_time(func):
-    """ decorator for solve_sudoku method in charge of tracking the puzzle resolution time."""
-    def wrapper(*arg):
-        # before
-        start_time = time.clock()
-        res = func(*arg)
-        # after
-        end_time = time.clock()
-        solved_time = end_time - start_time
-        print "Sudoku Puzzle was solved in:  %2.4f sec" % (solved_time)
-        return res
+    def iter_solutions(self, grid_basic_format):
+        """ Generic method that needs to be implemented in the classes who inherit the
+        Algorithm object and set enumerates_solutions to True, it should yield lazily every
+        solution of the puzzle as a long string with 81 characters.
+        """
+        raise NotImplementedError("Iterate solutions method not implemented in Base Class")
+
+    def count_solutions(self, grid_basic_format, limit=None):
+        """ Counts the solutions yielded by iter_solutions, stopping as soon as the limit is reached.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 characters where zeros represent empty values.
+            limit -- maximum number of solutions to look for, None means all of them.
+        Returned parameter:
+            count -- number of solutions found, it is never greater than limit.
+        """
+        count = 0
+        for solution in self.iter_solutions(grid_basic_format):
+            count += 1
+            if limit is not None and count >= limit:
+                break
+        return count
+
+def measured_search(func):
+    """ decorator for solve_sudoku method in charge of starting the search budget and counters
+    of the algorithm, when the budget is exceeded the search is abandoned and budget_exceeded is
+    set. The SolveMetrics of the search are kept in the metrics attribute of the algorithm and
+    reported to the process-wide collector."""
+    def wrapper(self, grid_basic_format):
+        self.start_search(grid_basic_format)
+        start_time = default_timer()
+        try:
+            return func(self, grid_basic_format)
+        except SearchBudgetExceeded:
+            self.budget_exceeded = True
+            self.abandon_search(grid_basic_format)
+        finally:
+            self.search_time = default_timer() - start_time
+            self.metrics = self.search_metrics()
+            collector.record(self.metrics)
     return wrapper
@@ -0,0 +1,37 @@
+"""
+This module keeps the registry of the Algorithm subclasses that can solve puzzles, keyed by the
+name used for them in the algorithm tags of game_settings.xml (e.g. "Peter Norvig").
+"""
+from collections import OrderedDict
+from backtracking import Backtracking
+from peter_norvig import PeterNorvig
+from brute_force import BruteForce
+from dancing_links import DancingLinks
+from portfolio_race import PortfolioRace
+from auto_select import AutoSelect
+
+ALGORITHMS = OrderedDict()
+
+def register_algorithm(name, algorithm_class):
+    """ Adds an Algorithm subclass to the registry.
+    Keyword arguments:
+        name -- name of the algorithm as written in game_settings.xml (e.g. "Brute Force")
+        algorithm_class -- Algorithm subclass that can be created without arguments
+    """
+    ALGORITHMS[name] = algorithm_class
+
+def create_algorithm(name):
+    """ Returns a new instance of the algorithm registered with the name given.
+    Keyword arguments:
+        name -- name of the algorithm as written in game_settings.xml (e.g. "Brute Force")
+    """
+    if name not in ALGORITHMS:
+        raise ValueError("Unknown algorithm: %s" % (name))
+    return ALGORITHMS[name]()
+
+register_algorithm("Backtracking", Backtracking)
+register_algorithm("Peter Norvig", PeterNorvig)
+register_algorithm("Brute Force", BruteForce)
+register_algorithm("Dancing Links", DancingLinks)
+register_algorithm("Portfolio Race", PortfolioRace)
+register_algorithm("Auto", AutoSelect)
@@ -0,0 +1,206 @@
+"""
+This module is going to choose, puzzle by puzzle, the algorithm that solves the sudoku grid. Cheap
+features of the grid (clue count, cells left open by a propagation pass and candidates per open
+cell) give the profile of the puzzle, and the puzzle goes to the algorithm whose SolveMetrics show
+it was the fastest for that profile so far.
+"""
+from collections import namedtuple
+from timeit import default_timer
+from algorithm import Algorithm, SearchBudgetExceeded
+from algorithm import measured_search
+from solve_metrics import collector
+from candidate_bits import BIT_COUNT
+from backtracking import Backtracking
+from dancing_links import DancingLinks
+from peter_norvig import PeterNorvig
+from brute_force import BruteForce
+from ..game.puzzle import cell_values
+
+class GridFeatures(namedtuple('GridFeatures', ['clues', 'open_cells', 'mean_candidates',\
+    'max_candidates'])):
+    """ Features of a puzzle taken after a propagation pass:
+        clues -- digits given by the puzzle
+        open_cells -- cells with more than one candidate left, None when the pass found a
+        contradiction
+        mean_candidates, max_candidates -- candidates per open cell
+    """
+    __slots__ = ()
+
+def grid_features(grid_basic_format, propagator=None):
+    """
+    Computes the GridFeatures of a puzzle with the constraint propagation of PeterNorvig.
+    Keyword arguments:
+        grid_basic_format -- a long string with 81 digit characters.
+        propagator -- PeterNorvig instance reused for the propagation pass.
+    """
+    propagator = propagator or PeterNorvig()
+    clues = sum(1 for value in cell_values(grid_basic_format) if 0 < value <= 9)
+    cells = propagator.parse_grid_bits(grid_basic_format)
+    if cells is False:
+        return GridFeatures(clues, None, 0.0, 0)
+    counts = [BIT_COUNT[mask] for mask in cells if BIT_COUNT[mask] > 1]
+    if not counts:
+        return GridFeatures(clues, 0, 0.0, 0)
+    return GridFeatures(clues, len(counts), float(sum(counts)) / len(counts), max(counts))
+
+def grid_profile(features):
+    """
+    Groups the puzzles with similar features, the algorithm timings are kept per profile.
+    Keyword arguments:
+        features -- GridFeatures of the puzzle.
+    Returned parameters:
+        profile -- short string (e.g. "c2-o3-k4" for 20 to 29 clues, 40 to 59 open cells after the
+        propagation pass and 4 candidates per open cell on average).
+    """
+    if features.open_cells is None:
+        return "contradiction"
+    if features.open_cells == 0:
+        return "c%d-propagated" % (features.clues // 10)
+    return "c%d-o%d-k%d" % (features.clues // 10, features.open_cells // 20 + 1,\
+        int(features.mean_candidates))
+
+class ProfileHistory(object):
+
+    def __init__(self):
+        """
+        Initializes an empty history, timings -- dictionary of profile -> algorithm name ->
+        [solves, total seconds].
+        """
+        self.timings = {}
+
+    def record(self, profile, metrics):
+        """
+        Adds the elapsed time of a search to the timings of its algorithm for a profile, a search
+        stopped by its budget is counted with the time it spent.
+        Keyword arguments:
+            profile -- profile of the puzzle searched.
+            metrics -- SolveMetrics record of the search.
+        """
+        timing = self.timings.setdefault(profile, {}).setdefault(metrics.algorithm, [0, 0.0])
+        timing[0] += 1
+        timing[1] += metrics.elapsed_time
+
+    def learn(self, records, propagator=None):
+        """
+        Adds the timings of SolveMetrics records taken elsewhere (e.g. the records of the
+        process-wide collector), the records without puzzle are skipped.
+        Keyword arguments:
+            records -- iterable of SolveMetrics records.
+            propagator -- PeterNorvig instance reused to compute the features of the puzzles.
+        """
+        propagator = propagator or PeterNorvig()
+        profiles = {}
+        for metrics in records:
+            if not metrics.puzzle:
+                continue
+            if metrics.puzzle not in profiles:
+                profiles[metrics.puzzle] = grid_profile(grid_features(metrics.puzzle, propagator))
+            self.record(profiles[metrics.puzzle], metrics)
+
+    def mean_time(self, profile, name):
+        """ Returns the mean seconds of an algorithm for a profile, or None without timings."""
+        timing = self.timings.get(profile, {}).get(name)
+        return timing[1] / timing[0] if timing else None
+
+    def fastest(self, profile, names):
+        """
+        Returns the name of the algorithm with the lowest mean time for a profile, or None when
+        none of them has timings for it.
+        Keyword arguments:
+            profile -- profile of the puzzle.
+            names -- names of the candidate algorithms.
+        """
+        timed = [(self.mean_time(profile, name), name) for name in names\
+            if self.mean_time(profile, name) is not None]
+        return min(timed)[1] if timed else None
+
+history = ProfileHistory()
+
+class AutoSelect(Algorithm):
+    """ Keyword arguments:
+        engines -- Algorithm subclasses among which the puzzles are dispatched, the first one is
+        used for the profiles without timings yet.
+        history -- ProfileHistory with the timings, the process-wide one by default, which starts
+        from the records of the engines kept by the process-wide collector.
+        grid_resolved -- grid retrieved from the engine that solved the puzzle.
+        selected -- name of the engine that solved the last puzzle.
+        profile -- profile of the last puzzle.
+    """
+    ENGINES = (Backtracking, DancingLinks, PeterNorvig, BruteForce)
+    EXPLORATION_FACTOR = 4.0
+    MIN_EXPLORATION_TIME = 0.05
+
+    def __init__(self, engines=ENGINES, profile_history=None):
+        if not engines:
+            raise ValueError("Auto needs at least one engine")
+        self.engines = dict((engine_class.__name__, engine_class()) for engine_class in engines)
+        self.names = [engine_class.__name__ for engine_class in engines]
+        self.history = profile_history if profile_history is not None else history
+        self.propagator = PeterNorvig()
+        if profile_history is None and not history.timings:
+            history.learn([metrics for metrics in collector.records\
+                if metrics.algorithm in self.names], self.propagator)
+        self.grid_resolved = None
+        self.selected = None
+        self.profile = None
+
+    @measured_search
+    def solve_sudoku(self, grid_basic_format):
+        """
+        Overrides the solve_sudoku superclass method. An engine without timings for the profile
+        is tried first, with a time limit of a few times the mean of the fastest engine, so every
+        engine gets measured without paying its worst cases, if it runs out of time the fastest
+        engine solves the puzzle.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        """
+        self.grid_resolved = str(grid_basic_format)
+        self.profile = grid_profile(grid_features(grid_basic_format, self.propagator))
+        fastest = self.history.fastest(self.profile, self.names)
+        if fastest is None:
+            self.run_engine(self.names[0], grid_basic_format)
+            return
+        untried = [name for name in self.names if self.history.mean_time(self.profile, name) is None]
+        if untried:
+            exploration_time = max(self.EXPLORATION_FACTOR * self.history.mean_time(self.profile,\
+                fastest), self.MIN_EXPLORATION_TIME)
+            if self.run_engine(untried[0], grid_basic_format, exploration_time):
+                return
+        self.run_engine(fastest, grid_basic_format)
+
+    def run_engine(self, name, grid_basic_format, time_limit=None):
+        """
+        Solves the grid with an engine and records its timing for the profile of the puzzle.
+        Keyword arguments:
+            name -- name of the engine.
+            grid_basic_format -- a long string with 81 digit characters.
+            time_limit -- optional seconds of an exploration, it does not exceed the time left.
+        Returned parameters:
+            True when the engine completed its search, False when an exploration ran out of time.
+        """
+        if self.deadline is not None:
+            time_left = self.deadline - default_timer()
+            if time_left <= 0:
+                raise SearchBudgetExceeded("Time limit of %s sec exceeded" % (self.time_limit))
+            time_limit = min(time_limit, time_left) if time_limit is not None else time_left
+        engine = self.engines[name]
+        engine.set_search_limits(time_limit, self.max_nodes)
+        engine.solve_sudoku(grid_basic_format)
+        self.history.record(self.profile, engine.metrics)
+        self.adopt_search_counters(engine.metrics)
+        if engine.budget_exceeded:
+            if self.deadline is not None and default_timer() >= self.deadline or\
+                self.max_nodes is not None and engine.nodes > self.max_nodes:
+                raise SearchBudgetExceeded("Search budget exceeded by %s" % (name))
+            return False
+        self.selected = name
+        self.grid_resolved = engine.retrieve_grid_basic_format()
+        return True
+
+    def retrieve_grid_basic_format(self):
+        """
+        Overrides the retrieve_grid_basic_format superclass method.
+        Returned parameters:
+            outcome -- a string of 81 characters
+        """
+        return self.grid_resolved
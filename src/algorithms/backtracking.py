@@ -3,20 +3,35 @@ This module is going to use the backtracking algorithm to resolve
 the sudoku grid which will be specified here as a sequence of 81 characters.
 """
 from algorithm import Algorithm
-from algorithm import elapsed_time
-from itertools import chain                                                             
+from algorithm import measured_search
+from candidate_bits import ALL_CANDIDATES, DIGIT_BITS, BIT_VALUES, BIT_COUNT, MASK_BITS
+from board_topology import BOX_OF
+from ..game.puzzle import cell_values
+from itertools import chain
 
 class Backtracking(Algorithm):
-    def __init__(self):
+    ENGINES = ("mrv", "sequential")
+
+    def __init__(self, engine="mrv"):
         """
         Initializes the variables that will be used througout the class.
         Keyword arguments:
             self.grid -- the input value that is a string of 81 characters where zeros represent
             empty values.
+            self.engine -- "mrv" branches on the empty cell with the fewest remaining values using
+            occupancy bitmasks, "sequential" visits the empty cells in row-major order.
+            self.row_masks, self.column_masks, self.block_masks -- 9-bit masks of the digits
+            already used in each row, column and block.
+            self.empty_cells -- list of (pos_x, pos_y, block) tuples that are still unfilled.
         """
+        if engine not in self.ENGINES:
+            raise ValueError("Unknown Backtracking engine: %s" % (engine))
         self.grid = None
+        self.engine = engine
+        self.row_masks, self.column_masks, self.block_masks = None, None, None
+        self.empty_cells = None
 
-    @elapsed_time
+    @measured_search
     def solve_sudoku(self, grid_basic_format):
         """
         Load the puzzle and solve it.
@@ -24,18 +39,23 @@ class Backtracking(Algorithm):
             grid_basic_format -- a  string with 81 digit characters where zeros represent empty values.
         """
         self.load_puzzle(grid_basic_format)
-        self.solve_backtracking()
+        if self.engine == "mrv":
+            if self.load_occupancy_masks():
+                self.solve_mrv()
+        else:
+            self.solve_backtracking()
 
     def load_puzzle(self, grid_basic_format):
         """
-        Receives a string with 81 characters and transforms it to a list of list
+        Receives a string with 81 characters (or a Puzzle) and transforms it to a list of list
         Keyword arguments:
-            grid_basic_format -- a  string with 81 digit characters where zeros represent empty spaces.
+            grid_basic_format -- a  string with 81 digit characters where zeros represent empty
+            spaces, or a Puzzle whose cell values are used as they are.
         Returned parameters:
              list_of_list  -- A  2-dimensional array of size 9 x 9 composed of integer values.
         """
         dimension = 9
-        list_of_numbers = [int(n) for n in grid_basic_format]
+        list_of_numbers = list(cell_values(grid_basic_format))
         list_of_list = [[0] * dimension] * dimension
         for row in range(dimension):
             list_of_list[row] = list_of_numbers[row * dimension : (row + 1) * dimension]
@@ -153,7 +173,7 @@ class Backtracking(Algorithm):
                 break
         return valid_section
 
-    def solve_backtracking(self, pos_x=0, pos_y=0):
+    def solve_backtracking(self, pos_x=0, pos_y=0, depth=0):
         """
         Recursive Method which visits empty cells and start guessing filling numbers and calling
         the is_valid_guess() method which in turn will be in charge of verifying the correcteness
@@ -162,19 +182,102 @@ class Backtracking(Algorithm):
         Keyword arguments:
             pos_x -- specific row where the guess is located within the 2-dimensional array.
             pos_y -- specific column where the guess is located within the 2-dimensional array.
+            depth -- number of guesses made above this cell.
         """
+        self.count_node(depth)
         pos_x, pos_y = self.find_next_cell_to_fill(pos_x, pos_y)
         if pos_x == -1:
             return True
+        guessed = False
         for guess in range(1, 10):
             if not self.is_valid_guess(pos_x, pos_y, guess):
                 continue
+            guessed = True
+            self.guesses += 1
             self.grid[pos_x][pos_y] = guess
-            if self.solve_backtracking(pos_x, pos_y): 
+            if self.solve_backtracking(pos_x, pos_y, depth + 1): 
                 return True
             self.grid[pos_x][pos_y] = 0
+        if not guessed:
+            self.backtracks += 1
         return False
 
+    def load_occupancy_masks(self):
+        """
+        Builds the row, column and block occupancy masks and the list of empty cells from the
+        loaded grid.
+        Returned parameters:
+            True if the known digits are consistent, False if a digit is repeated in a row,
+            column or block.
+        """
+        self.row_masks, self.column_masks, self.block_masks = [0] * 9, [0] * 9, [0] * 9
+        self.empty_cells = []
+        for pos_x in range(9):
+            for pos_y in range(9):
+                block = BOX_OF[pos_x * 9 + pos_y]
+                number = self.grid[pos_x][pos_y]
+                if number == 0:
+                    self.empty_cells.append((pos_x, pos_y, block))
+                    continue
+                bit = DIGIT_BITS[number - 1]
+                if (self.row_masks[pos_x] | self.column_masks[pos_y] | self.block_masks[block]) & bit:
+                    return False
+                self.row_masks[pos_x] |= bit
+                self.column_masks[pos_y] |= bit
+                self.block_masks[block] |= bit
+        return True
+
+    def solve_mrv(self, depth=0):
+        """
+        Recursive Method which picks the empty cell with the fewest remaining values (MRV), and
+        tries each of them updating the occupancy masks on place and undoing them on backtrack.
+        Keyword arguments:
+            depth -- number of guesses made above this cell.
+        Returned parameters:
+            True if every empty cell could be filled, otherwise False.
+        """
+        self.count_node(depth)
+        row_masks, column_masks, block_masks = self.row_masks, self.column_masks, self.block_masks
+        empty_cells = self.empty_cells
+        if not empty_cells:
+            return True
+        best_position, best_count, best_free = None, 10, 0
+        for position, (pos_x, pos_y, block) in enumerate(empty_cells):
+            free = ALL_CANDIDATES & ~(row_masks[pos_x] | column_masks[pos_y] | block_masks[block])
+            count = BIT_COUNT[free]
+            if count < best_count:
+                best_position, best_count, best_free = position, count, free
+                if count <= 1:
+                    break
+        if best_count == 0:
+            self.backtracks += 1
+            return False
+        empty_cells[best_position], empty_cells[-1] = empty_cells[-1], empty_cells[best_position]
+        cell = empty_cells.pop()
+        pos_x, pos_y, block = cell
+        for bit in MASK_BITS[best_free]:
+            row_masks[pos_x] |= bit
+            column_masks[pos_y] |= bit
+            block_masks[block] |= bit
+            self.grid[pos_x][pos_y] = BIT_VALUES[bit]
+            self.guesses += 1
+            if self.solve_mrv(depth + 1):
+                return True
+            row_masks[pos_x] ^= bit
+            column_masks[pos_y] ^= bit
+            block_masks[block] ^= bit
+        self.grid[pos_x][pos_y] = 0
+        empty_cells.append(cell)
+        empty_cells[best_position], empty_cells[-1] = empty_cells[-1], empty_cells[best_position]
+        return False
+
+    def abandon_search(self, grid_basic_format):
+        """
+        Overrides the abandon_search superclass method, the guesses already written in the grid
+        are discarded by loading the puzzle again.
+        """
+        self.load_puzzle(grid_basic_format)
+
     def retrieve_grid_basic_format(self):
         """
         Overrides the retrieve_grid_basic_format superclass method, for this algorithm is required
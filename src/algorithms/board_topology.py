@@ -0,0 +1,76 @@
+"""
+This module holds the topology of the boards shared by the algorithms, the builder and the grid:
+the cells of a N x N board are numbered from 0 (top left) to N x N - 1 in row-major order, and the
+rows, columns, boxes, units and peers of every cell are precomputed once per board size as tuples
+of cell indexes and as bitmasks where bit i stands for the cell i.
+(E.g. for the 9x9 boards the cell 10 is in the row 1, the column 1 and the box 0)
+"""
+from collections import namedtuple
+
+BOARD_SIZES = (4, 9, 16, 25)
+
+class BoardTopology(namedtuple('BoardTopology', ['size', 'box_size', 'rows', 'columns', 'boxes',\
+    'units', 'row_of', 'column_of', 'box_of', 'cell_units', 'peers', 'unit_masks', 'peer_masks'])):
+    """ Immutable topology of a N x N board:
+        size, box_size -- side of the board and of its boxes (e.g. 9 and 3)
+        rows, columns, boxes -- tuples of the cell indexes of every row, column and box
+        units -- rows + columns + boxes
+        row_of, column_of, box_of -- row, column and box index of every cell
+        cell_units -- (column, row, box) of every cell, the order of the units of SudokuGrid
+        peers -- sorted cell indexes sharing a unit with every cell, the cell excluded
+        unit_masks, peer_masks -- bitmask forms of units and peers
+    """
+    __slots__ = ()
+
+def build_topology(size):
+    """
+    Computes the BoardTopology of a board size.
+    Keyword arguments:
+        size -- side of the board, one of BOARD_SIZES.
+    """
+    if size not in BOARD_SIZES:
+        raise ValueError("Unsupported board size: %s" % (size))
+    box_size = int(round(size ** 0.5))
+    cells = range(size * size)
+    rows = tuple(tuple(range(row * size, (row + 1) * size)) for row in range(size))
+    columns = tuple(tuple(range(column, size * size, size)) for column in range(size))
+    boxes = tuple(tuple(row * size + column for row in range(band, band + box_size)\
+        for column in range(stack, stack + box_size))\
+        for band in range(0, size, box_size) for stack in range(0, size, box_size))
+    row_of = tuple(index // size for index in cells)
+    column_of = tuple(index % size for index in cells)
+    box_of = tuple(box_size * (row_of[index] // box_size) + column_of[index] // box_size\
+        for index in cells)
+    cell_units = tuple((columns[column_of[index]], rows[row_of[index]], boxes[box_of[index]])\
+        for index in cells)
+    peers = tuple(tuple(sorted(set(sum(cell_units[index], ())) - set([index]))) for index in cells)
+    units = rows + columns + boxes
+    return BoardTopology(size, box_size, rows, columns, boxes, units, row_of, column_of, box_of,\
+        cell_units, peers, tuple(cells_mask(unit) for unit in units),\
+        tuple(cells_mask(peer_cells) for peer_cells in peers))
+
+def cells_mask(cells):
+    """ Returns the bitmask of a group of cell indexes."""
+    mask = 0
+    for index in cells:
+        mask |= 1 << index
+    return mask
+
+TOPOLOGIES = {}
+
+def board_topology(size=9):
+    """
+    Returns the BoardTopology of a board size, it is computed the first time and then shared.
+    Keyword arguments:
+        size -- side of the board, one of BOARD_SIZES.
+    """
+    topology = TOPOLOGIES.get(size)
+    if topology is None:
+        topology = TOPOLOGIES[size] = build_topology(size)
+    return topology
+
+TOPOLOGY = board_topology(9)
+ROWS, COLUMNS, BOXES, UNITS = TOPOLOGY.rows, TOPOLOGY.columns, TOPOLOGY.boxes, TOPOLOGY.units
+ROW_OF, COLUMN_OF, BOX_OF = TOPOLOGY.row_of, TOPOLOGY.column_of, TOPOLOGY.box_of
+CELL_UNITS, PEERS = TOPOLOGY.cell_units, TOPOLOGY.peers
+UNIT_MASKS, PEER_MASKS = TOPOLOGY.unit_masks, TOPOLOGY.peer_masks
@@ -5,8 +5,16 @@ which will be specified here as a string sequence of 81 characters.
 import sys
 import math
 import time
+from bisect import bisect_left
 from algorithm import Algorithm
-from algorithm import elapsed_time
+from algorithm import measured_search
+from board_topology import ROWS, COLUMNS, BOXES, ROW_OF, COLUMN_OF, BOX_OF as BLOCK_OF
+from ..game.puzzle import cell_values
+
+ROW_PEERS = tuple(tuple(cell for cell in ROWS[ROW_OF[index]] if cell != index) for index in range(81))
+COLUMN_PEERS = tuple(tuple(cell for cell in COLUMNS[COLUMN_OF[index]] if cell != index)\
+    for index in range(81))
+BLOCK_CELLS = tuple(BOXES[BLOCK_OF[index]] for index in range(81))
 
 class BruteForce(Algorithm):
     def __init__(self):
@@ -16,15 +24,24 @@ class BruteForce(Algorithm):
             self.number_of_rows -- number of rows that a standard sudoku puzzle has (9)
             self.square_root -- square root of the number of rows. {3}
             self.puzzle -- An array of the 81 integers that compose the puzzle
-            self.known_indices -- An array of all the positions of the non-zero values
+            self.known_indices -- A set of all the positions of the non-zero values
+            self.known_cells -- An array of 81 booleans, True where the value is known
+            self.free_indices -- An array of the positions of the zero values, in order
+            self.free_depths -- An array of 81 integers, the depth of every free cell in the search
+            self.row_counts, self.column_counts, self.block_counts -- how many times each digit
+            is currently placed in every row, column and block (e.g. row_counts[2][7])
         """
         self.number_of_rows = 9
         self.square_root = int(math.sqrt(9))
         self.puzzle = []
-        self.known_indices = []
+        self.known_indices = set()
+        self.known_cells = []
+        self.free_indices = []
+        self.free_depths = []
+        self.row_counts, self.column_counts, self.block_counts = None, None, None
         self.last_valid_guess_index = None
 
-    @elapsed_time
+    @measured_search
     def solve_sudoku(self, grid_basic_format):
         """
         Overrides the solve_sudoku superclass method, for the Brute force algorithm we need
@@ -34,32 +51,80 @@ class BruteForce(Algorithm):
             grid_basic_format -- a long string with 81 digit characters.
         """ 
         self.load_puzzle(grid_basic_format)
+        if not self.givens_are_consistent():
+            return
         cell = self.solve_from(0, 1)
         while cell is not None:
             cell = self.solve_from(cell[0], cell[1])
 
+    def abandon_search(self, grid_basic_format):
+        """
+        Overrides the abandon_search superclass method, the guesses already written in the puzzle
+        are discarded by loading the puzzle again.
+        """
+        self.load_puzzle(grid_basic_format)
+
+    def givens_are_consistent(self):
+        """
+        Checks in the digit-count tables that no known digit is repeated in a row, column or block,
+        otherwise the puzzle cannot be solved and the search is skipped.
+        """
+        for counts in (self.row_counts, self.column_counts, self.block_counts):
+            for digit_counts in counts:
+                if max(digit_counts) > 1:
+                    return False
+        return True
+
     def load_puzzle(self, grid_basic_format):
         """
         Method that translates the string of 81 characters into a 1-D Array of 81 integers and 
         identifies the positions where there are non-zero digits
         Keyword arguments:
-            grid_basic_format -- a long string with 81 digit characters.
+            grid_basic_format -- a long string with 81 digit characters, or a Puzzle whose cell
+            values are used as they are.
         Useful parameters:
             self.puzzle -- 1-D Array of 81 integers where 0 represents empty values.
-            self.known_indices -- Array of the positions where there are non-zero digits
+            self.known_indices -- Set of the positions where there are non-zero digits
         """ 
-        self.puzzle = []
-        self.known_indices = []
-        rows = []
-        for row in grid_basic_format:
-            if row:
-                rows.append(row)
-
-        for row_index, row in enumerate(rows):
-            if row.isdigit():
-                self.puzzle.append(int(row))
-            if row.isdigit() and int(row) != 0:
-                self.known_indices.append(row_index)
+        self.puzzle = list(cell_values(grid_basic_format))
+        self.known_indices = set(index for index, value in enumerate(self.puzzle) if value)
+        self.known_cells = [index in self.known_indices for index in range(len(self.puzzle))]
+        self.free_indices = [index for index in range(len(self.puzzle)) if not self.known_cells[index]]
+        self.free_depths = [0] * len(self.puzzle)
+        for depth, index in enumerate(self.free_indices):
+            self.free_depths[index] = depth + 1
+        self.load_digit_counts()
+
+    def load_digit_counts(self):
+        """
+        Builds the digit-count tables of every row, column and block from the loaded puzzle.
+        """
+        self.row_counts = [[0] * (self.number_of_rows + 1) for _ in range(self.number_of_rows)]
+        self.column_counts = [[0] * (self.number_of_rows + 1) for _ in range(self.number_of_rows)]
+        self.block_counts = [[0] * (self.number_of_rows + 1) for _ in range(self.number_of_rows)]
+        for index, value in enumerate(self.puzzle):
+            if value:
+                self.row_counts[ROW_OF[index]][value] += 1
+                self.column_counts[COLUMN_OF[index]][value] += 1
+                self.block_counts[BLOCK_OF[index]][value] += 1
+
+    def set_value(self, index, value):
+        """
+        Writes a value in the puzzle keeping the digit-count tables up to date.
+        Keyword arguments:
+            index -- the position of the cell from 0 to 80.
+            value -- value from 0 to 9, where 0 clears the cell.
+        """
+        previous = self.puzzle[index]
+        if previous:
+            self.row_counts[ROW_OF[index]][previous] -= 1
+            self.column_counts[COLUMN_OF[index]][previous] -= 1
+            self.block_counts[BLOCK_OF[index]][previous] -= 1
+        if value:
+            self.row_counts[ROW_OF[index]][value] += 1
+            self.column_counts[COLUMN_OF[index]][value] += 1
+            self.block_counts[BLOCK_OF[index]][value] += 1
+        self.puzzle[index] = value
 
     def solve_from(self, index, starting_guess):
         """ 
@@ -76,13 +141,15 @@ class BruteForce(Algorithm):
         """
         self.last_valid_guess_index = None
         found_valid_guess = False
+        known_cells = self.known_cells
         for current_guess in range(index, len(self.puzzle)):
-            if current_guess not in self.known_indices:
+            if not known_cells[current_guess]:
                 found_valid_guess = self.add_guess_to_puzzle(starting_guess, current_guess)
                 starting_guess = 1
                 if not found_valid_guess: break
         guess_tuple = None
         if not found_valid_guess:
+            self.backtracks += 1
             guess_tuple = self.return_next_guess_tuple(index, self.last_valid_guess_index)
         return guess_tuple
 
@@ -96,12 +163,14 @@ class BruteForce(Algorithm):
             found_valid_guess -- when the current_guess is valid the cycle is broken and the True value
             should be returned, otherwise we return false
         """
+        self.count_node(self.free_depths[current_guess])
         found_valid_guess = False
         for guess in range(starting_guess, self.number_of_rows + 1):
             if self.validate_guess(current_guess, guess):
                 found_valid_guess = True
                 self.last_valid_guess_index = current_guess
-                self.puzzle[current_guess] = guess
+                self.set_value(current_guess, guess)
+                self.guesses += 1
                 break
         return found_valid_guess
 
@@ -113,30 +182,33 @@ class BruteForce(Algorithm):
             index -- index that will track the position where to fill the guesses.
             last_valid_guess_index -- index of the last correct guess.
         Returned Parameter:
-            guess_tuple -- tuple that contains the guess position and the guess value 
+            guess_tuple -- tuple that contains the guess position and the guess value, or None
+            when every guess of the first free cell was already tried (the puzzle is unsolvable)
         """
         guess_tuple = None
         new_index = last_valid_guess_index if last_valid_guess_index is not None else index - 1
-        new_starting_guess = self.puzzle[new_index] + 1
-        self.reset_puzzle_at(new_index)
-
-        while new_starting_guess > self.number_of_rows or new_index in self.known_indices:
-            new_index -= 1
+        while new_index >= 0:
             new_starting_guess = self.puzzle[new_index] + 1
             self.reset_puzzle_at(new_index)
-        guess_tuple = (new_index, new_starting_guess)
+            if new_starting_guess <= self.number_of_rows and not self.known_cells[new_index]:
+                guess_tuple = (new_index, new_starting_guess)
+                break
+            new_index -= 1
         return guess_tuple
 
 
     def reset_puzzle_at(self, index):
         """ Resets the guesses from a certain index because the puzzle will not be solvable with
         the wrongly considered valid guesses found until now.
+        The guesses always fill a prefix of the free cells, so the reset stops at the first
+        free cell that is already empty.
         Keyword arguments:
             index -- the puzzle will be reset starting from that index specified.
         """
-        for i in range(index, len(self.puzzle)):
-            if i not in self.known_indices:
-                self.puzzle[i] = 0
+        for i in self.free_indices[bisect_left(self.free_indices, index):]:
+            if self.puzzle[i] == 0:
+                break
+            self.set_value(i, 0)
 
     def validate_row(self, index, guess):
         """ Validates that the "guess" filled in an "index" cell is not breaking the puzzle rule
@@ -147,11 +219,8 @@ class BruteForce(Algorithm):
         Returned parameter:
             Boolean -- True if gues is valid for its current row, otherwise False.
         """
-        row_index = int(math.floor(index / self.number_of_rows))
-        start = self.number_of_rows * row_index
-        finish = start + self.number_of_rows
-        for c_index in range(start, finish):
-            if c_index != index and self.puzzle[c_index] == guess:
+        for c_index in ROW_PEERS[index]:
+            if self.puzzle[c_index] == guess:
                 return False
         return True
 
@@ -164,10 +233,8 @@ class BruteForce(Algorithm):
         Returned parameter:
             Boolean -- True if gues is valid for its current column, otherwise False.
         """
-        col_index = index % self.number_of_rows
-        for cell in range(0, self.number_of_rows):
-            cell_index = col_index + (self.number_of_rows * cell)
-            if cell_index != index and self.puzzle[cell_index] == guess:
+        for cell_index in COLUMN_PEERS[index]:
+            if self.puzzle[cell_index] == guess:
                 return False
         return True
 
@@ -180,44 +247,14 @@ class BruteForce(Algorithm):
         Returned parameter:
             Boolean -- True if gues is valid for its current block, otherwise False.
         """
-        row_index = int(math.floor(index / self.number_of_rows))
-        col_index = index % self.number_of_rows
-
-        block_row = int(math.floor(row_index / self.square_root))
-        block_col = int(math.floor(col_index / self.square_root))
-
-        row_start = block_row * self.square_root
-        row_end = row_start + self.square_root - 1
-        col_start = block_col * self.square_root
-        col_end = col_start + self.square_root - 1
-
-        for cell in range(row_start, row_end + 1):
-            if self.found_duplicate_in_columns(cell, guess, col_start, col_end):
+        for cell_index in BLOCK_CELLS[index]:
+            if self.puzzle[cell_index] == guess:
                 return False
         return True
 
-    def found_duplicate_in_columns(self, cell, guess, col_start, col_end):
-        """
-        Look for the first duplicated cell that matches with the guess in certain columns.
-        Keyword arguments:
-            cell -- current cell index where the serach will start.
-            guess -- value from 1 to 9 that will be compared to find duplicates.
-            col_start -- column position where the search operation will start (e.g. from 4 to 6).
-            col_end -- column position where the search operation will end (e.g. from 4 to 6).
-        Returned parameters:
-            cell_duplicate -- True is a duplicate is found, otherwise False.
-        """
-        cell_duplicate = False
-        for visit in range(col_start, col_end + 1):
-            i = visit + (cell * self.number_of_rows)
-            if self.puzzle[i] == guess:
-                cell_duplicate = True
-                break
-        return cell_duplicate
-
-
     def validate_guess(self, index, guess):
-        """ Evaluates the 3 validation types required to define a valid guess to solve the puzzle.
+        """ Evaluates the 3 validation types required to define a valid guess to solve the puzzle,
+        looking up the digit-count tables instead of scanning the row, column and block.
         Keyword arguments:
             index -- index that is tracking the position where to fill the guess.
             guess -- value from 1 to 9 that will be validated in this method.
@@ -225,8 +262,10 @@ class BruteForce(Algorithm):
             True -- if the guess is valid in row, column and block
             False -- if the guess  is not at least valid in one condition
         """
-        return self.validate_row(index, guess) and self.validate_column(index, guess) \
-        and self.validate_block(index, guess)
+        own = 1 if self.puzzle[index] == guess else 0
+        return self.row_counts[ROW_OF[index]][guess] == own \
+        and self.column_counts[COLUMN_OF[index]][guess] == own \
+        and self.block_counts[BLOCK_OF[index]][guess] == 0
 
     def retrieve_grid_basic_format(self):
         """
@@ -0,0 +1,15 @@
+"""
+This module holds the lookup tables shared by the bitset engines, where the candidates of a
+cell are stored as a 9-bit integer: bit 0 stands for digit '1' and bit 8 stands for digit '9'.
+(E.g. 0b000010101 means that the digits '1', '3' and '5' are still possible in the cell)
+"""
+
+ALL_CANDIDATES = 0x1FF
+DIGIT_BITS = tuple(1 << shift for shift in range(9))
+CHAR_BITS = dict((str(shift + 1), 1 << shift) for shift in range(9))
+BIT_CHARS = dict((1 << shift, str(shift + 1)) for shift in range(9))
+BIT_VALUES = dict((1 << shift, shift + 1) for shift in range(9))
+BIT_COUNT = tuple(bin(mask).count('1') for mask in range(ALL_CANDIDATES + 1))
+LOWEST_BIT = tuple(mask & -mask for mask in range(ALL_CANDIDATES + 1))
+MASK_BITS = tuple(tuple(bit for bit in DIGIT_BITS if mask & bit)\
+    for mask in range(ALL_CANDIDATES + 1))
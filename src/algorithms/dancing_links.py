@@ -0,0 +1,275 @@
+"""
+This module is going to use Knuth's Dancing Links (Algorithm X) to solve the sudoku grid
+which will be specified here as a string sequence of 81 characters. The puzzle is translated
+into an exact cover problem of 324 constraints (cell, row-digit, column-digit and block-digit)
+and 729 candidate rows (one per cell and digit). The larger boards (e.g. 16x16 with the symbols
+1 to 9 and A to G) are translated the same way.
+"""
+from algorithm import Algorithm
+from algorithm import measured_search
+from board_topology import BOARD_SIZES, board_topology
+from ..game.sudoku_grid import SYMBOLS
+from ..game.puzzle import cell_values
+
+class DancingLinks(Algorithm):
+    """ Keeps the exact cover matrix as parallel lists of links, where the node 0 is the root
+    header, the nodes 1 to 324 are the column headers and the remaining nodes belong to the
+    candidate rows.
+    Keyword arguments:
+        dimension -- number of rows, columns and digits of the puzzle (9 for the 9x9 boards)
+        topology -- BoardTopology of the board size of the puzzle
+        templates -- the links of the full matrix of every board size, built once and copied for
+        every puzzle
+        solution_rows -- the candidate rows selected so far, each one is cell * 9 + digit
+    """
+    enumerates_solutions = True
+    board_sizes = BOARD_SIZES
+
+    def __init__(self):
+        self.dimension = 9
+        self.topology = board_topology(9)
+        self.templates = {}
+        self.left, self.right, self.up, self.down = None, None, None, None
+        self.column, self.size, self.row_of_node = None, None, None
+        self.solution_rows = []
+        self.grid_resolved = None
+
+    @measured_search
+    def solve_sudoku(self, grid_basic_format):
+        """
+        Overrides the solve_sudoku superclass method, the givens are selected as part of the
+        exact cover and then the remaining constraints are covered by the search.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        """
+        self.load_puzzle(grid_basic_format)
+        if self.select_givens(grid_basic_format) and self.search():
+            self.grid_resolved = self.rows_to_grid(self.solution_rows)
+        else:
+            self.grid_resolved = str(grid_basic_format)
+
+    def load_puzzle(self, grid_basic_format):
+        """
+        Restores a fresh copy of the exact cover matrix of the board size of the puzzle and clears
+        the previous solution.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters (N x N symbols for the
+            larger boards).
+        """
+        self.dimension = int(round(len(cell_values(grid_basic_format)) ** 0.5))
+        self.topology = board_topology(self.dimension)
+        if self.dimension not in self.templates:
+            self.templates[self.dimension] = self.build_matrix()
+        left, right, up, down, column, size, row_of_node = self.templates[self.dimension]
+        self.left, self.right, self.up, self.down = left[:], right[:], up[:], down[:]
+        self.column, self.size = column, size[:]
+        self.row_of_node = row_of_node
+        self.solution_rows = []
+        self.grid_resolved = None
+
+    def build_matrix(self):
+        """
+        Builds the links of the exact cover matrix for an empty puzzle.
+        Returned parameters:
+            template -- tuple with the left, right, up, down, column, size and row_of_node lists.
+        """
+        cells = self.dimension * self.dimension
+        headers = 4 * cells
+        left = [headers] + list(range(headers))
+        right = list(range(1, headers + 1)) + [0]
+        up = list(range(headers + 1))
+        down = list(range(headers + 1))
+        column = list(range(headers + 1))
+        size = [0] * (headers + 1)
+        row_of_node = [None] * (headers + 1)
+        for row in range(cells * self.dimension):
+            first = len(column)
+            for position, header in enumerate(self.row_columns(row)):
+                node = first + position
+                left.append(first + (position - 1) % 4)
+                right.append(first + (position + 1) % 4)
+                up.append(up[header])
+                down.append(header)
+                down[up[header]] = node
+                up[header] = node
+                column.append(header)
+                row_of_node.append(row)
+                size[header] += 1
+        return left, right, up, down, column, size, row_of_node
+
+    def row_columns(self, row):
+        """
+        Returns the four column headers covered by a candidate row.
+        Keyword arguments:
+            row -- candidate row index, it is cell * 9 + digit where digit goes from 0 to 8.
+        """
+        cells = self.dimension * self.dimension
+        cell, digit = divmod(row, self.dimension)
+        topology = self.topology
+        return (1 + cell,
+                1 + cells + topology.row_of[cell] * self.dimension + digit,
+                1 + 2 * cells + topology.column_of[cell] * self.dimension + digit,
+                1 + 3 * cells + topology.box_of[cell] * self.dimension + digit)
+
+    def select_givens(self, grid_basic_format):
+        """
+        Selects the candidate rows of the known digits, returns False when two givens
+        compete for the same constraint.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        """
+        covered = set()
+        for cell, value in enumerate(cell_values(grid_basic_format)):
+            if not value:
+                continue
+            digit = value - 1
+            if digit >= self.dimension:
+                return False
+            row = cell * self.dimension + digit
+            headers = self.row_columns(row)
+            if covered.intersection(headers):
+                return False
+            covered.update(headers)
+            for header in headers:
+                self.cover(header)
+            self.solution_rows.append(row)
+        return True
+
+    def cover(self, header):
+        """ Removes the column header from the header list and every row using it from the
+        other columns.
+        Keyword arguments:
+            header -- index of the column header node.
+        """
+        self.propagations += 1
+        left, right, up, down, column, size = \
+            self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[header]] = right[header]
+        left[right[header]] = left[header]
+        node = down[header]
+        while node != header:
+            second_node = right[node]
+            while second_node != node:
+                down[up[second_node]] = down[second_node]
+                up[down[second_node]] = up[second_node]
+                size[column[second_node]] -= 1
+                second_node = right[second_node]
+            node = down[node]
+
+    def uncover(self, header):
+        """ Restores the column header and its rows, in the exact reverse order of cover.
+        Keyword arguments:
+            header -- index of the column header node.
+        """
+        left, right, up, down, column, size = \
+            self.left, self.right, self.up, self.down, self.column, self.size
+        node = up[header]
+        while node != header:
+            second_node = left[node]
+            while second_node != node:
+                size[column[second_node]] += 1
+                down[up[second_node]] = second_node
+                up[down[second_node]] = second_node
+                second_node = left[second_node]
+            node = up[node]
+        right[left[header]] = header
+        left[right[header]] = header
+
+    def choose_column(self):
+        """ Returns the column header with the fewest remaining rows (Knuth's S heuristic)."""
+        right, size = self.right, self.size
+        best_header, best_size = None, None
+        header = right[0]
+        while header != 0:
+            if best_size is None or size[header] < best_size:
+                best_header, best_size = header, size[header]
+                if best_size <= 1:
+                    break
+            header = right[header]
+        return best_header
+
+    def search(self):
+        """
+        Looks for the first exact cover, the selected rows are left in solution_rows.
+        Returned parameters:
+            True when an exact cover is found, otherwise False.
+        """
+        for solution_rows in self.iter_search():
+            return True
+        return False
+
+    def iter_search(self, depth=0):
+        """
+        Recursive Algorithm X, every level covers the column with the fewest rows and tries
+        each of its rows until all the columns are covered. It yields the solution_rows list
+        every time an exact cover is found, and only goes on when the next one is requested.
+        Keyword arguments:
+            depth -- number of rows chosen by the search above this level.
+        """
+        self.count_node(depth)
+        if self.right[0] == 0:
+            yield self.solution_rows
+            return
+        header = self.choose_column()
+        if self.size[header] == 0:
+            self.backtracks += 1
+            return
+        self.cover(header)
+        node = self.down[header]
+        while node != header:
+            self.solution_rows.append(self.row_of_node[node])
+            self.guesses += 1
+            second_node = self.right[node]
+            while second_node != node:
+                self.cover(self.column[second_node])
+                second_node = self.right[second_node]
+            for solution_rows in self.iter_search(depth + 1):
+                yield solution_rows
+            self.solution_rows.pop()
+            second_node = self.left[node]
+            while second_node != node:
+                self.uncover(self.column[second_node])
+                second_node = self.left[second_node]
+            node = self.down[node]
+        self.uncover(header)
+
+    def iter_solutions(self, grid_basic_format):
+        """
+        Overrides the iter_solutions superclass method yielding every exact cover lazily.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        Yielded parameters:
+            solution -- a string of 81 characters for each solution of the puzzle
+        """
+        self.start_search(grid_basic_format)
+        self.load_puzzle(grid_basic_format)
+        if self.select_givens(grid_basic_format):
+            for solution_rows in self.iter_search():
+                yield self.rows_to_grid(solution_rows)
+
+    def abandon_search(self, grid_basic_format):
+        """
+        Overrides the abandon_search superclass method, the puzzle is kept as the grid retrieved.
+        """
+        self.grid_resolved = str(grid_basic_format)
+
+    def rows_to_grid(self, rows):
+        """
+        Converts the selected candidate rows into a string of 81 characters.
+        Keyword arguments:
+            rows -- list of candidate rows, each one is cell * 9 + digit.
+        """
+        grid = ['0'] * (self.dimension * self.dimension)
+        for row in rows:
+            cell, digit = divmod(row, self.dimension)
+            grid[cell] = SYMBOLS[digit]
+        return ''.join(grid)
+
+    def retrieve_grid_basic_format(self):
+        """
+        Overrides the retrieve_grid_basic_format superclass method, the solution is already
+        stored as a string of 81 characters.
+        Returned parameters:
+            grid_resolved -- a string of 81 characters
+        """
+        return self.grid_resolved
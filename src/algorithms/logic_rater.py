@@ -0,0 +1,334 @@
+"""
+This module is going to grade the sudoku grids by the human solving techniques they need. The
+techniques are applied from the easiest to the hardest one, without search, and the puzzle is
+graded by the hardest technique it needed (e.g. a puzzle that needs a pointing pair is "Medium").
+A puzzle that the techniques can not finish is graded "Expert", it needs search.
+"""
+from collections import namedtuple, OrderedDict
+from itertools import combinations
+from candidate_bits import ALL_CANDIDATES, CHAR_BITS, BIT_CHARS, BIT_COUNT, DIGIT_BITS,\
+    LOWEST_BIT, MASK_BITS
+from board_topology import ROWS, COLUMNS, BOXES, UNITS, ROW_OF, COLUMN_OF, BOX_OF, PEERS
+from ..game.puzzle import cell_values
+
+TECHNIQUES = OrderedDict((
+    ("hidden_single", "Easy"),
+    ("naked_single", "Easy"),
+    ("pointing_pair", "Medium"),
+    ("box_line_reduction", "Medium"),
+    ("naked_pair", "Medium"),
+    ("hidden_pair", "Medium"),
+    ("naked_triple", "Hard"),
+    ("hidden_triple", "Hard"),
+    ("x_wing", "Hard")))
+DIFFICULTIES = ("Easy", "Medium", "Hard", "Expert")
+
+class LogicRating(namedtuple('LogicRating', ['grid', 'solved', 'hardest', 'difficulty',\
+    'techniques'])):
+    """ Grade of a puzzle:
+        grid -- long string of 81 characters with the cells the techniques could resolve
+        solved -- True when the techniques resolved every cell
+        hardest -- name of the hardest technique needed, None when no technique was needed
+        difficulty -- "Easy", "Medium", "Hard" or "Expert" (it needs search or it has a
+        contradiction), None for the puzzles with a contradiction
+        techniques -- dictionary of technique name -> number of times it made progress
+    """
+    __slots__ = ()
+
+class Contradiction(Exception):
+    """ Raised when a cell runs out of candidates or a digit runs out of places in a unit."""
+    pass
+
+class LogicRater(object):
+
+    def __init__(self):
+        """
+        Initializes the state of the grading.
+        Keyword arguments:
+            self.cells -- list of 81 candidate masks (see candidate_bits).
+            self.values -- list of 81 characters, '0' for the cells not resolved yet.
+        """
+        self.cells = None
+        self.values = None
+        self.steps = (self.hidden_single, self.naked_single, self.pointing_pair,\
+            self.box_line_reduction, self.naked_pair, self.hidden_pair, self.naked_triple,\
+            self.hidden_triple, self.x_wing)
+
+    def rate(self, grid_basic_format):
+        """
+        Applies the techniques until the puzzle is resolved or none of them makes progress, an
+        easier technique is always tried before a harder one.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        Returned parameters:
+            rating -- LogicRating record of the puzzle.
+        """
+        counts = {}
+        try:
+            self.load_puzzle(grid_basic_format)
+            hardest = self.deduce(len(self.steps), counts)
+        except Contradiction:
+            return LogicRating(''.join(self.values), False, None, None, counts)
+        solved = '0' not in self.values
+        hardest_name = TECHNIQUES.keys()[hardest] if hardest >= 0 else None
+        if not solved:
+            difficulty = DIFFICULTIES[-1]
+        else:
+            difficulty = TECHNIQUES[hardest_name] if hardest_name else DIFFICULTIES[0]
+        return LogicRating(''.join(self.values), solved, hardest_name, difficulty, counts)
+
+    def reveal(self, grid_basic_format, solution, difficulty):
+        """
+        Adds clues of the solution to a puzzle until it can be resolved with the techniques of a
+        difficulty (or easier ones), a clue is revealed in the open cell with the fewest candidates
+        every time the techniques get stuck. The puzzle returned has a single solution.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+            solution -- long string of 81 characters, a solution of the puzzle.
+            difficulty -- "Easy", "Medium" or "Hard".
+        Returned parameters:
+            puzzle -- long string of 81 characters with the clues of the puzzle and the revealed ones.
+        """
+        steps = self.allowed_steps(difficulty)
+        puzzle = list(str(grid_basic_format))
+        self.load_puzzle(grid_basic_format)
+        while True:
+            self.deduce(steps, {})
+            open_cells = self.open_cells(range(81))
+            if not open_cells:
+                return ''.join(puzzle)
+            index = min(open_cells, key=lambda index: BIT_COUNT[self.cells[index]])
+            puzzle[index] = solution[index]
+            self.place(index, CHAR_BITS[solution[index]])
+
+    def resolves(self, grid_basic_format, difficulty):
+        """
+        Returns True when the techniques of a difficulty (or easier ones) resolve every cell of a
+        puzzle, it is a single grading pass stopped at the first technique not allowed.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+            difficulty -- "Easy", "Medium" or "Hard".
+        """
+        try:
+            self.load_puzzle(grid_basic_format)
+            self.deduce(self.allowed_steps(difficulty), {})
+        except Contradiction:
+            return False
+        return '0' not in self.values
+
+    def allowed_steps(self, difficulty):
+        """ Returns the number of techniques, in the order of TECHNIQUES, allowed in a difficulty."""
+        if difficulty not in DIFFICULTIES[:-1]:
+            raise ValueError("Unknown logic difficulty: %s" % (difficulty))
+        return len([name for name, level in TECHNIQUES.items()\
+            if DIFFICULTIES.index(level) <= DIFFICULTIES.index(difficulty)])
+
+    def deduce(self, steps, counts):
+        """
+        Applies the first techniques until the puzzle is resolved or none of them makes progress.
+        Keyword arguments:
+            steps -- number of techniques allowed, in the order of TECHNIQUES.
+            counts -- dictionary of technique name -> number of times it made progress, updated.
+        Returned parameters:
+            hardest -- position in TECHNIQUES of the hardest technique applied, -1 for none.
+        """
+        hardest = -1
+        names = TECHNIQUES.keys()
+        while '0' in self.values:
+            for level, step in enumerate(self.steps[:steps]):
+                if step():
+                    counts[names[level]] = counts.get(names[level], 0) + 1
+                    hardest = max(hardest, level)
+                    break
+            else:
+                break
+        return hardest
+
+    def load_puzzle(self, grid_basic_format):
+        """ Places the givens of the puzzle, every cell starts with the nine candidates."""
+        self.cells = [ALL_CANDIDATES] * 81
+        self.values = ['0'] * 81
+        for index, value in enumerate(cell_values(grid_basic_format)):
+            if 0 < value <= 9:
+                if not self.cells[index] & DIGIT_BITS[value - 1]:
+                    raise Contradiction("Digit %s repeated in a unit" % (value))
+                self.place(index, DIGIT_BITS[value - 1])
+
+    def place(self, index, bit):
+        """ Resolves a cell and removes its digit from the candidates of its peers."""
+        self.cells[index] = bit
+        self.values[index] = BIT_CHARS[bit]
+        for peer in PEERS[index]:
+            if self.cells[peer] & bit:
+                self.eliminate(peer, bit)
+
+    def eliminate(self, index, mask):
+        """
+        Removes candidates from a cell.
+        Keyword arguments:
+            index -- position of the cell from 0 to 80.
+            mask -- candidates to remove.
+        Returned parameters:
+            True when the cell lost at least one candidate.
+        """
+        remaining = self.cells[index] & ~mask
+        if remaining == self.cells[index]:
+            return False
+        if remaining == 0:
+            raise Contradiction("No candidates left in cell %d" % (index))
+        self.cells[index] = remaining
+        return True
+
+    def open_cells(self, unit):
+        """ Returns the cells of a unit that are not resolved yet."""
+        return [index for index in unit if self.values[index] == '0']
+
+    def naked_single(self):
+        """ Resolves the cells with a single candidate left."""
+        progress = False
+        for index in range(81):
+            if self.values[index] == '0' and BIT_COUNT[self.cells[index]] == 1:
+                self.place(index, self.cells[index])
+                progress = True
+        return progress
+
+    def hidden_single(self):
+        """ Resolves the digits that have a single place left in a unit."""
+        progress = False
+        cells = self.cells
+        for unit in UNITS:
+            once, twice = 0, 0
+            for index in unit:
+                twice |= once & cells[index]
+                once |= cells[index]
+            if once != ALL_CANDIDATES:
+                raise Contradiction("No place left for digit %s" %\
+                    (BIT_CHARS[LOWEST_BIT[ALL_CANDIDATES & ~once]]))
+            for bit in MASK_BITS[once & ~twice]:
+                places = [index for index in unit if cells[index] & bit]
+                if not places:
+                    raise Contradiction("No place left for digit %s" % (BIT_CHARS[bit]))
+                if self.values[places[0]] == '0':
+                    self.place(places[0], bit)
+                    progress = True
+        return progress
+
+    def pointing_pair(self):
+        """ A digit confined to one row (or column) of a box is removed from the rest of it."""
+        return self.confined_candidates(BOXES, (ROW_OF, ROWS), (COLUMN_OF, COLUMNS))
+
+    def box_line_reduction(self):
+        """ A digit confined to one box of a row (or column) is removed from the rest of the box."""
+        return self.confined_candidates(ROWS + COLUMNS, (BOX_OF, BOXES))
+
+    def confined_candidates(self, units, *lines):
+        """
+        Eliminates a digit from the cells of a second unit when its places in a first unit are all
+        in the intersection of both units.
+        Keyword arguments:
+            units -- first units checked.
+            lines -- (unit of each cell, units) pairs where the second unit is looked for.
+        """
+        progress = False
+        for unit in units:
+            open_cells = self.open_cells(unit)
+            for bit in DIGIT_BITS:
+                places = [index for index in open_cells if self.cells[index] & bit]
+                if len(places) < 2:
+                    continue
+                for unit_of, second_units in lines:
+                    if len(set(unit_of[index] for index in places)) != 1:
+                        continue
+                    for index in second_units[unit_of[places[0]]]:
+                        if index not in unit and self.values[index] == '0':
+                            progress = self.eliminate(index, bit) or progress
+        return progress
+
+    def naked_pair(self):
+        """ Two cells of a unit with the same two candidates remove them from the rest of it."""
+        return self.naked_subset(2)
+
+    def naked_triple(self):
+        """ Three cells of a unit with three candidates between them remove them from the rest."""
+        return self.naked_subset(3)
+
+    def naked_subset(self, size):
+        """
+        Eliminates the candidates of a group of cells from the rest of the unit, when the group
+        has as many cells as candidates.
+        Keyword arguments:
+            size -- number of cells of the group.
+        """
+        progress = False
+        for unit in UNITS:
+            open_cells = self.open_cells(unit)
+            small_cells = [index for index in open_cells if BIT_COUNT[self.cells[index]] <= size]
+            for group in combinations(small_cells, size):
+                mask = 0
+                for index in group:
+                    mask |= self.cells[index]
+                if BIT_COUNT[mask] != size:
+                    continue
+                for index in open_cells:
+                    if index not in group:
+                        progress = self.eliminate(index, mask) or progress
+        return progress
+
+    def hidden_pair(self):
+        """ Two digits confined to the same two cells of a unit remove the other candidates."""
+        return self.hidden_subset(2)
+
+    def hidden_triple(self):
+        """ Three digits confined to three cells of a unit remove the other candidates."""
+        return self.hidden_subset(3)
+
+    def hidden_subset(self, size):
+        """
+        Eliminates the other candidates of a group of cells, when a group of digits has no places
+        left outside of them.
+        Keyword arguments:
+            size -- number of digits of the group.
+        """
+        progress = False
+        for unit in UNITS:
+            open_cells = self.open_cells(unit)
+            places = {}
+            for bit in DIGIT_BITS:
+                digit_places = [index for index in open_cells if self.cells[index] & bit]
+                if 2 <= len(digit_places) <= size:
+                    places[bit] = digit_places
+            for bits in combinations(sorted(places), size):
+                group = set()
+                for bit in bits:
+                    group.update(places[bit])
+                if len(group) != size:
+                    continue
+                mask = sum(bits)
+                for index in group:
+                    progress = self.eliminate(index, ALL_CANDIDATES & ~mask) or progress
+        return progress
+
+    def x_wing(self):
+        """
+        A digit with two places in each of two rows, in the same two columns, is removed from the
+        rest of those columns (and likewise with the columns and rows swapped).
+        """
+        progress = False
+        for lines, crossing_of, crossings in ((ROWS, COLUMN_OF, COLUMNS), (COLUMNS, ROW_OF, ROWS)):
+            for bit in DIGIT_BITS:
+                pairs = {}
+                for line in lines:
+                    places = [index for index in line if self.values[index] == '0' and\
+                        self.cells[index] & bit]
+                    if len(places) == 2:
+                        key = (crossing_of[places[0]], crossing_of[places[1]])
+                        pairs.setdefault(key, []).append(set(places))
+                for key, wings in pairs.items():
+                    if len(wings) != 2:
+                        continue
+                    corners = wings[0] | wings[1]
+                    for crossing in key:
+                        for index in crossings[crossing]:
+                            if index not in corners and self.values[index] == '0':
+                                progress = self.eliminate(index, bit) or progress
+        return progress
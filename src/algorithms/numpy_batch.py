@@ -0,0 +1,143 @@
+"""
+This module is going to solve a batch of sudoku grids at once, keeping the candidates of N
+puzzles in an (N, 81) array of 9-bit masks and running the naked single and hidden single
+propagation as vectorized NumPy operations over the whole batch. Only the puzzles that still
+have undecided cells after the propagation are handed to a scalar Algorithm (PeterNorvig).
+NumPy is an optional dependency, it is only required when a NumPyBatchSolver is created.
+"""
+try:
+    import numpy
+except ImportError:
+    numpy = None
+from peter_norvig import PeterNorvig
+from board_topology import UNITS
+
+class NumPyBatchSolver(object):
+    """ Solves batches of puzzles with vectorized propagation plus a scalar search fallback.
+    Keyword arguments:
+        fallback -- Algorithm instance that searches the puzzles left undecided (PeterNorvig)
+        propagated -- number of puzzles of the last batch solved by propagation alone
+        searched -- number of puzzles of the last batch handed to the fallback algorithm
+        contradictions -- number of puzzles of the last batch found unsolvable by propagation
+    """
+    def __init__(self, fallback=None):
+        if numpy is None:
+            raise ImportError("NumPyBatchSolver requires the numpy package")
+        self.fallback = fallback if fallback is not None else PeterNorvig()
+        self.propagated, self.searched, self.contradictions = 0, 0, 0
+        self.unit_cells = numpy.array(UNITS)
+        slots = dict(((cell, []) for cell in range(81)))
+        for unit, unit_cells in enumerate(self.unit_cells):
+            for position, cell in enumerate(unit_cells):
+                slots[cell].append(unit * 9 + position)
+        self.cell_slots = numpy.array([slots[cell] for cell in range(81)])
+        self.cell_units = self.cell_slots // 9
+        self.digit_bits = [numpy.uint16(1 << shift) for shift in range(9)]
+        self.bit_count = numpy.array([bin(mask).count('1') for mask in range(512)])
+        self.bit_chars = numpy.zeros(512, dtype=numpy.uint8) + ord('0')
+        for shift in range(9):
+            self.bit_chars[1 << shift] = ord('1') + shift
+
+    def load_batch(self, grids):
+        """
+        Translates the puzzles into an (N, 81) array of candidate masks.
+        Keyword arguments:
+            grids -- list of long strings of 81 digit characters where zeros represent empty cells.
+        Returned parameters:
+            candidates -- uint16 array where every given is a single bit and every empty cell is 0x1FF
+        """
+        for string_grid in grids:
+            if not (string_grid.isdigit() and len(string_grid) == 81):
+                raise ValueError('Every puzzle should only contain 81 valid digits')
+        digits = numpy.frombuffer(''.join(grids), dtype=numpy.uint8).reshape(len(grids), 81)
+        digits = digits.astype(numpy.int64) - ord('0')
+        givens = numpy.left_shift(1, numpy.maximum(digits, 1) - 1)
+        return numpy.where(digits > 0, givens, 0x1FF).astype(numpy.uint16)
+
+    def propagate(self, candidates):
+        """
+        Applies the naked single and hidden single rules to every puzzle until nothing changes,
+        each pass only works on the puzzles that changed in the previous one.
+        Keyword arguments:
+            candidates -- (N, 81) uint16 array of candidate masks
+        """
+        candidates = candidates.copy()
+        active = numpy.arange(len(candidates))
+        while len(active):
+            previous = candidates[active]
+            current = self.assign_hidden_singles(self.eliminate_naked_singles(previous))
+            candidates[active] = current
+            active = active[(current != previous).any(axis=1)]
+        return candidates
+
+    def eliminate_naked_singles(self, candidates):
+        """
+        Removes the value of every decided cell from the candidates of its peers.
+        Keyword arguments:
+            candidates -- (N, 81) uint16 array of candidate masks
+        """
+        single = (candidates & (candidates - 1)) == 0
+        fixed = numpy.where(single, candidates, 0).astype(numpy.uint16)
+        unit_fixed = numpy.bitwise_or.reduce(fixed[:, self.unit_cells], axis=2)
+        peer_fixed = numpy.bitwise_or.reduce(unit_fixed[:, self.cell_units], axis=2)
+        return numpy.where(single, candidates, candidates & ~peer_fixed).astype(numpy.uint16)
+
+    def assign_hidden_singles(self, candidates):
+        """
+        Assigns a digit to a cell when it is the only place left for that digit in a unit.
+        Keyword arguments:
+            candidates -- (N, 81) uint16 array of candidate masks
+        """
+        candidates = candidates.copy()
+        for bit in self.digit_bits:
+            places = (candidates[:, self.unit_cells] & bit) != 0
+            only_place = places & (places.sum(axis=2) == 1)[:, :, numpy.newaxis]
+            hidden = only_place.reshape(len(candidates), -1)[:, self.cell_slots].any(axis=2)
+            candidates[hidden] = bit
+        return candidates
+
+    def find_contradictions(self, candidates):
+        """
+        Flags the puzzles with an empty cell or with a digit decided twice in the same unit.
+        Keyword arguments:
+            candidates -- (N, 81) uint16 array of candidate masks
+        """
+        single = ((candidates & (candidates - 1)) == 0) & (candidates != 0)
+        fixed = numpy.where(single, candidates, 0).astype(numpy.uint16)
+        unit_fixed = numpy.bitwise_or.reduce(fixed[:, self.unit_cells], axis=2)
+        unit_singles = single[:, self.unit_cells].sum(axis=2)
+        repeated = (unit_singles > self.bit_count[unit_fixed]).any(axis=1)
+        return (candidates == 0).any(axis=1) | repeated
+
+    def solve_batch(self, grids):
+        """
+        Solves a batch of puzzles, the ones that propagation alone cannot finish are searched
+        by the fallback algorithm starting from the cells already decided.
+        Keyword arguments:
+            grids -- list of long strings of 81 digit characters where zeros represent empty cells.
+        Returned parameters:
+            solutions -- list of strings of 81 characters in the input order, an unsolvable puzzle
+            is returned unchanged.
+        """
+        grids = [str(string_grid).strip() for string_grid in grids]
+        self.propagated, self.searched, self.contradictions = 0, 0, 0
+        if not grids:
+            return []
+        candidates = self.propagate(self.load_batch(grids))
+        contradictions = self.find_contradictions(candidates)
+        decided = ((candidates & (candidates - 1)) == 0).all(axis=1)
+        partial_grids = self.bit_chars[candidates]
+        solutions = []
+        for index, string_grid in enumerate(grids):
+            if contradictions[index]:
+                self.contradictions += 1
+                solutions.append(string_grid)
+            elif decided[index]:
+                self.propagated += 1
+                solutions.append(partial_grids[index].tostring())
+            else:
+                self.searched += 1
+                self.fallback.solve_sudoku(partial_grids[index].tostring())
+                solution = self.fallback.retrieve_grid_basic_format()
+                solutions.append(solution if '0' not in solution else string_grid)
+        return solutions
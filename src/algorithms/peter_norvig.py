@@ -6,8 +6,11 @@ import sys
 import math
 import time
 from algorithm import Algorithm
-from algorithm import elapsed_time
+from algorithm import measured_search
+from candidate_bits import ALL_CANDIDATES, DIGIT_BITS, BIT_CHARS, BIT_COUNT, LOWEST_BIT, MASK_BITS
+from board_topology import CELL_UNITS as UNIT_INDICES, PEERS as PEER_INDICES
 from ..game.sudoku_grid import SudokuGrid
+from ..game.puzzle import cell_values
 
 class PeterNorvig(Algorithm):
     """ Initializes a Gridwithout digits generated yet
@@ -15,32 +18,51 @@ class PeterNorvig(Algorithm):
     sudoku_grid -- module that is able to build a dictionary of positions and values.
     string_grid -- the input value that is a string of 84 characters where zero represents empty
     grid_resolved -- the input value that is a string of 84 characters without zeros
+    engine -- "bitset" keeps the candidates of the 81 integer-indexed cells as 9-bit integers,
+    "string" keeps them in a dict of digit strings keyed by 'A1'-style squares.
     """
-    def __init__(self):
+    ENGINES = ("bitset", "string")
+    enumerates_solutions = True
+
+    def __init__(self, engine="bitset"):
+        if engine not in self.ENGINES:
+            raise ValueError("Unknown Peter Norvig engine: %s" % (engine))
         self.sudoku_grid = SudokuGrid()
         self.string_grid = None
         self.grid_resolved = None
+        self.engine = engine
 
 
-    @elapsed_time
+    @measured_search
     def solve_sudoku(self, grid_basic_format):
         """ Initializes a Grid without digits generated yet
         Keyword arguments:
         grid_basic_format -- string of 84 characters where zero represents empty cells
         """
-        self.sudoku_grid.load_grid_values(grid_basic_format)
-        self.grid_resolved = self.search(self.parse_grid(grid_basic_format))
+        self.string_grid = str(grid_basic_format)
+        self.grid_resolved = False
+        if self.engine == "bitset":
+            cells = self.search_bits(self.parse_grid_bits(grid_basic_format))
+            self.grid_resolved = self.values_from_bits(cells)
+        else:
+            self.grid_resolved = self.search(self.parse_grid(grid_basic_format))
 
 
-    def search(self, values):
+    def search(self, values, depth=0):
         """Using depth-first search and propagation, try all possible values.
         Keyword arguments:
             square -- coordinate of a square position of type string (e.g. 'A2')
             digits -- it is content of a square of type string (e.g. 8)
             values -- dict of possible values, {square: digits} (e.g. {'A1':'1', 'A2':'8', ..})
+            depth -- number of guesses made above this search
         """
+        if depth:
+            self.guesses += 1
         if values is False:
+            if depth:
+                self.backtracks += 1
             return False ## Failed earlier
+        self.count_node(depth)
         if all(len(values[square]) == 1 for square in self.sudoku_grid.squares):
             return values  ## Solved!
         ## Chose the unfilled square square with the fewest possibilities
@@ -49,15 +71,16 @@ class PeterNorvig(Algorithm):
             if len(values[square]) > 1:
                 list_of_values.append((len(values[square]), square))
         (number, square) = min(list_of_values)
-        dic_values_selected = []
-        for digit in values[square]:
-            dic_values_selected.append(self.search(self.assign(values.copy(), square, digit)))
+        dic_values_selected = (self.search(self.assign(values.copy(), square, digit), depth + 1)\
+            for digit in values[square])
         return self.evaluate_dic_values(dic_values_selected)
 
     def evaluate_dic_values(self, dic_values):
         """Return elements of 'dic_values' sequence which are true.
+        The sequence is consumed lazily, so the remaining digits are not searched once a
+        solution is found.
         Keyword arguments:
-            dic_values -- An array of {square: digits} dictionary values. (Result of search efforts).
+            dic_values -- A sequence of {square: digits} dictionary values. (Result of search efforts).
         Returned parameter:
             Result could be either False or a dictionary with values to solve the game.
              i.e: {'A1': '8', 'B2': '9', and so on... 
@@ -93,7 +116,7 @@ class PeterNorvig(Algorithm):
             dictionary -- dict of {square: char} e.g {'A1': '0', 'A2': '1', etc...}
         """
         chars = []
-        for char in grid_basic_format:
+        for char in str(grid_basic_format):
             if char in self.sudoku_grid.digits or char in '0.':
                 chars.append(char)
         dictionary = dict(zip(self.sudoku_grid.squares, chars))
@@ -124,6 +147,7 @@ class PeterNorvig(Algorithm):
         if digit not in values[s_index]:
             return values ## Already eliminated
         values[s_index] = values[s_index].replace(digit, '')
+        self.propagations += 1
         ## (1) If a square s_index is reduced to one value, then eliminate sec_digit from the peers.
         if len(values[s_index]) == 0:
             return False ## Contradiction: removed last value
@@ -143,13 +167,195 @@ class PeterNorvig(Algorithm):
                 return False
         return values
 
+    def parse_grid_bits(self, grid_basic_format):
+        """Convert grid to a list of 81 candidate masks, or return False if a contradiction
+        is detected. It is the bitset engine counterpart of parse_grid.
+        Keyword arguments:
+            grid_basic_format -- A long string with 81 characters where zeros that represent empty cells,
+            or a Puzzle whose cell values are used as they are.
+        Returned parameter:
+            cells -- list of 81 integers where each bit set is a possible digit (e.g. [0b1, 0x1FF, ..])
+        """
+        cells = [ALL_CANDIDATES] * len(PEER_INDICES)
+        for index, value in enumerate(cell_values(grid_basic_format)):
+            if value and (value > 9 or not self.assign_bits(cells, index, DIGIT_BITS[value - 1])):
+                return False ## (Fail if we can't assign the digit to the cell.)
+        return cells
+
+    def search_bits(self, cells):
+        """Using depth-first search and propagation over candidate masks, return the first
+        solution found by iter_search_bits.
+        Keyword arguments:
+            cells -- list of 81 candidate masks, or False if a contradiction was found earlier
+        Returned parameter:
+            cells -- list of 81 single-bit masks when solved, otherwise False
+        """
+        for solution in self.iter_search_bits(cells):
+            return solution
+        return False
+
+    def iter_search_bits(self, cells):
+        """Using depth-first search and propagation over candidate masks, yield every solution.
+        The search is not recursive: it keeps one mutable list of masks, a trail (undo log) of
+        the (index, previous mask) pairs changed by propagation and a stack of branch points,
+        so backtracking only rolls back the cells that changed since the branch was taken.
+        Solutions are produced lazily, the search only goes on when the next one is requested.
+        Keyword arguments:
+            cells -- list of 81 candidate masks, or False if a contradiction was found earlier
+        Yielded parameter:
+            solution -- a copy of the list of 81 single-bit masks of each solution
+        """
+        if cells is False:
+            return ## Failed earlier
+        index = self.select_cell_bits(cells)
+        if index is None:
+            yield cells[:] ## Solved!
+            return
+        trail = []
+        branches = [[index, cells[index], 0]]
+        while branches:
+            branch = branches[-1]
+            self.undo_bits(cells, trail, branch[2])
+            if not branch[1]:
+                branches.pop() ## Every digit was tried, go back to the previous branch point
+                continue
+            self.count_node(len(branches))
+            self.guesses += 1
+            bit = LOWEST_BIT[branch[1]]
+            branch[1] ^= bit
+            if not self.assign_bits(cells, branch[0], bit, trail):
+                self.backtracks += 1
+                continue
+            index = self.select_cell_bits(cells)
+            if index is None:
+                yield cells[:] ## Solved!
+                continue
+            branches.append([index, cells[index], len(trail)])
+
+    def iter_solutions(self, grid_basic_format):
+        """Overrides the iter_solutions superclass method using the bitset engine.
+        Keyword arguments:
+            grid_basic_format -- A long string with 81 characters where zeros that represent empty cells
+        Yielded parameter:
+            solution -- a string of 81 characters for each solution of the puzzle
+        """
+        self.start_search(grid_basic_format)
+        for cells in self.iter_search_bits(self.parse_grid_bits(grid_basic_format)):
+            yield ''.join(BIT_CHARS[mask] for mask in cells)
+
+    def select_cell_bits(self, cells):
+        """Chose the unfilled cell with the fewest possibilities, the lowest index wins the ties.
+        Keyword arguments:
+            cells -- list of 81 candidate masks
+        Returned parameter:
+            best_index -- position of the cell from 0 to 80, or None when every cell is filled
+        """
+        best_index, best_count = None, 10
+        for index, mask in enumerate(cells):
+            count = BIT_COUNT[mask]
+            if 1 < count < best_count:
+                best_index, best_count = index, count
+                if count == 2:
+                    break
+        return best_index
+
+    def undo_bits(self, cells, trail, mark):
+        """Restore the masks recorded in the trail after the mark position.
+        Keyword arguments:
+            cells -- list of 81 candidate masks
+            trail -- list of (index, previous mask) pairs
+            mark -- length of the trail that should be kept
+        """
+        while len(trail) > mark:
+            index, mask = trail.pop()
+            cells[index] = mask
+
+    def assign_bits(self, cells, index, bit, trail=None):
+        """Eliminate all the other candidates (except bit) from cells[index] and propagate.
+        Return cells, except return False if a contradiction is detected.
+        Keyword arguments:
+            cells -- list of 81 candidate masks
+            index -- position of the cell from 0 to 80
+            bit -- single-bit mask of the digit to assign (e.g. 0b10000000 for '8')
+            trail -- optional list where the changed (index, previous mask) pairs are recorded
+        """
+        pending = [(index, second_bit) for second_bit in MASK_BITS[cells[index] & ~bit]]
+        return self.propagate_bits(cells, pending, trail)
+
+    def eliminate_bits(self, cells, index, bit, trail=None):
+        """Eliminate bit from cells[index] and propagate.
+        Return cells, except return False if a contradiction is detected.
+        Keyword arguments:
+            cells -- list of 81 candidate masks
+            index -- position of the cell from 0 to 80
+            bit -- single-bit mask of the digit to eliminate
+            trail -- optional list where the changed (index, previous mask) pairs are recorded
+        """
+        return self.propagate_bits(cells, [(index, bit)], trail)
+
+    def propagate_bits(self, cells, pending, trail=None):
+        """Process a worklist of (index, bit) eliminations; propagate when values or places <= 2.
+        Return cells, except return False if a contradiction is detected.
+        Keyword arguments:
+            cells -- list of 81 candidate masks
+            pending -- list of (index, bit) eliminations still to be done
+            trail -- optional list where the changed (index, previous mask) pairs are recorded
+        """
+        while pending:
+            index, bit = pending.pop()
+            mask = cells[index]
+            if not mask & bit:
+                continue ## Already eliminated
+            if trail is not None:
+                trail.append((index, mask))
+            mask ^= bit
+            cells[index] = mask
+            self.propagations += 1
+            ## (1) If a cell is reduced to one value, then eliminate it from the peers.
+            if mask == 0:
+                return False ## Contradiction: removed last value
+            elif BIT_COUNT[mask] == 1:
+                for peer in PEER_INDICES[index]:
+                    if cells[peer] & mask:
+                        pending.append((peer, mask))
+            ## (2) If a unit is reduced to only one place for the bit, then put it there.
+            for unit in UNIT_INDICES[index]:
+                places, place = 0, None
+                for second_index in unit:
+                    if cells[second_index] & bit:
+                        places += 1
+                        place = second_index
+                        if places > 1:
+                            break
+                if places == 0:
+                    return False ## Contradiction: no place for this value
+                elif places == 1:
+                    for second_bit in MASK_BITS[cells[place] & ~bit]:
+                        pending.append((place, second_bit))
+        return cells
+
+    def values_from_bits(self, cells):
+        """Convert a list of candidate masks into the dict format used by the string engine.
+        Keyword arguments:
+            cells -- list of 81 candidate masks, or False
+        Returned parameter:
+            values -- dict of possible values, {square: digits} (e.g. {'A1':'1', 'A2':'8', ..})
+        """
+        if cells is False:
+            return False
+        return dict((square, ''.join(BIT_CHARS[bit] for bit in MASK_BITS[mask]))\
+            for square, mask in zip(self.sudoku_grid.squares, cells))
+
     def retrieve_grid_basic_format(self):
         """
         Overrides the retrieve_grid_basic_format superclass method, for this algorithm is required
-            to convert the solution stored in a string of 81 integers
+            to convert the solution stored in a string of 81 integers, the puzzle is returned
+            unchanged when it could not be solved
         Returned parameters:
             outcome -- a string of 81 characters
         """
+        if self.grid_resolved is False:
+            return self.string_grid
         outcome = ""
         for row in self.sudoku_grid.rows:
             outcome += ''.join(self.grid_resolved[row+char]+('' if char in '36' else '')\
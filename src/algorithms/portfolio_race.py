@@ -0,0 +1,123 @@
+"""
+This module is going to race several algorithms on the same sudoku grid, each one in its own
+process, the first algorithm that finishes its search gives the result and the others are stopped.
+Each algorithm has different worst cases, so the race is as slow as the fastest of them.
+"""
+import multiprocessing
+from timeit import default_timer
+from algorithm import Algorithm, SearchBudgetExceeded
+from algorithm import measured_search
+from peter_norvig import PeterNorvig
+from backtracking import Backtracking
+from brute_force import BruteForce
+from dancing_links import DancingLinks
+
+try:
+    from Queue import Empty
+except ImportError:
+    from queue import Empty
+
+def race_engine(engine_class, grid_basic_format, time_limit, max_nodes, results):
+    """ Solves the grid with one engine in a racing process and reports its outcome.
+    Keyword arguments:
+        engine_class -- Algorithm subclass that can be created without arguments.
+        grid_basic_format -- a long string with 81 digit characters.
+        time_limit, max_nodes -- search limits of the engine.
+        results -- queue where the (grid retrieved, SolveMetrics) tuple is put.
+    """
+    engine = engine_class()
+    engine.set_search_limits(time_limit, max_nodes)
+    engine.solve_sudoku(grid_basic_format)
+    results.put((engine.retrieve_grid_basic_format(), engine.metrics))
+
+class PortfolioRace(Algorithm):
+    """ Keyword arguments:
+        engines -- Algorithm subclasses raced on every puzzle.
+        grid_resolved -- the grid given by the first engine that finished, or the puzzle unchanged
+        when none of them finished.
+        winner -- name of the engine that gave the grid, None when none of them finished.
+    """
+    ENGINES = (PeterNorvig, Backtracking, BruteForce, DancingLinks)
+    POLL_INTERVAL = 0.5
+
+    def __init__(self, engines=ENGINES):
+        if not engines:
+            raise ValueError("Portfolio Race needs at least one engine")
+        self.engines = tuple(engines)
+        self.grid_resolved = None
+        self.winner = None
+
+    @measured_search
+    def solve_sudoku(self, grid_basic_format):
+        """
+        Overrides the solve_sudoku superclass method. The first engine that completes its search
+        wins, whether it found a solution or proved there is none, an engine stopped by its search
+        limits does not. The counters of the search are the ones of the winner.
+        Keyword arguments:
+            grid_basic_format -- a long string with 81 digit characters.
+        """
+        self.grid_resolved = str(grid_basic_format)
+        self.winner = None
+        if multiprocessing.current_process().daemon:
+            # Daemonic processes (e.g. the workers of a ParallelSolver pool) cannot start children.
+            engine = self.engines[0]()
+            engine.set_search_limits(self.time_limit, self.max_nodes)
+            engine.solve_sudoku(grid_basic_format)
+            self.finish_race(engine.retrieve_grid_basic_format(), engine.metrics)
+            return
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=race_engine, args=(engine_class,\
+            grid_basic_format, self.time_limit, self.max_nodes, results))\
+            for engine_class in self.engines]
+        for process in processes:
+            process.daemon = True
+            process.start()
+        try:
+            self.wait_for_winner(results, processes)
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+    def wait_for_winner(self, results, processes):
+        """
+        Takes the outcomes of the racing engines until one of them completed its search.
+        Keyword arguments:
+            results -- queue where the racing processes put their outcomes.
+            processes -- the racing processes.
+        """
+        pending = len(processes)
+        while pending:
+            timeout = self.POLL_INTERVAL
+            if self.deadline is not None:
+                timeout = min(timeout, self.deadline - default_timer())
+                if timeout <= 0:
+                    raise SearchBudgetExceeded("Time limit of %s sec exceeded" % (self.time_limit))
+            try:
+                grid, metrics = results.get(timeout=timeout)
+            except Empty:
+                if not any(process.is_alive() for process in processes) and results.empty():
+                    raise RuntimeError("The racing engines stopped without giving a result")
+                continue
+            pending -= 1
+            if not metrics.budget_exceeded:
+                self.finish_race(grid, metrics)
+                return
+        raise SearchBudgetExceeded("Every engine exceeded its search budget")
+
+    def finish_race(self, grid, metrics):
+        """ Keeps the grid and the search counters of the engine that won the race."""
+        if metrics.budget_exceeded:
+            raise SearchBudgetExceeded("Every engine exceeded its search budget")
+        self.grid_resolved = grid
+        self.winner = metrics.algorithm
+        self.adopt_search_counters(metrics)
+
+    def retrieve_grid_basic_format(self):
+        """
+        Overrides the retrieve_grid_basic_format superclass method.
+        Returned parameters:
+            outcome -- a string of 81 characters
+        """
+        return self.grid_resolved
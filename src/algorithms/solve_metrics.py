@@ -0,0 +1,81 @@
+"""
+This module holds the record of the measurements taken while an algorithm solves a puzzle, and the
+process-wide collector where every algorithm reports them, so they can be queried or dumped later.
+"""
+import json
+from collections import namedtuple, deque
+
+class SolveMetrics(namedtuple('SolveMetrics', ['algorithm', 'puzzle', 'elapsed_time', 'nodes',
+    'guesses', 'backtracks', 'propagations', 'max_depth', 'budget_exceeded'])):
+    """ Measurements of a single search:
+        algorithm -- name of the Algorithm subclass that performed the search
+        puzzle -- long string of 81 characters that was searched
+        elapsed_time -- seconds spent by the search
+        nodes -- search states visited (the ones bounded by max_nodes)
+        guesses -- tentative values tried at the branch points
+        backtracks -- guesses that led to a dead end
+        propagations -- constraint propagation steps (candidate eliminations or column covers)
+        max_depth -- deepest branch point reached
+        budget_exceeded -- True when the search was stopped by its deadline or node budget
+    """
+    __slots__ = ()
+
+COUNTERS = ('nodes', 'guesses', 'backtracks', 'propagations')
+
+class MetricsCollector(object):
+
+    def __init__(self, history=1000):
+        """
+        Initializes an empty collector.
+        Keyword arguments:
+            history -- number of the most recent SolveMetrics records kept for the queries.
+        """
+        self.records = deque(maxlen=history)
+        self.totals = {}
+
+    def record(self, metrics):
+        """
+        Adds the SolveMetrics of a search to the totals of its algorithm.
+        Keyword arguments:
+            metrics -- SolveMetrics record
+        """
+        self.records.append(metrics)
+        totals = self.totals.get(metrics.algorithm)
+        if totals is None:
+            totals = dict.fromkeys(COUNTERS + ('solves', 'budget_exceeded', 'max_depth'), 0)
+            totals.update(elapsed_time=0.0, max_elapsed_time=0.0)
+            self.totals[metrics.algorithm] = totals
+        totals['solves'] += 1
+        totals['elapsed_time'] += metrics.elapsed_time
+        totals['max_elapsed_time'] = max(totals['max_elapsed_time'], metrics.elapsed_time)
+        totals['max_depth'] = max(totals['max_depth'], metrics.max_depth)
+        totals['budget_exceeded'] += int(metrics.budget_exceeded)
+        for counter in COUNTERS:
+            totals[counter] += getattr(metrics, counter)
+
+    def summary(self):
+        """ Returns a dictionary with the totals of every algorithm, keyed by algorithm name."""
+        return dict((algorithm, dict(totals)) for algorithm, totals in self.totals.items())
+
+    def slowest(self, count=10):
+        """ Returns the SolveMetrics of the slowest searches among the most recent ones.
+        Keyword arguments:
+            count -- maximum number of records returned.
+        """
+        return sorted(self.records, key=lambda metrics: metrics.elapsed_time, reverse=True)[:count]
+
+    def dump(self, file_object):
+        """ Writes the summary and the most recent records as JSON.
+        Keyword arguments:
+            file_object -- file (or any object with a write method) where the JSON is written.
+        """
+        json.dump({"summary": self.summary(),
+                   "records": [metrics._asdict() for metrics in self.records]},\
+            file_object, indent=2, sort_keys=True)
+
+    def reset(self):
+        """ Removes every record and total."""
+        self.records.clear()
+        self.totals = {}
+
+collector = MetricsCollector()
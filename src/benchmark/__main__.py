@@ -0,0 +1,48 @@
+"""Entry point of the benchmark, run it from the Sudoku2015-C directory with:
+> python -m src.benchmark --output content/results/benchmark.json
+"""
+import argparse
+import json
+from ..settings import settings
+from ..algorithms.algorithm_registry import ALGORITHMS
+from .benchmark import generate_corpora, load_source_corpus, run_benchmark, build_report,\
+    write_report, format_results, compare_results
+
+def main(arguments=None):
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark",\
+        description="Measures the registered algorithms over seeded puzzle corpora.")
+    parser.add_argument("--seed", type=int, default=2015, help="seed of the generated corpora")
+    parser.add_argument("--puzzles", type=int, default=10, help="generated puzzles per tier")
+    parser.add_argument("--repetitions", type=int, default=3, help="measured solves per puzzle")
+    parser.add_argument("--warmups", type=int, default=1, help="unmeasured solves per puzzle")
+    parser.add_argument("--time-limit", type=float, default=10.0,\
+        help="seconds after which a solve is abandoned")
+    parser.add_argument("--algorithm", action="append", choices=list(ALGORITHMS.keys()),\
+        help="algorithm to measure, it can be repeated (all of them by default)")
+    parser.add_argument("--no-sources", action="store_true",\
+        help="skip the puzzles of content/sources")
+    parser.add_argument("--output", help="path of the JSON report")
+    parser.add_argument("--compare", help="path of a previous JSON report to compare with")
+    options = parser.parse_args(arguments)
+
+    settings.init()
+    corpora = generate_corpora(options.seed, options.puzzles)
+    if not options.no_sources:
+        corpora["sources"] = load_source_corpus()
+    results = run_benchmark(corpora, options.algorithm, options.repetitions, options.warmups,\
+        options.time_limit)
+    for line in format_results(results):
+        print line
+    if options.output:
+        parameters = {"seed": options.seed, "puzzles": options.puzzles,\
+            "repetitions": options.repetitions, "warmups": options.warmups,\
+            "time_limit": options.time_limit, "sources": not options.no_sources}
+        write_report(build_report(results, parameters), options.output)
+    if options.compare:
+        with open(options.compare) as json_file:
+            baseline = json.load(json_file)["results"]
+        for name, tier, previous, current, ratio in compare_results(baseline, results):
+            print "%-14s %-8s %9.2f ms -> %9.2f ms (x%.2f)" % (name, tier, previous * 1000,\
+                current * 1000, ratio)
+
+main()
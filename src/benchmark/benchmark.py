@@ -0,0 +1,179 @@
+"""
+This module is in charge of measuring the registered algorithms over fixed puzzle corpora, so the
+default algorithm of game_settings.xml can be chosen from evidence and performance regressions can
+be caught by comparing the JSON reports of two runs.
+The generated corpora only depend on the seed, and the source corpus is read from content/sources.
+"""
+import json
+import os
+import platform
+from collections import OrderedDict
+from ..algorithms.algorithm_registry import ALGORITHMS
+from ..game.sudoku_builder import SudokuBuilder
+from ..game.sudoku_grid import is_solution
+from ..handlers.txt_handler import TXTHandler
+from ..handlers.csv_handler import CSVHandler
+from ..settings import settings
+
+TIERS = OrderedDict((("easy", (36, 41)), ("medium", (30, 35)), ("hard", (24, 29))))
+
+def generate_corpora(seed, puzzles_per_tier):
+    """
+    Builds the same puzzles for the same seed, the visible numbers of each tier follow the
+    default levels of game_settings.xml. Every puzzle has a single solution.
+    Keyword arguments:
+        seed -- integer seed of the corpora.
+        puzzles_per_tier -- number of puzzles built for every tier.
+    Returned parameters:
+        corpora -- ordered dictionary of tier name -> list of long strings of 81 characters.
+    """
+    corpora = OrderedDict()
+    for tier_index, (tier, (minimum, maximum)) in enumerate(TIERS.items()):
+        builder = SudokuBuilder(minimum, seed=seed * len(TIERS) + tier_index)
+        puzzles = []
+        for _ in range(puzzles_per_tier):
+            builder.visible_numbers = builder.random.randint(minimum, maximum)
+            puzzles.append(builder.build_unique_grid())
+        corpora[tier] = puzzles
+    return corpora
+
+def load_source_corpus(input_source="content/sources"):
+    """
+    Reads every TXT and CSV puzzle below a directory, in path order.
+    Keyword arguments:
+        input_source -- directory path, relative paths start at the Sudoku2015-C directory.
+    Returned parameters:
+        puzzles -- list of long strings of 81 characters, every puzzle of the files holding many
+        of them is read and the malformed records are skipped.
+    """
+    directory = input_source if os.path.isabs(input_source) else \
+        os.path.join(settings.root_path, os.path.normpath(input_source))
+    paths = []
+    for root, _, file_names in os.walk(directory):
+        paths.extend(os.path.join(root, file_name) for file_name in file_names)
+    puzzles = []
+    for path in sorted(paths):
+        if path.endswith(".txt"):
+            handler = TXTHandler()
+        elif path.endswith(".csv"):
+            handler = CSVHandler()
+        else:
+            continue
+        puzzles.extend(string_grid for string_grid in handler.iter_puzzles(path, errors=[])\
+            if len(string_grid) == 81)
+    return puzzles
+
+def percentile(values, fraction):
+    """
+    Returns the nearest-rank percentile of a list of numbers.
+    Keyword arguments:
+        values -- non empty list of numbers.
+        fraction -- value from 0 to 1 (e.g. 0.95 for the 95th percentile).
+    """
+    ordered = sorted(values)
+    rank = max(int(-(-fraction * len(ordered) // 1)), 1)
+    return ordered[rank - 1]
+
+def summarize(values):
+    """ Returns the median, 95th percentile and maximum of a list of numbers."""
+    if not values:
+        return {"median": None, "p95": None, "max": None}
+    return {"median": percentile(values, 0.5), "p95": percentile(values, 0.95), "max": max(values)}
+
+def run_benchmark(corpora, algorithm_names=None, repetitions=3, warmups=1, time_limit=None):
+    """
+    Solves every puzzle of every corpus with every algorithm, the warmup solves are not measured.
+    Only the solves giving a solution of the puzzle are measured, a puzzle that times out or is
+    not solved is counted and its remaining solves are skipped.
+    Keyword arguments:
+        corpora -- ordered dictionary of tier name -> list of long strings of 81 characters.
+        algorithm_names -- names of the registered algorithms, all of them by default.
+        repetitions -- measured solves of every puzzle.
+        warmups -- solves of every puzzle before the measured ones.
+        time_limit -- optional seconds after which a solve is abandoned (counted as timed out).
+    Returned parameters:
+        results -- dictionary of algorithm name -> tier name -> statistics of the time (seconds)
+        and nodes per solved solve, and the number of puzzles, solved puzzles, timed out puzzles
+        and failed puzzles (unsolved, or a grid that is not a solution of the puzzle).
+    """
+    results = OrderedDict()
+    for name in algorithm_names or ALGORITHMS.keys():
+        algorithm = ALGORITHMS[name]()
+        algorithm.set_search_limits(time_limit)
+        results[name] = OrderedDict()
+        for tier, puzzles in corpora.items():
+            times, nodes, solved, timed_out, failed = [], [], 0, 0, 0
+            for puzzle in puzzles:
+                for _ in range(warmups):
+                    algorithm.solve_sudoku(puzzle)
+                status = "solved"
+                for _ in range(repetitions):
+                    algorithm.solve_sudoku(puzzle)
+                    if algorithm.metrics.budget_exceeded:
+                        status = "timed_out"
+                    elif not is_solution(puzzle, algorithm.retrieve_grid_basic_format()):
+                        status = "failed"
+                    else:
+                        times.append(algorithm.metrics.elapsed_time)
+                        nodes.append(algorithm.metrics.nodes)
+                        continue
+                    break
+                if status == "timed_out":
+                    timed_out += 1
+                elif status == "failed":
+                    failed += 1
+                else:
+                    solved += 1
+            results[name][tier] = {"puzzles": len(puzzles), "solved": solved,
+                                   "timed_out": timed_out, "failed": failed,
+                                   "time": summarize(times), "nodes": summarize(nodes)}
+    return results
+
+def build_report(results, parameters):
+    """ Returns the JSON-ready report of a benchmark run with its parameters and environment."""
+    return {"parameters": parameters, "python": platform.python_version(),
+            "platform": platform.platform(), "results": results}
+
+def write_report(report, output):
+    """
+    Writes a report as JSON with sorted keys, so two runs can be diffed line by line.
+    Keyword arguments:
+        report -- dictionary returned by build_report.
+        output -- path of the JSON file.
+    """
+    with open(output, "w") as json_file:
+        json.dump(report, json_file, indent=2, sort_keys=True)
+
+def format_results(results):
+    """ Returns the results as text lines with the median, p95 and max time (ms) and nodes."""
+    lines = ["%-14s %-8s %7s %9s %9s %9s %9s %9s" % ("algorithm", "tier", "solved",
+        "med ms", "p95 ms", "max ms", "med nodes", "max nodes")]
+    for name, tiers in results.items():
+        for tier, stats in tiers.items():
+            if stats["time"]["median"] is None:
+                continue
+            lines.append("%-14s %-8s %3d/%-3d %9.2f %9.2f %9.2f %9d %9d" % (name, tier,
+                stats["solved"], stats["puzzles"], stats["time"]["median"] * 1000,
+                stats["time"]["p95"] * 1000, stats["time"]["max"] * 1000,
+                stats["nodes"]["median"], stats["nodes"]["max"]))
+    return lines
+
+def compare_results(baseline, current):
+    """
+    Compares the median time of every algorithm and tier present in both results.
+    Keyword arguments:
+        baseline, current -- results dictionaries (the "results" entry of two reports).
+    Returned parameters:
+        rows -- list of (algorithm, tier, baseline median, current median, ratio) tuples, a ratio
+        greater than 1 means the current run is slower.
+    """
+    rows = []
+    for name, tiers in current.items():
+        for tier, stats in tiers.items():
+            previous = baseline.get(name, {}).get(tier)
+            if previous is None or not previous["time"]["median"] or \
+                stats["time"]["median"] is None:
+                continue
+            rows.append((name, tier, previous["time"]["median"], stats["time"]["median"],
+                         stats["time"]["median"] / previous["time"]["median"]))
+    return rows
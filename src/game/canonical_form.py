@@ -0,0 +1,186 @@
+"""
+This module will be in charge of mapping a sudoku grid to a canonical representative under the
+transformations that keep a grid valid: digit relabeling, row permutations within a band, band
+permutations, column permutations within a stack, stack permutations and transposition.
+Two puzzles are equivalent when they have the same canonical form, so the solution of one of them
+can be mapped to the other through the GridTransform returned.
+
+The canonical form is the lexicographically smallest grid (zeros first) reachable with those
+transformations, where the digits are relabeled 1..9 in order of first appearance, among the ones
+whose first row has the smallest pattern of empty cells (always the case for valid grids). It is
+built row by row keeping only the partial transformations that produce the smallest rows so far,
+and merging the ones whose remaining rows look the same.
+"""
+import itertools
+from operator import itemgetter
+
+PERMUTATIONS = tuple(itertools.permutations(range(3)))
+EMPTY_DIGITS = (0,) * 10
+
+class GridTransform(object):
+    """ Transformation of a grid: the rows of the grid (transposed first when required) are
+    picked in the order given by rows, the columns in the order given by columns and every digit
+    is replaced by digits[digit] (zeros are kept).
+    Keyword arguments:
+        transposed -- True when rows and columns are swapped before the permutations
+        rows -- tuple of the 9 source rows in the order they are placed
+        columns -- tuple of the 9 source columns in the order they are placed
+        digits -- tuple of 10 values with the new value of every digit (digits[0] is 0)
+    """
+    def __init__(self, transposed, rows, columns, digits):
+        self.transposed = transposed
+        self.rows = tuple(rows)
+        self.columns = tuple(columns)
+        self.digits = tuple(digits)
+
+    def apply(self, string_grid):
+        """
+        Returns the transformed grid.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+        """
+        if self.transposed:
+            string_grid = ''.join(string_grid[column * 9 + row] for row in range(9) \
+                for column in range(9))
+        return ''.join(str(self.digits[int(string_grid[row * 9 + column])]) \
+            for row in self.rows for column in self.columns)
+
+    def invert(self):
+        """ Returns the GridTransform that maps a transformed grid back to the original grid."""
+        rows, columns, digits = [0] * 9, [0] * 9, [0] * 10
+        for position, row in enumerate(self.rows):
+            rows[row] = position
+        for position, column in enumerate(self.columns):
+            columns[column] = position
+        for digit, value in enumerate(self.digits):
+            digits[value] = digit
+        if self.transposed:
+            return GridTransform(True, columns, rows, digits)
+        return GridTransform(False, rows, columns, digits)
+
+def canonical_form(string_grid):
+    """
+    Computes the canonical representative of a grid.
+    Keyword arguments:
+        string_grid -- long string of 81 digit characters where zeros represent empty spots.
+    Returned parameters:
+        canonical_grid -- long string of 81 characters, the same for every equivalent grid.
+        transform -- GridTransform that maps string_grid (and its solutions) to canonical_grid.
+    """
+    if not (string_grid.isdigit() and len(string_grid) == 81):
+        raise ValueError('The grid should only contain 81 valid digits')
+    values = [int(char) for char in string_grid]
+    orientations = (values, [values[column * 9 + row] for row in range(9) for column in range(9)])
+    candidates = []
+    for transposed, grid in enumerate(orientations):
+        rows = [grid[row * 9:row * 9 + 9] for row in range(9)]
+        for row in range(9):
+            pattern, column_orders = first_row_orders(rows[row])
+            candidates.append((pattern, transposed, rows, row, column_orders))
+    best_pattern = min(candidate[0] for candidate in candidates)
+    best_row, states = None, []
+    for pattern, transposed, rows, row, column_orders in candidates:
+        if pattern != best_pattern:
+            continue
+        for columns in column_orders:
+            output, digits, next_label = relabel_row(rows[row], columns, EMPTY_DIGITS, 1)
+            if best_row is None or output < best_row:
+                best_row, states = output, []
+            if output == best_row:
+                states.append((transposed, rows, (row,), columns, digits, next_label))
+    canonical_rows = [best_row]
+    for _ in range(8):
+        states = merge_states(states)
+        best_row, next_states = None, []
+        for transposed, rows, used, columns, digits, next_label in states:
+            for row in candidate_rows(used):
+                output, new_digits, new_label = relabel_row(rows[row], columns, digits, next_label)
+                if best_row is None or output < best_row:
+                    best_row, next_states = output, []
+                if output == best_row:
+                    next_states.append((transposed, rows, used + (row,), columns, new_digits,\
+                        new_label))
+        canonical_rows.append(best_row)
+        states = next_states
+    transposed, rows, used, columns, digits, next_label = states[0]
+    digits = list(digits)
+    for digit in range(1, 10):
+        if not digits[digit]:
+            digits[digit] = next_label
+            next_label += 1
+    canonical_grid = ''.join(str(value) for output in canonical_rows for value in output)
+    return canonical_grid, GridTransform(bool(transposed), used, columns, digits)
+
+def first_row_orders(row):
+    """
+    Returns the smallest pattern of empty cells that a row can show once its columns are permuted
+    (zeros first) and the column orders that produce it.
+    Keyword arguments:
+        row -- list of the 9 integer values of a source row
+    """
+    zeros = [row[stack * 3:stack * 3 + 3].count(0) for stack in range(3)]
+    stack_orders = [stacks for stacks in PERMUTATIONS \
+        if zeros[stacks[0]] >= zeros[stacks[1]] >= zeros[stacks[2]]]
+    inner_orders = [[offsets for offsets in PERMUTATIONS \
+        if all(row[stack * 3 + offset] == 0 for offset in offsets[:zeros[stack]])] \
+        for stack in range(3)]
+    column_orders = [tuple(stack * 3 + offset for stack, offsets in zip(stacks, inner) \
+        for offset in offsets) for stacks in stack_orders \
+        for inner in itertools.product(*[inner_orders[stack] for stack in stacks])]
+    pattern = tuple(sorted((0,) * zeros[stack] + (1,) * (3 - zeros[stack]) for stack in range(3)))
+    return pattern, column_orders
+
+def relabel_row(row, columns, digits, next_label):
+    """
+    Reads a row in the column order given, assigning the next labels to the digits not seen yet.
+    Keyword arguments:
+        row -- list of the 9 integer values of a source row
+        columns -- tuple of the 9 source columns in the order they are placed
+        digits -- tuple of 10 labels already assigned (0 means not assigned yet)
+        next_label -- label for the next digit not seen yet
+    Returned parameters:
+        output, digits, next_label -- the relabeled row and the labels updated
+    """
+    output = []
+    for column in columns:
+        value = row[column]
+        if value and not digits[value]:
+            digits = digits[:value] + (next_label,) + digits[value + 1:]
+            next_label += 1
+        output.append(digits[value])
+    return tuple(output), digits, next_label
+
+def candidate_rows(used):
+    """ Returns the source rows that can be placed next: the rest of the current band, or any row
+    of a band not used yet when the current band is complete."""
+    if len(used) % 3:
+        band = used[-1] // 3
+        return [row for row in range(band * 3, band * 3 + 3) if row not in used]
+    used_bands = set(row // 3 for row in used)
+    return [row for row in range(9) if row // 3 not in used_bands]
+
+def merge_states(states):
+    """
+    Keeps a single partial transformation among the ones whose remaining rows are the same once
+    their columns are placed and their digits relabeled, since they produce the same rows next.
+    Keyword arguments:
+        states -- list of (transposed, rows, used, columns, digits, next_label) tuples
+    """
+    if len(states) < 2:
+        return states
+    merged, layouts = {}, {}
+    for state in states:
+        transposed, rows, used, columns, digits, next_label = state
+        if used not in layouts:
+            used_bands = set(row // 3 for row in used)
+            layouts[used] = (candidate_rows(used) if len(used) % 3 else [],\
+                [range(band * 3, band * 3 + 3) for band in range(3) if band not in used_bands])
+        current_band, bands = layouts[used]
+        labels = [digits[value] or 10 + value for value in range(10)]
+        pick = itemgetter(*columns)
+        placed = dict((row, tuple(map(labels.__getitem__, pick(rows[row])))) \
+            for row in range(9) if row not in used)
+        key = (next_label, tuple(sorted(placed[row] for row in current_band)),\
+            tuple(sorted(tuple(sorted(placed[row] for row in band)) for band in bands)))
+        merged.setdefault(key, state)
+    return list(merged.values())
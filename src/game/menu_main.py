@@ -4,6 +4,7 @@ from menu_base import MenuBase
 from menu_settings import MenuSettings
 from menu_solver import MenuSolver
 from sudoku_live_game import SudokuLiveGame
+from puzzle_pool import PuzzlePool
 from collections import OrderedDict
 import time
 
@@ -19,6 +20,7 @@ class MenuMain(MenuBase):
         self.menu_settings = None
         self.menu_solver = None
         self.sudoku_game = None
+        self.puzzle_pool = None
         self.main_menu_completed = False
         self.main_loop()
 
@@ -57,18 +59,31 @@ class MenuMain(MenuBase):
         Run certain actions according to the selected option chosed by the user.
         """
         self.menu_settings = MenuSettings()
+        self.update_puzzle_pool()
         self.main_menu_completed = True
         if self.current_response == "1":        
             self.menu_settings.show_current_configuration()
         elif self.current_response == "2":
             self.menu_settings.show_settings_menu()
         elif self.current_response == "3":
-            self.menu_solver = MenuSolver(self.menu_settings.retrieve_default_settings())
+            self.menu_solver = MenuSolver(self.menu_settings.retrieve_default_settings(),\
+                self.puzzle_pool)
         elif self.current_response == "4":
-            self.sudoku_game = SudokuLiveGame(self.menu_settings.retrieve_default_settings())
+            self.sudoku_game = SudokuLiveGame(self.menu_settings.retrieve_default_settings(),\
+                self.puzzle_pool)
         elif self.current_response == "5":
             self.main_menu_completed = False
 
+    def update_puzzle_pool(self):
+        """ Starts the pool of ready puzzles of every level the first time, later on the pool is
+        updated with the levels of the current settings."""
+        level_ranges = self.menu_settings.retrieve_level_ranges()
+        if self.puzzle_pool is None:
+            self.puzzle_pool = PuzzlePool(level_ranges)
+            self.puzzle_pool.start()
+        else:
+            self.puzzle_pool.set_levels(level_ranges)
+
     def main_loop(self):
         """ Create a loop where the main menu can be displayed again if the user desires so.
         And also provides a friendly way to exit the program
@@ -78,6 +93,8 @@ class MenuMain(MenuBase):
             self.continue_main_menu = self.handle_main_loop_according_response()
             if self.continue_main_menu is False:
                 break
+        if self.puzzle_pool is not None:
+            self.puzzle_pool.stop()
 
     def handle_main_loop_according_response(self):
         """ When a certain action menu is completed the user can run again the main menu module
@@ -2,6 +2,7 @@
 from menu_base import MenuBase
 from ..handlers.file_handler import FileHandler
 from ..handlers.xml_handler import XMLHandler
+from collections import OrderedDict
 import time
 
 class MenuSettings(MenuBase):
@@ -171,6 +172,14 @@ class MenuSettings(MenuBase):
         }
         return default_settings
 
+    def retrieve_level_ranges(self):
+        """ Provides a dictionary of level name -> (min, max) visible numbers of every level."""
+        level_ranges = OrderedDict()
+        for level in self.xml_file.retrieve_dict_options_per_tag('level').values():
+            level_ranges[level] = (int(self.xml_file.retrieve_text_node_value("level", level, "min")),\
+                int(self.xml_file.retrieve_text_node_value("level", level, "max")))
+        return level_ranges
+
     def define_menu_options(self, tag_name):
         """ Returns a dictionary of all xml tag with a attrib name
         Keyword arguments:
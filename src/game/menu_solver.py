@@ -3,10 +3,10 @@
 from menu_base import MenuBase
 from menu_file_explorer import MenuFileExplorer
 from ..game.sudoku_solver import SudokuSolver
-from ..algorithms.algorithm import Algorithm
-from ..algorithms.brute_force import BruteForce
-from ..algorithms.backtracking import Backtracking
-from ..algorithms.peter_norvig import PeterNorvig
+from ..game.solution_cache import SolutionCache
+from ..game.solution_store import SolutionStore
+from ..algorithms.algorithm_registry import create_algorithm
+from ..algorithms.algorithm import SOLVED, INVALID, BUDGET_EXCEEDED
 from collections import OrderedDict
 import time
 import random
@@ -14,12 +14,14 @@ import sys
 
 
 class MenuSolver(MenuBase):
-    def __init__(self, default_settings):
+    def __init__(self, default_settings, puzzle_pool=None):
         """ Initializes the control menu variables and starts the loop
         Note: This subclass is going to inherit useful and generic methods of MenuBase superclass
         Keyword arguments:
             default_settings : This is a dictionary provided by XMLHandler with the current
             default game settings
+            puzzle_pool : optional PuzzlePool with ready puzzles of every level, the random
+            puzzles are generated on the spot without it
         """
         super(MenuSolver, self).__init__()
         self.options = None
@@ -28,12 +30,13 @@ class MenuSolver(MenuBase):
         self.solver_menu_completed = False
         self.file_explorer = None
         self.default_settings = default_settings
+        self.puzzle_pool = puzzle_pool
         self.algorithm = None
         self.level = None
         self.min_digit = None
         self.max_digit = None
         self.starting_digits = None
-        self.sudoku_solver = SudokuSolver()
+        self.sudoku_solver = SudokuSolver(cache=SolutionCache(), store=SolutionStore())
         self.solver_loop()
 
     def show_solver_menu(self):
@@ -126,12 +129,17 @@ class MenuSolver(MenuBase):
         """
         self.set_game_settings()
         print("1. Using '%s' default algorithm to solve Sudoku Puzzle" %(self.algorithm))
-        class_name = self.default_settings['algorithm'].translate(None, ' ') + '()'
-        getattr(self.sudoku_solver, 'change_algorithm')(eval(class_name))
+        self.sudoku_solver.change_algorithm(create_algorithm(self.default_settings['algorithm']))
         if mode == 'random':
             print("2. Using the '%s' default level to solve the Sudoku Puzzle " %(self.level))
-            print("3. Using '%s' starting digits to create the Puzzle\n " %(self.starting_digits))
-            self.sudoku_solver.solve_sudoku_from_grid_generated(self.starting_digits)
+            if self.puzzle_pool is not None:
+                print("3. Using a ready Puzzle of the '%s' level\n " %(self.level))
+                self.sudoku_solver.solve_sudoku_from_puzzle_pool(self.puzzle_pool, self.level,\
+                    resolve=True)
+            else:
+                print("3. Using '%s' starting digits to create the Puzzle\n " %(self.starting_digits))
+                self.sudoku_solver.solve_sudoku_from_grid_generated(self.starting_digits,\
+                    resolve=True, level=self.level)
             self.display_sudoku_puzzle_results("2D_point")
         elif mode == 'cmd':
             self.sudoku_solver.solve_sudoku_from_string_provided(self.current_response)
@@ -150,8 +158,24 @@ class MenuSolver(MenuBase):
         Keyword arguments:
             format_type -- initially can take the simple, 2D and 2D_point format types.
         """
+        metrics = self.sudoku_solver.last_metrics
+        status = self.sudoku_solver.solution_status(self.sudoku_solver.string_grid_resolved,\
+            self.sudoku_solver.string_grid)
+        if status == INVALID:
+            print("Sudoku Puzzle is not valid, it was not solved")
+            return
         print (self.sudoku_solver.display_grid_source_with_format(format_type))
         print (self.sudoku_solver.display_grid_result_with_format(format_type))
+        if status == SOLVED and metrics is None:
+            print("Sudoku Puzzle solution was found among the stored solutions")
+        elif status == SOLVED:
+            print("Sudoku Puzzle was solved in:  %2.4f sec (%d nodes, %d backtracks)" \
+                %(metrics.elapsed_time, metrics.nodes, metrics.backtracks))
+        elif status == BUDGET_EXCEEDED:
+            print("Sudoku Puzzle search was stopped after:  %2.4f sec (%d nodes), the search "\
+                "budget was exceeded" %(metrics.elapsed_time, metrics.nodes))
+        else:
+            print("Sudoku Puzzle has no solution")
 
     def set_game_settings(self):
         """The contructor parameter default settings is accessed to extract the game settings"""
@@ -0,0 +1,77 @@
+""" This module will be in charge of spreading the resolution of a batch of puzzles across
+several processes, every worker process reuses one SudokuSolver with its own algorithm instance.
+"""
+import multiprocessing
+from sudoku_solver import SudokuSolver
+from solution_store import SolutionStore
+from ..algorithms.peter_norvig import PeterNorvig
+
+worker_solver = None
+
+def initialize_worker(algorithm_class, store_path=None, time_limit=None, max_nodes=None):
+    """ Creates the SudokuSolver that a worker process will use for every puzzle it receives.
+    Keyword arguments:
+        algorithm_class -- Algorithm subclass that will be instantiated in the worker process.
+        store_path -- optional path of the SolutionStore shared by the worker processes.
+        time_limit, max_nodes -- optional search limits of every puzzle solved by the worker.
+    """
+    global worker_solver
+    store = SolutionStore(store_path) if store_path is not None else None
+    worker_solver = SudokuSolver(algorithm_class(), store=store)
+    worker_solver.algorithm.set_search_limits(time_limit, max_nodes)
+
+def solve_in_worker(string_grid):
+    """ Solves a puzzle in a worker process and returns its SolveResult record.
+    Keyword arguments:
+        string_grid -- long string of 81 characters where zeros represent empty spots, or a Puzzle.
+    """
+    if isinstance(string_grid, basestring):
+        string_grid = string_grid.strip()
+    return worker_solver.solve_string_grid(string_grid)
+
+class ParallelSolver(object):
+
+    def __init__(self, algorithm_class=PeterNorvig, workers=None, chunk_size=64,\
+        store_path=None, time_limit=None, max_nodes=None):
+        """
+        Initializes the parameters of the process pool.
+        Keyword arguments:
+            algorithm_class -- Algorithm subclass used to solve the puzzles (e.g. PeterNorvig)
+            workers -- number of worker processes, by default one per CPU core.
+            chunk_size -- number of puzzles sent to a worker process at once.
+            store_path -- optional path of a SolutionStore read and written by every worker.
+            time_limit -- optional seconds after which the search of a puzzle is abandoned.
+            max_nodes -- optional number of nodes after which the search of a puzzle is abandoned.
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size should be greater than zero')
+        self.algorithm_class = algorithm_class
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+        self.store_path = store_path
+        self.time_limit = time_limit
+        self.max_nodes = max_nodes
+
+    def solve_many(self, grids, ordered=True):
+        """
+        Solves a stream of puzzles in the process pool, the results are produced lazily.
+        Keyword arguments:
+            grids -- iterable of long strings of 81 characters where zeros represent empty spots.
+            ordered -- True to yield the results in the input order, False to yield them as
+            soon as they are completed (every record keeps its puzzle to match it).
+        Yielded parameters:
+            result -- SolveResult record with the puzzle, solution, status and elapsed time.
+        """
+        pool = multiprocessing.Pool(self.workers, initialize_worker,\
+            (self.algorithm_class, self.store_path, self.time_limit, self.max_nodes))
+        try:
+            if ordered:
+                results = pool.imap(solve_in_worker, grids, self.chunk_size)
+            else:
+                results = pool.imap_unordered(solve_in_worker, grids, self.chunk_size)
+            for result in results:
+                yield result
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
@@ -0,0 +1,105 @@
+"""
+This module holds the Puzzle value type, a compact form of a puzzle that the handlers, the
+algorithms and the SudokuSolver accept in place of the long string of N x N characters: the cells
+are kept in a bytearray where 0 is an empty cell and 1 to N stand for the symbols 1 to 9 and A to P,
+so the algorithms read the cell values directly instead of parsing characters. The boards up to
+9x9 can also be packed in 4 bits per cell (41 bytes for a 9x9 puzzle) to hold large batches.
+"""
+import string
+from sudoku_grid import SYMBOLS, BOARD_SIZES
+
+VALUE_TABLE = string.maketrans('0.' + SYMBOLS, '\x00\x00' +\
+    ''.join(chr(value) for value in range(1, len(SYMBOLS) + 1)))
+OTHER_CHARS = ''.join(chr(code) for code in range(256) if chr(code) not in '0.' + SYMBOLS)
+SYMBOL_TABLE = string.maketrans(''.join(chr(value) for value in range(len(SYMBOLS) + 1)),\
+    '0' + SYMBOLS)
+
+def cell_values(grid):
+    """
+    Returns the cell values of a puzzle, the Puzzle instances are read without any conversion.
+    Keyword arguments:
+        grid -- Puzzle, or long string of N x N symbols where zeros (or points) represent empty
+        spots, the other characters (e.g. line breaks) are skipped.
+    Returned parameters:
+        cells -- bytearray of N x N integers, 0 for the empty cells (e.g. bytearray(b'\\x00\\x00\\x03..'))
+    """
+    if isinstance(grid, Puzzle):
+        return grid.cells
+    return bytearray(str(grid).translate(VALUE_TABLE, OTHER_CHARS))
+
+class Puzzle(object):
+    """ Keyword arguments:
+        cells -- bytearray of N x N values, 0 for the empty cells and 1 to N for the symbols.
+        size -- side of the board, one of BOARD_SIZES.
+        A Puzzle is mutable like its bytearray, so it is not hashable, str(puzzle) gives the long
+        string used as key by the caches and stores.
+    """
+    __slots__ = ('size', 'cells')
+    __hash__ = None
+
+    def __init__(self, cells, size=None):
+        self.cells = bytearray(cells)
+        self.size = size or int(round(len(self.cells) ** 0.5))
+        if self.size not in BOARD_SIZES or self.size * self.size != len(self.cells):
+            raise ValueError("A puzzle needs N x N cells with N in %s" % (BOARD_SIZES,))
+
+    @classmethod
+    def from_string(cls, string_grid):
+        """
+        Builds a Puzzle from a long string of N x N symbols where zeros (or points) represent empty
+        spots, the other characters (e.g. line breaks) are skipped.
+        """
+        return cls(cell_values(string_grid))
+
+    @classmethod
+    def from_packed(cls, data, size=9):
+        """
+        Builds a Puzzle from its 4-bit packed form.
+        Keyword arguments:
+            data -- string of bytes returned by packed.
+            size -- side of the board, 4 or 9.
+        """
+        cells = bytearray()
+        for byte in bytearray(data):
+            cells.append(byte >> 4)
+            cells.append(byte & 0x0F)
+        return cls(cells[:size * size], size)
+
+    def packed(self):
+        """
+        Returns the cells packed in 4 bits each, two cells per byte (the first one in the high
+        bits), only the boards up to 9x9 fit in 4 bits.
+        """
+        if self.size > 9:
+            raise ValueError("Only the boards up to 9x9 can be packed in 4 bits per cell")
+        cells = self.cells + bytearray(len(self.cells) % 2)
+        return str(bytearray((cells[index] << 4) | cells[index + 1]\
+            for index in range(0, len(cells), 2)))
+
+    def clues(self):
+        """ Returns the number of filled cells."""
+        return len(self.cells) - self.cells.count('\x00')
+
+    def __str__(self):
+        return str(self.cells).translate(SYMBOL_TABLE)
+
+    def __repr__(self):
+        return "Puzzle(%r)" % (str(self))
+
+    def __len__(self):
+        return len(self.cells)
+
+    def __getitem__(self, index):
+        return self.cells[index]
+
+    def __iter__(self):
+        return iter(self.cells)
+
+    def __eq__(self, other):
+        return isinstance(other, Puzzle) and self.cells == other.cells
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return (Puzzle, (str(self.cells), self.size))
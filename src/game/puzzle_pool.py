@@ -0,0 +1,212 @@
+"""
+This module will be in charge of keeping a pool of ready puzzles, with their solutions, for every
+level of the game settings. A background thread tops the pools up and the pools are kept on disk
+between runs, so a new game does not wait for a puzzle to be generated and solved.
+"""
+import json
+import os
+import random
+import sys
+import threading
+from collections import OrderedDict
+from sudoku_builder import SudokuBuilder
+from ..settings import settings
+
+class PuzzlePool(object):
+
+    def __init__(self, levels, input_source="content/results/puzzle_pool.json", capacity=5,\
+        time_limit=2.0, seed=None, max_misses=3):
+        """
+        Initializes the pools of the levels with the puzzles saved by a previous run, the
+        background thread is started by the start method.
+        Keyword arguments:
+            levels -- dictionary of level name -> (min, max) visible numbers of its puzzles.
+            input_source -- path of the JSON file of the pools, relative paths start at the
+            Sudoku2015-C directory.
+            capacity -- puzzles kept ready for every level.
+            time_limit -- seconds given to the builder to remove the clues of a puzzle, the
+            levels named after a difficulty (e.g. "Medium") are graded within them.
+            seed -- optional seed of the random generator used to build the puzzles.
+            max_misses -- puzzles built in a row out of the visible numbers range of a level
+            before the level is no longer refilled (e.g. a range the builder can not reach).
+        """
+        if capacity < 1:
+            raise ValueError('The capacity of the pool should be greater than zero')
+        if os.path.isabs(input_source):
+            self.json_absolute_file_path = input_source
+        else:
+            self.json_absolute_file_path = os.path.join(settings.root_path,\
+                os.path.normpath(input_source))
+        self.capacity = capacity
+        self.time_limit = time_limit
+        self.max_misses = max_misses
+        self.misses = {}
+        self.random = random.Random(seed)
+        self.condition = threading.Condition()
+        self.worker = None
+        self.stopping = False
+        self.levels = OrderedDict()
+        self.pools = OrderedDict()
+        self.load()
+        self.set_levels(levels)
+
+    def set_levels(self, levels):
+        """
+        Replaces the levels of the pool (e.g. after the settings were modified), the puzzles of
+        the removed levels and the ones out of the new visible numbers range are dropped, and
+        every level is refilled again.
+        Keyword arguments:
+            levels -- dictionary of level name -> (min, max) visible numbers of its puzzles.
+        """
+        with self.condition:
+            self.levels = OrderedDict((name, (int(minimum), int(maximum)))\
+                for name, (minimum, maximum) in levels.items())
+            self.pools = OrderedDict((name, [entry for entry in self.pools.get(name, [])\
+                if self.fits_level(name, entry[0])]) for name in self.levels)
+            self.misses = dict((name, 0) for name in self.levels)
+            self.condition.notify()
+
+    def fits_level(self, level, puzzle):
+        """ Returns True when the visible numbers of a puzzle are in the range of the level."""
+        minimum, maximum = self.levels[level]
+        return minimum <= len(puzzle) - puzzle.count('0') <= maximum
+
+    def pop(self, level):
+        """
+        Takes a ready puzzle of a level, a puzzle is generated on the spot when the pool of the
+        level is empty, and the background thread is woken up to top it up again. The puzzle
+        generated on the spot for a level no longer refilled is the closest one to its range the
+        builder could reach.
+        Keyword arguments:
+            level -- name of the level (e.g. "Easy").
+        Returned parameters:
+            (puzzle, solution) -- long strings of 81 characters, zeros represent the empty spots
+            of the puzzle.
+        """
+        with self.condition:
+            if level not in self.levels:
+                raise ValueError("Unknown level: %s" % (level))
+            if self.pools[level]:
+                entry = self.pools[level].pop(0)
+                self.save()
+                self.condition.notify()
+                return tuple(entry)
+            minimum, maximum = self.levels[level]
+            self.condition.notify()
+        return self.generate_puzzle(level, minimum, maximum)
+
+    def refill(self):
+        """ Tops up the pools of every level without the background thread."""
+        while self.fill_next():
+            pass
+
+    def fill_next(self):
+        """
+        Adds a puzzle to the first level whose pool is not full, a puzzle out of the range of the
+        level counts as a miss of the level.
+        Returned parameters:
+            True when a level needed a puzzle, False when every pool is full or no longer refilled.
+        """
+        with self.condition:
+            level = self.next_level()
+            if level is None:
+                return False
+            minimum, maximum = self.levels[level]
+        entry = self.generate_puzzle(level, minimum, maximum)
+        with self.condition:
+            if level not in self.levels:
+                return True
+            if not self.fits_level(level, entry[0]):
+                self.misses[level] += 1
+            elif len(self.pools[level]) < self.capacity:
+                self.misses[level] = 0
+                self.pools[level].append(list(entry))
+                self.save()
+        return True
+
+    def next_level(self):
+        """ Returns the first level whose pool is not full and still refilled, or None."""
+        for level, pool in self.pools.items():
+            if len(pool) < self.capacity and self.misses[level] < self.max_misses:
+                return level
+        return None
+
+    def generate_puzzle(self, level, minimum, maximum):
+        """
+        Builds a puzzle of a level along with its solution, see SudokuBuilder.build_level_puzzle.
+        Keyword arguments:
+            level -- name of the level (e.g. "Easy").
+            minimum, maximum -- range of the visible numbers of the puzzle.
+        Returned parameters:
+            (puzzle, solution) -- long strings of 81 characters.
+        """
+        with self.condition:
+            visible_numbers = self.random.randint(minimum, maximum)
+            seed = self.random.randint(0, sys.maxint)
+        return SudokuBuilder(visible_numbers, seed=seed).build_level_puzzle(level, self.time_limit)
+
+    def start(self):
+        """ Starts the background thread that keeps the pools topped up."""
+        with self.condition:
+            if self.worker is not None:
+                return
+            self.stopping = False
+            self.worker = threading.Thread(target=self.run_worker, name="PuzzlePool")
+            self.worker.daemon = True
+        self.worker.start()
+
+    def run_worker(self):
+        """ Loop of the background thread, it sleeps while every pool is full or no longer
+        refilled."""
+        while True:
+            with self.condition:
+                while not self.stopping and self.next_level() is None:
+                    self.condition.wait()
+                if self.stopping:
+                    return
+            self.fill_next()
+
+    def stop(self, timeout=None):
+        """
+        Stops the background thread once the puzzle in progress is built.
+        Keyword arguments:
+            timeout -- optional seconds to wait for the thread.
+        """
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+            worker = self.worker
+            self.worker = None
+        if worker is not None:
+            worker.join(timeout)
+
+    def __len__(self):
+        with self.condition:
+            return sum(len(pool) for pool in self.pools.values())
+
+    def size(self, level):
+        """ Returns the number of ready puzzles of a level."""
+        with self.condition:
+            return len(self.pools.get(level, []))
+
+    def load(self):
+        """ Reads the pools saved on disk, a missing or damaged file leaves the pools empty."""
+        try:
+            with open(self.json_absolute_file_path) as json_file:
+                saved_pools = json.load(json_file)
+        except (IOError, ValueError):
+            return
+        for level, entries in saved_pools.items():
+            self.pools[str(level)] = [[str(puzzle), str(solution)]\
+                for puzzle, solution in entries]
+
+    def save(self):
+        """ Writes the pools on disk, the file is replaced at once so a run that is stopped while
+        writing keeps the previous pools."""
+        directory = os.path.dirname(self.json_absolute_file_path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        temporary_path = self.json_absolute_file_path + ".tmp"
+        with open(temporary_path, "w") as json_file:
+            json.dump(self.pools, json_file, indent=1)
+        os.rename(temporary_path, self.json_absolute_file_path)
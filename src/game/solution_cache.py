@@ -0,0 +1,106 @@
+""" This module will be in charge of keeping the most recently used puzzle solutions in memory,
+so a puzzle that is solved again and again only runs the algorithm the first time.
+"""
+import sys
+from collections import OrderedDict
+from canonical_form import canonical_form
+
+class SolutionCache(object):
+
+    def __init__(self, capacity=1024, max_bytes=None, canonical=False):
+        """
+        Initializes an empty least recently used (LRU) cache.
+        Keyword arguments:
+            capacity -- maximum number of puzzles stored, the least recently used is evicted first.
+            max_bytes -- optional limit of the memory used by the stored puzzles and solutions.
+            canonical -- True to key the puzzles by their canonical form, so every puzzle
+            equivalent under the sudoku symmetries shares the same entry. Computing the canonical
+            form is slower than solving with PeterNorvig, it pays off with the slower algorithms.
+        """
+        if capacity < 1:
+            raise ValueError('The cache capacity should be greater than zero')
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.canonical = canonical
+        self.last_canonical = (None, None, None)
+        self.entries = OrderedDict()
+        self.current_bytes = 0
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, string_grid):
+        return self.entry_key(string_grid)[0] in self.entries
+
+    def get(self, string_grid):
+        """
+        Returns the solution stored for a puzzle and marks it as the most recently used.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+        Returned parameters:
+            solution -- long string of 81 characters, or None when the puzzle is not stored.
+        """
+        key, transform = self.entry_key(string_grid)
+        solution = self.entries.pop(key, None)
+        if solution is None:
+            self.misses += 1
+            return None
+        self.entries[key] = solution
+        self.hits += 1
+        if transform is not None:
+            return transform.invert().apply(solution)
+        return solution
+
+    def put(self, string_grid, solution):
+        """
+        Stores the solution of a puzzle as the most recently used, evicting the least recently
+        used puzzles while the capacity or the byte-size limit is exceeded.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+            solution -- long string of 81 characters.
+        """
+        key, transform = self.entry_key(string_grid)
+        if transform is not None:
+            solution = transform.apply(solution)
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= self.entry_size(key, previous)
+        size = self.entry_size(key, solution)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        self.entries[key] = solution
+        self.current_bytes += size
+        while len(self.entries) > self.capacity or \
+            (self.max_bytes is not None and self.current_bytes > self.max_bytes):
+            evicted_grid, evicted_solution = self.entries.popitem(last=False)
+            self.current_bytes -= self.entry_size(evicted_grid, evicted_solution)
+            self.evictions += 1
+
+    def entry_key(self, string_grid):
+        """
+        Returns the key under which a puzzle is stored and the GridTransform that maps the puzzle
+        to it (None when the puzzle itself is the key). The canonical form of the last puzzle is
+        kept, since a lookup that misses is usually followed by the storage of its solution.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+        """
+        if not self.canonical:
+            return string_grid, None
+        if self.last_canonical[0] != string_grid:
+            self.last_canonical = (string_grid,) + canonical_form(string_grid)
+        return self.last_canonical[1:]
+
+    def entry_size(self, string_grid, solution):
+        """ Returns the bytes used by a stored puzzle and its solution."""
+        return sys.getsizeof(string_grid) + sys.getsizeof(solution)
+
+    def clear(self):
+        """ Removes every stored puzzle, the counters are kept."""
+        self.entries.clear()
+        self.current_bytes = 0
+
+    def statistics(self):
+        """ Returns a dictionary with the size, hits, misses and evictions of the cache."""
+        return {"size": len(self.entries), "bytes": self.current_bytes, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions}
@@ -0,0 +1,93 @@
+"""
+This module will be in charge of keeping the puzzle solutions on disk in a sqlite3 database, so the
+solutions survive between runs and can be shared by several processes solving at the same time.
+"""
+import os
+import sqlite3
+import time
+from ..settings import settings
+
+class SolutionStore(object):
+
+    def __init__(self, input_source="content/results/solutions.db", timeout=30.0):
+        """
+        Initializes the path of the database, the connection is opened the first time it is used.
+        Keyword arguments:
+            input_source -- path of the database file, relative paths start at the Sudoku2015-C
+            directory.
+            timeout -- seconds a process waits for the lock held by another process writing.
+        """
+        if os.path.isabs(input_source):
+            self.db_absolute_file_path = input_source
+        else:
+            self.db_absolute_file_path = os.path.join(settings.root_path,\
+                os.path.normpath(input_source))
+        self.timeout = timeout
+        self.connection = None
+        self.connection_pid = None
+
+    def connect(self):
+        """
+        Returns the connection of the current process. A process created after the store was used
+        (e.g. a worker of a pool) opens its own connection, since sqlite3 connections should not
+        be shared across processes. The write-ahead log lets readers run while a process writes.
+        """
+        if self.connection is None or self.connection_pid != os.getpid():
+            self.connection = sqlite3.connect(self.db_absolute_file_path, self.timeout)
+            self.connection.text_factory = str
+            self.connection_pid = os.getpid()
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            with self.connection:
+                self.connection.execute("CREATE TABLE IF NOT EXISTS solutions (" +\
+                    "puzzle TEXT PRIMARY KEY, solution TEXT NOT NULL, algorithm TEXT, " +\
+                    "elapsed_time REAL, stored_at REAL)")
+        return self.connection
+
+    def get(self, string_grid):
+        """
+        Returns the solution stored for a puzzle.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+        Returned parameters:
+            solution -- long string of 81 characters, or None when the puzzle is not stored.
+        """
+        row = self.connect().execute("SELECT solution FROM solutions WHERE puzzle = ?",\
+            (string_grid,)).fetchone()
+        return row[0] if row is not None else None
+
+    def get_record(self, string_grid):
+        """
+        Returns a dictionary with the solution, algorithm, elapsed time and storage time of a
+        puzzle, or None when the puzzle is not stored.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+        """
+        row = self.connect().execute("SELECT solution, algorithm, elapsed_time, stored_at " +\
+            "FROM solutions WHERE puzzle = ?", (string_grid,)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("solution", "algorithm", "elapsed_time", "stored_at"), row))
+
+    def put(self, string_grid, solution, algorithm=None, elapsed_time=None):
+        """
+        Stores the solution of a puzzle, a puzzle already stored (e.g. by another process) keeps
+        its first solution.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots.
+            solution -- long string of 81 characters.
+            algorithm -- name of the algorithm that solved the puzzle.
+            elapsed_time -- seconds spent by the algorithm.
+        """
+        connection = self.connect()
+        with connection:
+            connection.execute("INSERT OR IGNORE INTO solutions VALUES (?, ?, ?, ?, ?)",\
+                (string_grid, solution, algorithm, elapsed_time, time.time()))
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        """ Closes the connection of the current process."""
+        if self.connection is not None and self.connection_pid == os.getpid():
+            self.connection.close()
+        self.connection = None
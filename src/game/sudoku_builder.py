@@ -2,36 +2,319 @@
 provided by the SudokuGrid Module.
 """
 import random
+from collections import namedtuple
+from timeit import default_timer
 from sudoku_grid import SudokuGrid
+from ..algorithms.algorithm import SearchBudgetExceeded
+from ..algorithms.dancing_links import DancingLinks
+from ..algorithms.logic_rater import LogicRater, DIFFICULTIES
+
+GenerationStats = namedtuple('GenerationStats', ['attempts', 'checks', 'clues', 'elapsed_time',
+    'budget_exceeded'])
+GRADED_DIFFICULTIES = DIFFICULTIES[:-1]
 
 class SudokuBuilder(object):
 
-    def __init__(self, visible_numbers):
+    def __init__(self, visible_numbers, seed=None, size=9):
         """ Initializes a Grid without digits generated yet
         Keyword arguments:
         grid -- module that is able to build a dictionary of positions and values.
         visible_numbers -- quantity of numbers that will be filled in the puzzle, the rest
         of them will be zeros or empty spaces in UI/Command Line Interface
+        seed -- optional seed of the random generator, the same seed builds the same puzzles.
+        size -- side of the board, 9 or one of the other BOARD_SIZES of SudokuGrid (e.g. 16)
         """
-        self.grid = SudokuGrid()
+        self.grid = SudokuGrid(size)
         self.visible_numbers = visible_numbers
+        self.random = random.Random(seed)
+        self.restarts = 0
+        self.singletons, self.singleton_digits = 0, {}
+        self.stats = None
 
     def build_random_grid(self):
         """Build a random puzzle with N or more assignments. Restart on contradictions.
         Note the resulting puzzle is not guaranteed to be solvable, but empirically
-        about 99.8% of them are solvable. Some have multiple solutions.
+        about 99.8% of them are solvable. Some have multiple solutions, build_unique_grid
+        builds puzzles with a single solution.
+        The restarts of the last puzzle are kept in the restarts attribute.
+        Returned arguments:
+            A long string with N x N characters where zeros that represent empty cells
+        """
+        self.restarts = 0
+        return self.grid_string(self.propagate_random_grid())
+
+    def build_random_puzzle(self):
+        """Build a random puzzle like build_random_grid along with a solution, which is completed
+        by a single search from the candidates left by the propagation of the puzzle. The puzzles
+        without solution are discarded (they count as restarts), the puzzle can still have other
+        solutions.
+        Returned arguments:
+            (puzzle, solution) -- long strings with N x N characters, zeros represent the empty
+            cells of the puzzle.
+        """
+        self.restarts = 0
+        while True:
+            values = self.propagate_random_grid()
+            solution = self.search(values.copy())
+            if solution:
+                return self.grid_string(values), self.grid_string(solution)
+            self.restarts += 1
+
+    def propagate_random_grid(self):
+        """Assign random digits to the squares in random order, propagating every assignment,
+        until N or more squares have a single digit. The singletons are counted by eliminate as
+        the squares are reduced, so no square is rescanned after an assignment.
+        Returned arguments:
+            values -- dict of possible values, {square: digits} (e.g. {'A1':'12349', 'A2':'8', ..})
+        """
+        max_index = self.grid.size - 1
+        while True:
+            values = dict((square_pos, self.grid.digits) for square_pos in self.grid.squares)
+            self.singletons, self.singleton_digits = 0, {}
+            for square_pos in self.shuffled(self.grid.squares):
+                if not self.assign(values, square_pos, self.random.choice(values[square_pos])):
+                    break
+                if self.singletons >= self.visible_numbers and len(self.singleton_digits) >= max_index:
+                    return values
+            self.restarts += 1
+
+    def grid_string(self, values):
+        """Return a long string with N x N characters of the squares with a single digit, zeros
+        represent the other squares.
+        Keyword arguments:
+            values -- dict of possible values, {square: digits} (e.g. {'A1':'12349', 'A2':'8', ..})
+        """
+        return ''.join(values[square_pos] if len(values[square_pos]) == 1 else '0' for square_pos in self.grid.squares)
+
+    def search(self, values):
+        """Using depth-first search and propagation, try all possible values on the square with
+        the fewest candidates.
+        Keyword arguments:
+            values -- dict of possible values, {square: digits}, or False after a contradiction.
+        Returned arguments:
+            values with a single digit per square, or False when there is no solution.
+        """
+        if values is False:
+            return False
+        open_squares = [(len(values[square_pos]), square_pos) for square_pos in self.grid.squares\
+            if len(values[square_pos]) > 1]
+        if not open_squares:
+            return values
+        square_pos = min(open_squares)[1]
+        for digit in values[square_pos]:
+            result = self.search(self.assign(values.copy(), square_pos, digit))
+            if result:
+                return result
+        return False
+
+    def build_unique_grid(self, time_limit=None, max_attempts=10):
+        """Build a random puzzle with a single solution, see build_unique_puzzle.
+        Returned arguments:
+            A long string with N x N characters where zeros that represent empty cells
+        """
+        return self.build_unique_puzzle(time_limit, max_attempts)[0]
+
+    def build_unique_puzzle(self, time_limit=None, max_attempts=10):
+        """Build a random puzzle with a single solution by digging holes in a random solution grid.
+        The clues are removed in random order while the puzzle keeps a single solution, which is
+        checked by counting two solutions at most, down to the visible numbers. When an attempt
+        can not reach them, another solution grid is dug, and the puzzle with the fewest clues is
+        returned once the attempts or the time limit run out, so every puzzle is valid and the
+        time spent is bounded. The GenerationStats of the puzzle are kept in the stats attribute
+        (attempts, uniqueness checks, clues, elapsed_time and budget_exceeded).
+        Keyword arguments:
+            time_limit -- optional wall-clock seconds of the digging, the solution grid of the
+            first attempt is always built.
+            max_attempts -- solution grids dug before giving up on the visible numbers, one at
+            least.
+        Returned arguments:
+            (puzzle, solution) -- long strings with N x N characters, zeros represent the empty
+            cells of the puzzle.
+        """
+        if max_attempts < 1:
+            raise ValueError("At least one attempt is needed to build a puzzle")
+        start_time = default_timer()
+        deadline = start_time + time_limit if time_limit is not None else None
+        counter = DancingLinks()
+        best_puzzle, best_solution, checks, budget_exceeded = None, None, 0, False
+        for attempt in range(1, max_attempts + 1):
+            solution = self.build_solution_grid(counter)
+            puzzle = list(solution)
+            clues = len(puzzle)
+            for index in self.shuffled(range(len(puzzle))):
+                if clues <= self.visible_numbers:
+                    break
+                if deadline is not None:
+                    time_left = deadline - default_timer()
+                    if time_left <= 0:
+                        budget_exceeded = True
+                        break
+                    counter.set_search_limits(time_left)
+                puzzle[index] = '0'
+                checks += 1
+                try:
+                    unique = counter.count_solutions(''.join(puzzle), 2) == 1
+                except SearchBudgetExceeded:
+                    unique, budget_exceeded = False, True
+                if unique:
+                    clues -= 1
+                else:
+                    puzzle[index] = solution[index]
+                if budget_exceeded:
+                    break
+            if best_puzzle is None or clues < len(best_puzzle) - best_puzzle.count('0'):
+                best_puzzle, best_solution = ''.join(puzzle), solution
+            if clues <= self.visible_numbers or budget_exceeded:
+                break
+        self.stats = GenerationStats(attempt, checks, len(best_puzzle) - best_puzzle.count('0'),\
+            default_timer() - start_time, budget_exceeded)
+        return best_puzzle, best_solution
+
+    def build_solution_grid(self, solver=None):
+        """Build a random complete grid. A random first row is completed by DancingLinks and the
+        rows and columns are then shuffled inside their bands and stacks, and the bands and stacks
+        among themselves, which keeps every unit valid.
+        Keyword arguments:
+            solver -- DancingLinks instance reused to complete the first row.
+        Returned arguments:
+            A long string with N x N characters without zeros
+        """
+        size, box_size = self.grid.size, self.grid.box_size
+        solver = solver or DancingLinks()
+        solver.set_search_limits()
+        solver.solve_sudoku(''.join(self.shuffled(self.grid.digits)) + '0' * (size * size - size))
+        solution = solver.retrieve_grid_basic_format()
+        rows = self.shuffled_lines(size, box_size)
+        cols = self.shuffled_lines(size, box_size)
+        return ''.join(solution[row * size + col] for row in rows for col in cols)
+
+    def shuffled_lines(self, size, box_size):
+        """Return the indexes of the rows (or columns) of a board in a random order that keeps
+        every line inside a band of lines (e.g. rows 0 to 2 stay together).
+        Keyword arguments:
+            size -- side of the board (e.g. 9)
+            box_size -- side of a block (e.g. 3)
+        """
+        bands = self.shuffled(range(0, size, box_size))
+        return [band + line for band in bands for line in self.shuffled(range(box_size))]
+
+    def build_level_puzzle(self, level, time_limit=None):
+        """Build the puzzle of a level of the game settings. The levels named after a difficulty
+        of the LogicRater ("Easy", "Medium" or "Hard") are graded with it, the other ones (e.g.
+        "Custom") only have a single solution.
+        Keyword arguments:
+            level -- name of the level.
+            time_limit -- optional wall-clock seconds given to the builder.
+        Returned arguments:
+            (puzzle, solution) -- long strings with N x N characters, zeros represent the empty
+            cells of the puzzle.
+        """
+        if level in GRADED_DIFFICULTIES and self.grid.size == 9:
+            return self.build_graded_puzzle(level, time_limit)
+        return self.build_unique_puzzle(time_limit)
+
+    def build_graded_grid(self, difficulty, time_limit=None, max_attempts=50):
+        """Build a 9x9 puzzle graded with a difficulty of the LogicRater, see build_graded_puzzle.
         Returned arguments:
             A long string with 81 characters where zeros that represent empty cells
         """
-        max_index = 8
-        values = dict((square_pos, self.grid.digits) for square_pos in self.grid.squares)
-        for square_pos in self.shuffled(self.grid.squares):
-            if not self.assign(values, square_pos, random.choice(values[square_pos])):
+        return self.build_graded_puzzle(difficulty, time_limit, max_attempts)[0]
+
+    def build_graded_puzzle(self, difficulty, time_limit=None, max_attempts=50):
+        """Build a 9x9 puzzle graded with a difficulty of the LogicRater ("Easy", "Medium" or "Hard").
+        The clues of a random puzzle are completed from its solution until the techniques of the
+        difficulty resolve it, then clues are removed while they still do, down to the visible
+        numbers. Until the puzzle needs a technique of the difficulty, the removals after which
+        the easier techniques are no longer enough are preferred. Every removal is checked with
+        grading passes, so the puzzle has a single solution and needs no search. When no attempt
+        reaches the difficulty before the attempts or the time limit run out, the hardest attempt
+        is returned (rated with the highest difficulty, then with the fewest clues). The
+        GenerationStats of the puzzle are kept in the stats attribute, checks counts the removals
+        tried.
+        Keyword arguments:
+            difficulty -- "Easy", "Medium" or "Hard".
+            time_limit -- optional wall-clock seconds of the grading, the clues of the first
+            attempt are always completed.
+            max_attempts -- random puzzles tried before giving up on the difficulty, one at least.
+        Returned arguments:
+            (puzzle, solution) -- long strings with 81 characters, zeros represent the empty
+            cells of the puzzle.
+        """
+        if self.grid.size != 9:
+            raise ValueError("Graded puzzles are only built for 9x9 boards")
+        if difficulty not in GRADED_DIFFICULTIES:
+            raise ValueError("Unknown logic difficulty: %s" % (difficulty))
+        if max_attempts < 1:
+            raise ValueError("At least one attempt is needed to build a puzzle")
+        start_time = default_timer()
+        deadline = start_time + time_limit if time_limit is not None else None
+        easier = DIFFICULTIES[DIFFICULTIES.index(difficulty) - 1] if difficulty != "Easy" else None
+        rater = LogicRater()
+        best, best_rank, checks, budget_exceeded = None, None, 0, False
+        for attempt in range(1, max_attempts + 1):
+            random_grid, solution = self.build_random_puzzle()
+            puzzle = list(rater.reveal(random_grid, solution, difficulty))
+            graded = easier is None or not rater.resolves(''.join(puzzle), easier)
+            candidates = [index for index in self.shuffled(range(81)) if puzzle[index] != '0']
+            clues = len(candidates)
+            while clues > self.visible_numbers:
+                if deadline is not None and default_timer() >= deadline:
+                    budget_exceeded = True
+                    break
+                index, graded, tried = self.graded_removal(rater, puzzle, candidates,\
+                    difficulty, None if graded else easier, deadline)
+                checks += tried
+                if index is None:
+                    break
+                puzzle[index] = '0'
+                candidates.remove(index)
+                clues -= 1
+            grid = ''.join(puzzle)
+            rank = (DIFFICULTIES.index(difficulty if graded else rater.rate(grid).difficulty),\
+                -clues)
+            if best_rank is None or rank > best_rank:
+                best, best_rank = (grid, solution), rank
+            if graded:
+                break
+            if deadline is not None and default_timer() >= deadline:
+                budget_exceeded = True
+                break
+        self.stats = GenerationStats(attempt, checks, -best_rank[1], default_timer() - start_time,\
+            budget_exceeded)
+        return best
+
+    def graded_removal(self, rater, puzzle, candidates, difficulty, easier=None, deadline=None):
+        """
+        Looks for the next clue to remove from a puzzle being graded. Removing clues never makes
+        a puzzle easier, so the candidates whose removal is too hard are dropped for good.
+        Keyword arguments:
+            rater -- LogicRater used for the grading passes.
+            puzzle -- list of the 81 characters of the puzzle, it is left unchanged.
+            candidates -- indexes of the clues that can still be removed.
+            difficulty -- techniques that have to resolve the puzzle after the removal.
+            easier -- difficulty that should no longer resolve it, None when the puzzle already
+            needs a technique of the difficulty.
+            deadline -- optional default_timer value after which the search stops.
+        Returned parameters:
+            (index, graded, tried) -- the clue to remove (None when there is none), True when
+            the puzzle needs a technique of the difficulty after the removal and the number of
+            removals tried.
+        """
+        fallback, tried = None, 0
+        for index in list(candidates):
+            if deadline is not None and default_timer() >= deadline:
                 break
-            digit_list = [values[square_pos] for square_pos in self.grid.squares if len(values[square_pos]) == 1]
-            if len(digit_list) >= self.visible_numbers and len(set(digit_list)) >= max_index:
-                return ''.join(values[square_pos] if len(values[square_pos]) == 1 else '0' for square_pos in self.grid.squares)
-        return self.build_random_grid()
+            clue, puzzle[index] = puzzle[index], '0'
+            grid = ''.join(puzzle)
+            puzzle[index] = clue
+            tried += 1
+            if easier is not None and rater.resolves(grid, easier):
+                fallback = index if fallback is None else fallback
+            elif rater.resolves(grid, difficulty):
+                return index, True, tried
+            else:
+                candidates.remove(index)
+        return fallback, easier is None, tried
 
     def return_join_characters(self, value, square_pos):
 
@@ -51,7 +334,7 @@ class SudokuBuilder(object):
             A shuffled sequence, its items should be randomly permuted of its original indexes.
         """
         seq = list(seq)
-        random.shuffle(seq)
+        self.random.shuffle(seq)
         return seq
 
     def assign(self, values, square_pos, digit):
@@ -84,6 +367,8 @@ class SudokuBuilder(object):
             return False ## Contradiction: removed last value
         elif len(values[square_pos]) == 1:
             second_digit = values[square_pos]
+            self.singletons += 1
+            self.singleton_digits[second_digit] = self.singleton_digits.get(second_digit, 0) + 1
             square_values = (self.eliminate(values, second_square, second_digit)\
             for second_square in self.grid.peers[square_pos])
             if not all(square_values):
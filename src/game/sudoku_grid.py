@@ -1,8 +1,66 @@
-""" This class will be in charge of filling a 9x9 grid with digits """
+""" This class will be in charge of filling a 9x9 grid with digits, or a N x N grid of symbols for
+the larger boards (e.g. 16x16 boards use the symbols 1 to 9 and A to G)"""
+
+from ..algorithms.board_topology import BOARD_SIZES, board_topology
+
+SYMBOLS = "123456789ABCDEFGHIJKLMNOP"
+ROW_LABELS = "ABCDEFGHIJKLMNOPQRSTUVWXY"
+GRID_TABLES = {}
+
+def board_size(string_grid):
+    """ Returns the side of the board of a puzzle (e.g. 9 for a long string of 81 characters), or
+    None when the puzzle is not a valid one of a supported board size.
+    Keyword arguments:
+        string_grid -- long string of N x N symbols where zeros represent empty spots.
+    """
+    size = int(round(len(string_grid) ** 0.5))
+    if size not in BOARD_SIZES or size * size != len(string_grid):
+        return None
+    if str(string_grid).translate(None, '0' + SYMBOLS[:size]):
+        return None
+    return size
+
+def is_solution(string_grid, solution):
+    """ Returns True when a grid is a solution of a puzzle: every row, column and box holds each
+    symbol once and every given of the puzzle is kept.
+    Keyword arguments:
+        string_grid -- long string of N x N symbols where zeros represent empty spots.
+        solution -- long string of N x N symbols.
+    """
+    string_grid, solution = str(string_grid), str(solution)
+    size = board_size(solution)
+    if size is None or '0' in solution or len(string_grid) != len(solution):
+        return False
+    if any(given != '0' and given != value for given, value in zip(string_grid, solution)):
+        return False
+    symbols = frozenset(SYMBOLS[:size])
+    return all(frozenset(solution[index] for index in unit) == symbols\
+        for unit in board_topology(size).units)
+
+def grid_tables(size=9):
+    """ Returns the squares, unitlist, units and peers of a board size keyed by 'A1'-style squares,
+    they are derived from the BoardTopology the first time and then shared by every SudokuGrid.
+    The squares and units are tuples and the peers are frozensets, so they can not be modified.
+    Keyword arguments:
+        size -- side of the board, one of BOARD_SIZES.
+    """
+    tables = GRID_TABLES.get(size)
+    if tables is None:
+        topology = board_topology(size)
+        squares = tuple(row + column for row in ROW_LABELS[:size] for column in SYMBOLS[:size])
+        unitlist = tuple(tuple(squares[index] for index in unit)\
+            for unit in topology.columns + topology.rows + topology.boxes)
+        units = dict((square, (unitlist[topology.column_of[position]],\
+            unitlist[size + topology.row_of[position]], unitlist[2 * size + topology.box_of[position]]))\
+            for position, square in enumerate(squares))
+        peers = dict((square, frozenset(squares[index] for index in topology.peers[position]))\
+            for position, square in enumerate(squares))
+        tables = GRID_TABLES[size] = (squares, unitlist, units, peers)
+    return tables
 
 class SudokuGrid(object):
 
-    def __init__(self):
+    def __init__(self, size=9):
         """  Throughout this program we have:
         r is a row,    e.g. 'A'
         c is a column, e.g. '3'
@@ -11,17 +69,18 @@ class SudokuGrid(object):
         u is a unit,   e.g. ['A1','B1','C1','D1','E1','F1','G1','H1','I1']
         grid is a grid,e.g. 81 non-blank chars, e.g. starting with '.18...7...
         values is a dict of possible values, e.g. {'A1':'12349', 'A2':'8', ...}
+        size is the side of the board, one of BOARD_SIZES, e.g. 9
+        box_size is the side of a block, e.g. 3
         """
-
-        self.digits = '123456789'
-        self.rows = 'ABCDEFGHI'
+        if size not in BOARD_SIZES:
+            raise ValueError("Unsupported board size: %s" % (size))
+        self.size = size
+        self.box_size = int(round(size ** 0.5))
+        self.digits = SYMBOLS[:size]
+        self.rows = ROW_LABELS[:size]
         self.cols = self.digits
-        self.squares = self.cross(self.rows, self.cols)
-        self.unitlist = ([self.cross(self.rows, c) for c in self.cols] + \
-            [self.cross(r, self.cols) for r in self.rows] + \
-            [self.cross(rs, cs) for rs in ('ABC', 'DEF', 'GHI') for cs in ('123', '456', '789')])
-        self.units = dict((square, [u for u in self.unitlist if square in u]) for square in self.squares)
-        self.peers = dict((square, set(sum(self.units[square], [])) - set([square])) for square in self.squares)
+        self.squares, self.unitlist, units, peers = grid_tables(size)
+        self.units, self.peers = dict(units), dict(peers)
         self.grid_values = None
         self.string_grid = None
 
@@ -38,10 +97,10 @@ class SudokuGrid(object):
         """Converts a grid (string basic format) into a dict of {square: char}
         with '0' or '.' for empties.
         Keyword arguments:
-            string_grid -- an array of 81 characters
+            string_grid -- an array of N x N characters (81 for the 9x9 boards), or a Puzzle
         """
-        self.string_grid = string_grid
-        chars = [c for c in string_grid if c in self.digits or c in '0.']
+        self.string_grid = str(string_grid)
+        chars = [c for c in self.string_grid if c in self.digits or c in '0.']
         # assert len(chars) == 81
         self.grid_values = dict(zip(self.squares, chars))
 
@@ -49,11 +108,13 @@ class SudokuGrid(object):
         """Display the puzzle values as a 2-D grid. well formatted with - and |."""
         outcome = ""
         width = 1+max(len(self.grid_values[square]) for square in self.squares)
-        line = '+'.join(['-'*(width*3)]*3)
+        line = '+'.join(['-'*(width*self.box_size)]*self.box_size)
+        box_cols = self.cols[self.box_size-1:-1:self.box_size]
+        box_rows = self.rows[self.box_size-1:-1:self.box_size]
         for r in self.rows:
             outcome += ''.join(self.grid_values[r+c].center(width) + \
-                 ('|' if c in '36' else '')for c in self.cols) + '\n'
-            if r in 'CF':
+                 ('|' if c in box_cols else '')for c in self.cols) + '\n'
+            if r in box_rows:
                 outcome += line + '\n'
         return outcome
 
@@ -68,7 +129,7 @@ class SudokuGrid(object):
     def display_simple_grid(self):
         """Display the puzzle values as a simple grid."""
         outcome = ""
-        outcome += "".join(['\n' + str(c) if i % 9 == 0 else str(c) \
+        outcome += "".join(['\n' + str(c) if i % self.size == 0 else str(c) \
             for i, c in enumerate(self.string_grid)])
         outcome += "\n"
         return outcome
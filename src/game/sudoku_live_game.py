@@ -2,27 +2,28 @@
 from menu_base import MenuBase
 from ..game.sudoku_solver import SudokuSolver
 from ..game.sudoku_grid import SudokuGrid
-from ..algorithms.algorithm import Algorithm
-from ..algorithms.brute_force import BruteForce
+from ..algorithms.algorithm_registry import create_algorithm
 from ..algorithms.backtracking import Backtracking
-from ..algorithms.peter_norvig import PeterNorvig
 from collections import OrderedDict
 import random
 import time
 
 class SudokuLiveGame(MenuBase):
-    def __init__(self, default_settings):
+    def __init__(self, default_settings, puzzle_pool=None):
         """ Initializes the control menu variables and starts the loop
         Note: This subclass is going to inherit useful and generic methods of MenuBase superclass
         Keyword arguments:
             default_settings : This is a dictionary provided by XMLHandler with the current
             default game settings
+            puzzle_pool : optional PuzzlePool with ready puzzles of every level, the puzzle is
+            generated on the spot without it
         """
         super(SudokuLiveGame, self).__init__()
         self.options, self.current_response = None, None
         self.continue_game = True
         self.max_hints, self.starting_digits = None, None
         self.default_settings = default_settings
+        self.puzzle_pool = puzzle_pool
         self.string_grid_formulated, self.string_grid, self.string_grid_resolved = "", "", ""
         self.pos_x, self.pos_y, self.puzzle_value, self.hints_provided = 0, 0, 0, 0
         self.number_of_rows, self.number_of_columns = 9, 9
@@ -41,16 +42,21 @@ class SudokuLiveGame(MenuBase):
         self.max_hints = int(self.default_settings['hints'])
         self.starting_digits = random.randint(min_digit, max_digit)
         print("1. Using the '%s' game difficulty level" %(level))
-        print("2. Using '%s' starting digits (or more) to build the Sudoku Puzzle" %(self.starting_digits))
+        if self.puzzle_pool is not None:
+            print("2. Using a ready Sudoku Puzzle with '%s' to '%s' starting digits" %(min_digit, max_digit))
+        else:
+            print("2. Using '%s' starting digits (or more) to build the Sudoku Puzzle" %(self.starting_digits))
         print("3. The maximum number of hints for this level is '%s'\n " %(self.max_hints))
 
     def initialize_formulated_puzzle(self):
         """ Puzzle is generated and it is stored as a long string of 81 chars, 
         also the expected solution is stored in other long string"""
-        class_name = self.default_settings['algorithm'].translate(None, ' ')
-        class_name += '()'
-        getattr(self.sudoku_solver, 'change_algorithm')(eval(class_name))
-        self.sudoku_solver.solve_sudoku_from_grid_generated(self.starting_digits)
+        self.sudoku_solver.change_algorithm(create_algorithm(self.default_settings['algorithm']))
+        if self.puzzle_pool is not None:
+            self.sudoku_solver.solve_sudoku_from_puzzle_pool(self.puzzle_pool,\
+                self.default_settings['level'])
+        else:
+            self.sudoku_solver.solve_sudoku_from_grid_generated(self.starting_digits)
         print (self.sudoku_solver.display_grid_source_with_format("2D_point"))
         self.string_grid_formulated = self.sudoku_solver.string_grid
         self.string_grid = self.sudoku_solver.string_grid
@@ -1,29 +1,45 @@
 """ This module will be in charge of solving a the grid managed by SudokuBuilder and display it
 in any format desired
 """
+from collections import namedtuple
+from timeit import default_timer
 from sudoku_builder import SudokuBuilder
-from sudoku_grid import SudokuGrid
-from ..algorithms.algorithm import Algorithm
+from sudoku_grid import SudokuGrid, board_size, is_solution
+from ..algorithms.algorithm import Algorithm, SOLVED, UNSOLVED, INVALID, BUDGET_EXCEEDED
 from ..algorithms.brute_force import BruteForce
+from ..algorithms.peter_norvig import PeterNorvig
+from ..algorithms.dancing_links import DancingLinks
 from ..handlers.txt_handler import TXTHandler
 from ..handlers.csv_handler import CSVHandler
 
+SolveResult = namedtuple('SolveResult', ['puzzle', 'solution', 'status', 'elapsed_time',
+    'metrics'])
+
 class SudokuSolver(object):
 
-    def __init__(self, algorithm=BruteForce()):
+    def __init__(self, algorithm=BruteForce(), cache=None, store=None):
         """
-        Initializes important parameters like Algorithm and SudokuGrid modules.
+        Initializes important parameters like Algorithm and SudokuGrid modules. The board sizes
+        the algorithm can not solve (e.g. 16x16) are solved by the DancingLinks instance kept in
+        large_board_algorithm, created the first time it is needed.
         Keyword arguments:
             algorithm -- type of strategy used to solve the sudoku puzzle
+            cache -- optional SolutionCache consulted before running the algorithm
+            store -- optional SolutionStore (on disk) consulted after the cache
         """
         self.builder = None
         self.algorithm = algorithm
+        self.cache = cache
+        self.store = store
         self.string_grid = None
         self.string_grid_resolved = None
         self.sudoku_grid = SudokuGrid()
         self.txt_file = None
         self.csv_file = None
         self.command_line_input = None
+        self.enumerator = None
+        self.large_board_algorithm = None
+        self.last_metrics = None
 
 
     def solve_sudoku_from_txt_file(self, relative_path):
@@ -37,9 +53,8 @@ class SudokuSolver(object):
         self.txt_file.load_file(relative_path)
         self.string_grid = self.txt_file.retrieve_txt_grid()
         if self.is_string_grid_valid():
-            self.sudoku_grid.load_grid_values(self.string_grid)
-            self.algorithm.solve_sudoku(self.string_grid)
-            self.string_grid_resolved = self.algorithm.retrieve_grid_basic_format()
+            self.load_sudoku_grid(self.string_grid)
+            self.string_grid_resolved = self.resolve_grid(self.string_grid)
 
         else:
             print("Error 1001: The TXT file should only contain 81 valid digits")
@@ -56,25 +71,51 @@ class SudokuSolver(object):
         self.csv_file.load_file(relative_path)
         self.string_grid = self.csv_file.retrieve_csv_grid()
         if self.is_string_grid_valid():
-            self.sudoku_grid.load_grid_values(self.string_grid)
-            self.algorithm.solve_sudoku(self.string_grid)
-            self.string_grid_resolved = self.algorithm.retrieve_grid_basic_format()
+            self.load_sudoku_grid(self.string_grid)
+            self.string_grid_resolved = self.resolve_grid(self.string_grid)
         else:
             print("Error 1002: The CSV file should only contain 81 valid digits separated by commas")
             raise ValueError('The CSV file should only contain 81 valid digits separated by commas')
 
-    def solve_sudoku_from_grid_generated(self, visible_numbers):
-        """ Generates a random puzzle and then proceed to solved it using the algortihm stored.
+    def solve_sudoku_from_grid_generated(self, visible_numbers, size=9, time_limit=2.0,\
+        resolve=False, level=None):
+        """ Generates a random puzzle with a single solution, the solution computed by the builder
+        is used unless the puzzle is solved again with the algortihm stored.
         Keyword arguments:
             visible_numbers -- quantity of numbers that will be filled in the puzzle, the rest
         of them will be zeros or empty spaces in UI/Command Line Interface
+            size -- side of the board (e.g. 16 for 16x16 puzzles)
+            time_limit -- seconds given to the builder to remove clues, the puzzle keeps more
+        visible numbers when they are not enough
+            resolve -- True to solve the puzzle with the algorithm stored (e.g. to measure it).
+            level -- optional name of the level of the puzzle, the levels named after a
+        difficulty (e.g. "Medium") are graded, see SudokuBuilder.build_level_puzzle.
         """
 
-        self.builder = SudokuBuilder(visible_numbers)
-        self.string_grid = self.builder.build_random_grid()
-        self.sudoku_grid.load_grid_values(self.string_grid)
-        self.algorithm.solve_sudoku(self.string_grid)
-        self.string_grid_resolved = self.algorithm.retrieve_grid_basic_format()
+        self.builder = SudokuBuilder(visible_numbers, size=size)
+        self.string_grid, solution = self.builder.build_level_puzzle(level, time_limit)
+        self.load_sudoku_grid(self.string_grid)
+        if resolve:
+            self.string_grid_resolved = self.resolve_grid(self.string_grid)
+        else:
+            self.last_metrics = None
+            self.string_grid_resolved = solution
+
+    def solve_sudoku_from_puzzle_pool(self, puzzle_pool, level, resolve=False):
+        """ Takes a ready puzzle of a level from a PuzzlePool, the solution kept by the pool is
+        used unless the puzzle is solved again with the algorithm stored.
+        Keyword arguments:
+            puzzle_pool -- PuzzlePool with the ready puzzles of the levels.
+            level -- name of the level (e.g. "Easy").
+            resolve -- True to solve the puzzle with the algorithm stored (e.g. to measure it).
+        """
+        self.string_grid, solution = puzzle_pool.pop(level)
+        self.load_sudoku_grid(self.string_grid)
+        if resolve:
+            self.string_grid_resolved = self.resolve_grid(self.string_grid)
+        else:
+            self.last_metrics = None
+            self.string_grid_resolved = solution
 
     def solve_sudoku_from_string_provided(self, string_provided):
         """
@@ -85,10 +126,155 @@ class SudokuSolver(object):
             string_grid -- long string of 81 character where zeros represent empty spots.
         """
         self.string_grid = string_provided
+        self.string_grid_resolved, self.last_metrics = None, None
         if self.is_string_grid_valid():
-            self.sudoku_grid.load_grid_values(self.string_grid)
-            self.algorithm.solve_sudoku(self.string_grid)
-            self.string_grid_resolved = self.algorithm.retrieve_grid_basic_format()
+            self.load_sudoku_grid(self.string_grid)
+            self.string_grid_resolved = self.resolve_grid(self.string_grid)
+
+    def solve_many(self, grids):
+        """
+        Solves a stream of puzzles with the algorithm stored, without reloading the Sudoku Grid
+        for each puzzle. Results are produced lazily, one per puzzle.
+        Keyword arguments:
+            grids -- iterable of long strings of 81 characters where zeros represent empty spots,
+            or of Puzzle instances.
+        Yielded parameters:
+            result -- SolveResult record with the puzzle, its solution (None when the puzzle
+            is invalid), the status (solved, unsolved, invalid or budget_exceeded), the elapsed
+            time in seconds and the SolveMetrics of the search (None when it was not searched).
+        """
+        for string_grid in grids:
+            if isinstance(string_grid, basestring):
+                string_grid = string_grid.strip()
+            yield self.solve_string_grid(string_grid)
+
+    def solve_string_grid(self, string_grid):
+        """
+        Solves a single puzzle with the algorithm stored and returns its result record.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots, or a
+            Puzzle.
+        """
+        if board_size(string_grid) is None:
+            return SolveResult(string_grid, None, INVALID, 0.0, None)
+        start_time = default_timer()
+        solution = self.resolve_grid(string_grid)
+        elapsed_time = default_timer() - start_time
+        return SolveResult(string_grid, solution, self.solution_status(solution, string_grid),\
+            elapsed_time, self.last_metrics)
+
+    def solution_status(self, solution, string_grid):
+        """
+        Returns the status of the last puzzle resolved from its solution and last_metrics.
+        Keyword arguments:
+            solution -- long string of 81 characters given by resolve_grid, None when the puzzle
+            was not valid.
+            string_grid -- the puzzle resolved.
+        Returned parameters:
+            status -- solved, unsolved (the puzzle has no solution), invalid (also a complete
+            grid breaking the rules or the givens) or budget_exceeded.
+        """
+        if solution is None:
+            return INVALID
+        if '0' not in solution:
+            return SOLVED if is_solution(string_grid, solution) else INVALID
+        if self.last_metrics is not None and self.last_metrics.budget_exceeded:
+            return BUDGET_EXCEEDED
+        return UNSOLVED
+
+    def resolve_grid(self, string_grid):
+        """
+        Returns the solution of a puzzle, looking it up in the cache and then in the store (when
+        there are ones) before running the algorithm stored. Only the grids checked as solutions
+        of the puzzle are kept, and a stored grid that is not one is ignored.
+        The SolveMetrics of the algorithm are left in last_metrics, None when it was not run.
+        Keyword arguments:
+            string_grid -- long string of 81 characters where zeros represent empty spots, or a
+            Puzzle given as it is to the algorithm (the cache and the store are keyed by its
+            long string).
+        """
+        self.last_metrics = None
+        key = str(string_grid)
+        if self.cache is not None:
+            solution = self.cache.get(key)
+            if solution is not None:
+                return solution
+        if self.store is not None:
+            solution = self.store.get(key)
+            if solution is not None and is_solution(key, solution):
+                if self.cache is not None:
+                    self.cache.put(key, solution)
+                return solution
+        algorithm = self.retrieve_algorithm(board_size(string_grid))
+        algorithm.solve_sudoku(string_grid)
+        solution = algorithm.retrieve_grid_basic_format()
+        self.last_metrics = algorithm.metrics
+        if is_solution(key, solution):
+            if self.cache is not None:
+                self.cache.put(key, solution)
+            if self.store is not None:
+                self.store.put(key, solution, self.last_metrics.algorithm,\
+                    self.last_metrics.elapsed_time)
+        return solution
+
+    def iter_solutions(self, string_provided):
+        """
+        Yields lazily the solutions of a puzzle, using the algorithm stored when it is able to
+        enumerate solutions, otherwise a Peter Norvig enumerator.
+        Keyword arguments:
+            string_provided -- INPUT long string of 81 characters where zeros represent empty spots.
+        Yielded parameters:
+            solution -- long string of 81 characters for each solution of the puzzle.
+        """
+        size = board_size(string_provided)
+        if size is None:
+            raise ValueError('The puzzle should only contain 81 valid digits')
+        return self.retrieve_enumerator(size).iter_solutions(string_provided)
+
+    def count_solutions(self, string_provided, limit=None):
+        """
+        Counts the solutions of a puzzle, stopping as soon as the limit is reached.
+        Keyword arguments:
+            string_provided -- INPUT long string of 81 characters where zeros represent empty spots.
+            limit -- maximum number of solutions to look for, None means all of them.
+        """
+        size = board_size(string_provided)
+        if size is None:
+            raise ValueError('The puzzle should only contain 81 valid digits')
+        return self.retrieve_enumerator(size).count_solutions(string_provided, limit)
+
+    def has_unique_solution(self, string_provided):
+        """ Returns True when the puzzle has exactly one solution, two solutions at most are
+        searched to answer it."""
+        return self.count_solutions(string_provided, 2) == 1
+
+    def retrieve_enumerator(self, size=9):
+        """ Returns the algorithm that will enumerate the solutions of a puzzle."""
+        if self.algorithm.enumerates_solutions and size in self.algorithm.board_sizes:
+            return self.algorithm
+        if size != 9:
+            return self.retrieve_algorithm(size)
+        if self.enumerator is None:
+            self.enumerator = PeterNorvig()
+        return self.enumerator
+
+    def retrieve_algorithm(self, size=9):
+        """ Returns the algorithm stored, or DancingLinks when it can not solve the board size."""
+        if size in self.algorithm.board_sizes:
+            return self.algorithm
+        if self.large_board_algorithm is None:
+            self.large_board_algorithm = DancingLinks()
+            self.large_board_algorithm.set_search_limits(self.algorithm.time_limit,\
+                self.algorithm.max_nodes)
+        return self.large_board_algorithm
+
+    def load_sudoku_grid(self, string_grid):
+        """ Loads the puzzle in the SudokuGrid used for the display, the SudokuGrid is replaced
+        when the board size of the puzzle changes."""
+        size = board_size(string_grid) or 9
+        if self.sudoku_grid.size != size:
+            self.sudoku_grid = SudokuGrid(size)
+        self.sudoku_grid.load_grid_values(string_grid)
 
     def display_grid_source_with_format(self, format_type="simple"):
         """
@@ -111,7 +297,7 @@ class SudokuSolver(object):
         Keyword arguments:
             format_type -- initially can take the simple and 2D format types.
         """
-        self.sudoku_grid.load_grid_values(self.string_grid_resolved)
+        self.load_sudoku_grid(self.string_grid_resolved)
 
         if format_type == "simple":
             return self.sudoku_grid.display_simple_grid()
@@ -127,5 +313,6 @@ class SudokuSolver(object):
         self.algorithm = new_algorithm
 
     def is_string_grid_valid(self):
-        """ Checks if the long string with 81 characters contain only numbers in its content"""
-        return self.string_grid.isdigit() and len(self.string_grid) == 81
+        """ Checks if the long string with 81 characters contain only numbers in its content, or
+        N x N symbols for the larger boards (e.g. 256 symbols from 0 to 9 and A to G)"""
+        return board_size(self.string_grid) is not None
@@ -6,6 +6,8 @@ import abc
 import os
 from file_handler import FileHandler
 from ..settings import settings
+from ..game.puzzle import Puzzle
+from puzzle_reader import read_puzzles
 
 class CSVHandler(FileHandler):
     """
@@ -28,6 +30,29 @@ class CSVHandler(FileHandler):
         if self.file_checker():
             self.csv_file = self.csv_opened.read().strip()
 
+    def iter_puzzles(self, input_source, errors=None):
+        """
+        Reads the puzzles of a CSV file holding many of them one at a time, the file is read
+        line by line so the memory used does not depend on its size (see puzzle_reader for the
+        layouts accepted).
+        Keyword arguments:
+            input_source -- relative (to the Sudoku2015-C directory) or absolute path of the file.
+            errors -- optional list collecting the PuzzleFormatError (with its line number) of
+            the malformed records, which are then skipped, without it the first malformed record
+            raises its PuzzleFormatError.
+        Yielded parameters:
+            string_grid -- long string of 81 characters (N x N for the larger boards) where zeros
+            represent empty spots.
+        """
+        self.csv_absolute_file_path = self.__get_path(input_source)
+        try:
+            csv_opened = open(self.csv_absolute_file_path, "r")
+        except IOError:
+            raise IOError("The csv file does not appear to exist, exiting gracefully")
+        with csv_opened:
+            for string_grid in read_puzzles(csv_opened, ',', errors):
+                yield string_grid
+
     def file_checker(self):
         """
         Loading files is considered a risky operation, so the code is wrapped in a
@@ -66,7 +91,15 @@ class CSVHandler(FileHandler):
 
     def retrieve_csv_grid(self):
         """
-        Transform the standard csv content to a long string of 81 character without commas.
+        Transform the standard csv content to a long string of 81 character without commas
+        (N x N characters for the larger boards, e.g. 16 rows of 16 symbols).
         """
         self.csv_file = self.csv_file.translate(None, ',')
         return self.csv_file
+
+    def retrieve_puzzle(self):
+        """
+        Returns the content of the file as a Puzzle, the compact form of the puzzle that the
+        algorithms read without parsing characters.
+        """
+        return Puzzle.from_string(self.retrieve_csv_grid())
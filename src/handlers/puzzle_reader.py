@@ -0,0 +1,105 @@
+"""
+This module is in charge of reading the puzzles of the large corpus files line by line, so the
+memory used does not grow with the size of the file. The TXT and CSV handlers share it and the
+layouts below can be mixed in the same file:
+    - one puzzle per line (81 symbols, or 256 and 625 for the larger boards)
+    - blocks of N lines of N symbols (e.g. 9 lines of 9 digits), '|' and the lines of '-' and '+'
+      drawn between the boxes are skipped
+    - zeros or points for the empty spots, spaces (and commas in the CSV files) are skipped
+    - comment lines starting with '#' and blank lines
+A line of 16 symbols is read as a row of a 16x16 block, so the 4x4 puzzles are written as blocks
+of 4 lines.
+"""
+import string
+from ..game.sudoku_grid import SYMBOLS, BOARD_SIZES
+
+LAYOUT_CHARS = ' \t\r\n|'
+BORDER_CHARS = '-+'
+POINT_TABLE = string.maketrans('.', '0')
+LINE_SIZES = dict((size * size, size) for size in BOARD_SIZES if size * size not in BOARD_SIZES)
+
+class PuzzleFormatError(ValueError):
+    """ Malformed record of a puzzle file.
+    Keyword arguments:
+        line_number -- line of the file where the record starts (1 for the first line)
+        reason -- description of the problem (e.g. "8 rows in a block of 9")
+    """
+
+    def __init__(self, line_number, reason):
+        super(PuzzleFormatError, self).__init__("Line %d: %s" % (line_number, reason))
+        self.line_number = line_number
+        self.reason = reason
+
+def read_puzzles(lines, separators='', errors=None):
+    """
+    Yields the puzzles of an iterable of lines (e.g. an open file) one at a time.
+    Keyword arguments:
+        lines -- iterable of lines of text.
+        separators -- other characters skipped in the lines (',' for the CSV files).
+        errors -- optional list collecting the PuzzleFormatError of the malformed records, which
+        are then skipped, without it the first malformed record raises its PuzzleFormatError.
+    Yielded parameters:
+        string_grid -- long string of N x N symbols where zeros represent empty spots.
+    """
+    for record in read_records(lines, separators):
+        if not isinstance(record, PuzzleFormatError):
+            yield record
+        elif errors is None:
+            raise record
+        else:
+            errors.append(record)
+
+def read_records(lines, separators=''):
+    """
+    Yields the records of an iterable of lines, a long string for every puzzle and a
+    PuzzleFormatError for every malformed one. The rows of a block are the only lines kept in
+    memory, a line of another length (e.g. a blank line or a whole puzzle) cuts the block and is
+    read as the next record.
+    Keyword arguments:
+        lines -- iterable of lines of text.
+        separators -- other characters skipped in the lines.
+    """
+    block, block_start, block_error = [], None, None
+    for line_number, line in enumerate(lines, 1):
+        cells = line.translate(POINT_TABLE, LAYOUT_CHARS + separators)
+        if line.lstrip().startswith('#') or cells and not cells.translate(None, BORDER_CHARS):
+            continue
+        if block and len(cells) != len(block[0]):
+            yield block_size_error(block_start, block)
+            block = []
+        if block:
+            block.append(cells)
+            block_error = block_error or symbol_error(line_number, cells, len(block[0]))
+            if len(block) == len(block[0]):
+                yield block_error or ''.join(block)
+                block = []
+        elif not cells:
+            continue
+        elif len(cells) in BOARD_SIZES:
+            block, block_start = [cells], line_number
+            block_error = symbol_error(line_number, cells, len(cells))
+        elif len(cells) in LINE_SIZES:
+            yield symbol_error(line_number, cells, LINE_SIZES[len(cells)]) or cells
+        else:
+            yield PuzzleFormatError(line_number, "%d symbols is neither a puzzle nor a row" %\
+                (len(cells)))
+    if block:
+        yield block_size_error(block_start, block)
+
+def block_size_error(line_number, block):
+    """ Returns the PuzzleFormatError of a block cut before its last row."""
+    return PuzzleFormatError(line_number, "%d rows in a block of %d" % (len(block), len(block[0])))
+
+def symbol_error(line_number, cells, size):
+    """
+    Returns the PuzzleFormatError of a line holding a symbol out of the board, or None.
+    Keyword arguments:
+        line_number -- line of the file.
+        cells -- symbols of the line, points already replaced by zeros.
+        size -- side of the board.
+    """
+    invalid = cells.translate(None, '0' + SYMBOLS[:size])
+    if invalid:
+        return PuzzleFormatError(line_number, "invalid symbol %r for a %dx%d board" %\
+            (invalid[0], size, size))
+    return None
@@ -6,6 +6,8 @@ import abc
 import os
 from file_handler import FileHandler
 from ..settings import settings
+from ..game.puzzle import Puzzle
+from puzzle_reader import read_puzzles
 
 class TXTHandler(FileHandler):
     """ 
@@ -29,6 +31,29 @@ class TXTHandler(FileHandler):
             self.txt_file = self.txt_opened.read().strip()
             
 
+    def iter_puzzles(self, input_source, errors=None):
+        """
+        Reads the puzzles of a TXT file holding many of them one at a time, the file is read
+        line by line so the memory used does not depend on its size (see puzzle_reader for the
+        layouts accepted).
+        Keyword arguments:
+            input_source -- relative (to the Sudoku2015-C directory) or absolute path of the file.
+            errors -- optional list collecting the PuzzleFormatError (with its line number) of
+            the malformed records, which are then skipped, without it the first malformed record
+            raises its PuzzleFormatError.
+        Yielded parameters:
+            string_grid -- long string of 81 characters (N x N for the larger boards) where zeros
+            represent empty spots.
+        """
+        self.txt_absolute_file_path = self.__get_path(input_source)
+        try:
+            txt_opened = open(self.txt_absolute_file_path, "r")
+        except IOError:
+            raise IOError("The txt file does not appear to exist, exiting gracefully")
+        with txt_opened:
+            for string_grid in read_puzzles(txt_opened, errors=errors):
+                yield string_grid
+
     def file_checker(self):
         """
         Loading files is considered a risky operation, so the code is wrapped in a
@@ -67,7 +92,15 @@ class TXTHandler(FileHandler):
 
     def retrieve_txt_grid(self):
         """
-        Transform the standard csv content to a long string of 81 character without line breaks.
+        Transform the standard csv content to a long string of 81 character without line breaks
+        (N x N characters for the larger boards, e.g. 16 lines of 16 symbols).
         """
         self.txt_file = self.txt_file.translate(None, '\n')
         return self.txt_file
+
+    def retrieve_puzzle(self):
+        """
+        Returns the content of the file as a Puzzle, the compact form of the puzzle that the
+        algorithms read without parsing characters.
+        """
+        return Puzzle.from_string(self.retrieve_txt_grid())
@@ -2,7 +2,7 @@
 This module is in charge of testing the algorithm base class
 """
 import unittest
-from ...algorithms.algorithm import Algorithm
+from ...algorithms.algorithm import Algorithm, SearchBudgetExceeded
 
 class TestAlgorithm(unittest.TestCase):
 
@@ -28,5 +28,36 @@ class TestAlgorithm(unittest.TestCase):
         except NotImplementedError:
             pass
 
+    def test_iter_solutions_is_not_implemented_and_raises_exception(self):
+        algorithm = Algorithm()
+        self.assertFalse(algorithm.enumerates_solutions)
+        try:
+            algorithm.count_solutions("0" * 81, 2)
+            self.fail("Iterate solutions method not implemented in Base Class")
+        except NotImplementedError:
+            pass
+
+    def test_node_budget_is_enforced_by_count_node(self):
+        algorithm = Algorithm()
+        algorithm.set_search_limits(max_nodes=2)
+        algorithm.start_search()
+        algorithm.count_node()
+        algorithm.count_node()
+        self.assertRaises(SearchBudgetExceeded, algorithm.count_node)
+        self.assertEquals(3, algorithm.search_metrics().nodes)
+
+    def test_deadline_is_enforced_by_count_node(self):
+        algorithm = Algorithm()
+        algorithm.set_search_limits(time_limit=0)
+        algorithm.start_search()
+        self.assertRaises(SearchBudgetExceeded, algorithm.count_node)
+
+    def test_search_is_unbounded_by_default(self):
+        algorithm = Algorithm()
+        algorithm.start_search()
+        for _ in range(1000):
+            algorithm.count_node()
+        self.assertFalse(algorithm.budget_exceeded)
+
 if __name__ == '__main__':
     unittest.main()
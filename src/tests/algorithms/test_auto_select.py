@@ -0,0 +1,85 @@
+"""
+This module is in charge of testing the Auto algorithm class, which chooses the algorithm of each
+puzzle from its profile
+"""
+import unittest
+from ...algorithms.auto_select import AutoSelect, ProfileHistory, grid_features, grid_profile
+from ...algorithms.solve_metrics import SolveMetrics
+from ...algorithms.backtracking import Backtracking
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.brute_force import BruteForce
+from ...algorithms.dancing_links import DancingLinks
+from ...algorithms.algorithm_registry import create_algorithm
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+
+def timing(algorithm, puzzle, elapsed_time):
+    return SolveMetrics(algorithm, puzzle, elapsed_time, 0, 0, 0, 0, 0, False)
+
+class TestAutoSelect(unittest.TestCase):
+
+    def test_auto_is_selectable_by_its_settings_name(self):
+        self.assertIsInstance(create_algorithm("Auto"), AutoSelect)
+
+    def test_grid_features_are_taken_after_propagation(self):
+        self.assertEquals((32, 0, 0.0, 0), grid_features(EASY))
+        features = grid_features(HARD)
+        self.assertEquals(17, features.clues)
+        self.assertTrue(features.open_cells > 40)
+        self.assertTrue(1 < features.mean_candidates <= features.max_candidates <= 9)
+        self.assertEquals(None, grid_features("11" + "0" * 79).open_cells)
+
+    def test_grid_profile_groups_similar_puzzles(self):
+        self.assertEquals("c3-propagated", grid_profile(grid_features(EASY)))
+        self.assertEquals("contradiction", grid_profile(grid_features("11" + "0" * 79)))
+        self.assertEquals("c1-o4-k4", grid_profile(grid_features(HARD)))
+
+    def test_history_returns_the_fastest_algorithm_of_a_profile(self):
+        history = ProfileHistory()
+        history.learn([timing("BruteForce", HARD, 80.0), timing("DancingLinks", HARD, 0.002),\
+            timing("DancingLinks", HARD, 0.004), timing("PeterNorvig", EASY, 0.001)])
+        profile = grid_profile(grid_features(HARD))
+        self.assertAlmostEquals(0.003, history.mean_time(profile, "DancingLinks"))
+        self.assertEquals("DancingLinks", history.fastest(profile, ["BruteForce", "DancingLinks"]))
+        self.assertEquals(None, history.fastest(profile, ["PeterNorvig"]))
+
+    def test_profile_without_timings_goes_to_the_first_engine(self):
+        auto = AutoSelect((DancingLinks, PeterNorvig), ProfileHistory())
+        auto.solve_sudoku(EASY)
+        self.assertEquals(EASY_SOLVED, auto.retrieve_grid_basic_format())
+        self.assertEquals("DancingLinks", auto.selected)
+        self.assertEquals("AutoSelect", auto.metrics.algorithm)
+
+    def test_puzzle_goes_to_the_historically_fastest_engine(self):
+        history = ProfileHistory()
+        history.learn([timing("BruteForce", HARD, 80.0), timing("PeterNorvig", HARD, 0.01),\
+            timing("DancingLinks", HARD, 0.002)])
+        auto = AutoSelect((BruteForce, PeterNorvig, DancingLinks), history)
+        auto.solve_sudoku(HARD)
+        self.assertEquals(HARD_SOLVED, auto.retrieve_grid_basic_format())
+        self.assertEquals("DancingLinks", auto.selected)
+        self.assertTrue(auto.metrics.nodes > 0)
+
+    def test_untried_engine_is_explored_within_a_time_limit(self):
+        history = ProfileHistory()
+        history.learn([timing("DancingLinks", HARD, 0.002)])
+        auto = AutoSelect((DancingLinks, BruteForce), history)
+        auto.solve_sudoku(HARD)
+        profile = grid_profile(grid_features(HARD))
+        self.assertEquals(HARD_SOLVED, auto.retrieve_grid_basic_format())
+        self.assertEquals("DancingLinks", auto.selected)
+        self.assertTrue(history.mean_time(profile, "BruteForce") < 1)
+        self.assertFalse(auto.budget_exceeded)
+
+    def test_auto_is_stopped_by_its_node_budget(self):
+        auto = AutoSelect((Backtracking,), ProfileHistory())
+        auto.set_search_limits(max_nodes=3)
+        auto.solve_sudoku(HARD)
+        self.assertTrue(auto.budget_exceeded)
+        self.assertEquals(HARD, auto.retrieve_grid_basic_format())
+
+if __name__ == '__main__':
+    unittest.main()
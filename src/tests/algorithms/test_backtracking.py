@@ -76,6 +76,30 @@ class TestBacktracking(unittest.TestCase):
         [5, 1, 7, 4, 6, 8, 2, 3, 9]]
         self.assertTrue(backtracking.validate_puzzle())
 
+    def test_unknown_engine_is_rejected(self):
+        self.assertRaises(ValueError, Backtracking, "unknown")
+
+    def test_occupancy_masks_are_built_from_the_loaded_puzzle(self):
+        backtracking = Backtracking()
+        backtracking.load_puzzle("517600034" + "0" * 72)
+        self.assertTrue(backtracking.load_occupancy_masks())
+        self.assertEquals(0b001111101, backtracking.row_masks[0])
+        self.assertEquals(0b000010000, backtracking.column_masks[0])
+        self.assertEquals(0b001010001, backtracking.block_masks[0])
+        self.assertEquals(75, len(backtracking.empty_cells))
+
+    def test_repeated_digits_are_rejected_by_the_occupancy_masks(self):
+        backtracking = Backtracking()
+        backtracking.load_puzzle("510000005" + "0" * 72)
+        self.assertFalse(backtracking.load_occupancy_masks())
+
+    def test_mrv_and_sequential_engines_find_the_same_solution(self):
+        string = "100920000524010000000000070050008102000000000402700090060000000000030945000071006"
+        expect = "176923584524817639893654271957348162638192457412765398265489713781236945349571826"
+        for engine in Backtracking.ENGINES:
+            backtracking = Backtracking(engine)
+            backtracking.solve_sudoku(string)
+            self.assertEquals(expect, backtracking.retrieve_grid_basic_format())
 
 if __name__ == '__main__':
   unittest.main()
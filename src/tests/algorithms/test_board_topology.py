@@ -0,0 +1,69 @@
+"""
+This module is in charge of testing the board topology tables shared by the algorithms, the
+builder and the grid.
+"""
+import unittest
+from ...algorithms.board_topology import BOARD_SIZES, TOPOLOGY, ROWS, COLUMNS, BOXES, UNITS,\
+    ROW_OF, COLUMN_OF, BOX_OF, CELL_UNITS, PEERS, UNIT_MASKS, PEER_MASKS, board_topology, cells_mask
+from ...game.sudoku_grid import SudokuGrid
+
+
+class TestBoardTopology(unittest.TestCase):
+
+    def test_cells_are_numbered_in_row_major_order(self):
+        self.assertEquals(tuple(range(9, 18)), ROWS[1])
+        self.assertEquals(tuple(range(2, 81, 9)), COLUMNS[2])
+        self.assertEquals((30, 31, 32, 39, 40, 41, 48, 49, 50), BOXES[4])
+        self.assertEquals((1, 1, 0), (ROW_OF[10], COLUMN_OF[10], BOX_OF[10]))
+        self.assertEquals((8, 8, 8), (ROW_OF[80], COLUMN_OF[80], BOX_OF[80]))
+        self.assertEquals(ROWS + COLUMNS + BOXES, UNITS)
+
+    def test_every_cell_has_three_units_and_twenty_peers(self):
+        for index in range(81):
+            self.assertEquals((COLUMNS[COLUMN_OF[index]], ROWS[ROW_OF[index]], BOXES[BOX_OF[index]]),\
+                CELL_UNITS[index])
+            self.assertEquals(20, len(PEERS[index]))
+            self.assertNotIn(index, PEERS[index])
+            self.assertEquals(sorted(PEERS[index]), list(PEERS[index]))
+
+    def test_bitmasks_hold_the_same_cells_as_the_tuples(self):
+        self.assertEquals(0b111, cells_mask((0, 1, 2)))
+        for unit, unit_mask in zip(UNITS, UNIT_MASKS):
+            self.assertEquals(cells_mask(unit), unit_mask)
+        for index in range(81):
+            self.assertEquals(cells_mask(PEERS[index]), PEER_MASKS[index])
+            self.assertFalse(PEER_MASKS[index] >> index & 1)
+
+    def test_topologies_are_built_once_per_board_size(self):
+        self.assertIs(TOPOLOGY, board_topology(9))
+        for size in BOARD_SIZES:
+            topology = board_topology(size)
+            self.assertIs(topology, board_topology(size))
+            self.assertEquals(3 * size, len(topology.units))
+            self.assertEquals(3 * (size - 1) - 2 * (topology.box_size - 1), len(topology.peers[0]))
+        self.assertRaises(ValueError, board_topology, 10)
+
+    def test_sudoku_grids_share_the_tables_of_their_board_size(self):
+        first_grid, second_grid = SudokuGrid(), SudokuGrid()
+        self.assertIs(first_grid.squares, second_grid.squares)
+        self.assertIs(first_grid.units['A1'], second_grid.units['A1'])
+        self.assertIs(first_grid.peers['A1'], second_grid.peers['A1'])
+        self.assertIsNot(first_grid.squares, SudokuGrid(16).squares)
+        self.assertEquals((('A1', 'B1', 'C1', 'D1', 'E1', 'F1', 'G1', 'H1', 'I1'),\
+            ('A1', 'A2', 'A3', 'A4', 'A5', 'A6', 'A7', 'A8', 'A9'),\
+            ('A1', 'A2', 'A3', 'B1', 'B2', 'B3', 'C1', 'C2', 'C3')), first_grid.units['A1'])
+        self.assertEquals(set(first_grid.squares[index] for index in PEERS[0]),\
+            first_grid.peers['A1'])
+
+    def test_shared_tables_can_not_be_modified_through_a_grid(self):
+        first_grid, second_grid = SudokuGrid(), SudokuGrid()
+        self.assertIsInstance(first_grid.unitlist, tuple)
+        self.assertIsInstance(first_grid.peers['A1'], frozenset)
+        self.assertFalse(hasattr(first_grid.peers['A1'], 'add'))
+        first_grid.units['A1'] = ()
+        del first_grid.peers['B1']
+        self.assertEquals(3, len(second_grid.units['A1']))
+        self.assertEquals(20, len(SudokuGrid().peers['B1']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -80,5 +80,34 @@ class TestBruteForce(unittest.TestCase):
         index = 45
         self.assertTrue(force.validate_block(index, guess))
 
+    def test_digit_counts_are_tracked_while_guessing(self):
+        string = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+        force = BruteForce()
+        force.load_puzzle(string)
+        self.assertEquals(1, force.row_counts[0][3])
+        self.assertEquals(1, force.block_counts[0][9])
+        self.assertFalse(force.validate_guess(0, 3))
+        self.assertTrue(force.validate_guess(0, 4))
+        force.set_value(0, 4)
+        self.assertEquals(1, force.column_counts[0][4])
+        self.assertFalse(force.validate_guess(1, 4))
+        force.reset_puzzle_at(0)
+        self.assertEquals(0, force.puzzle[0])
+        self.assertEquals(0, force.column_counts[0][4])
+        self.assertTrue(force.known_cells[2])
+        self.assertFalse(force.known_cells[0])
+
+    def test_puzzle_with_repeated_givens_is_left_unsolved(self):
+        string = "110000000" + "0" * 72
+        force = BruteForce()
+        force.solve_sudoku(string)
+        self.assertEquals(string, force.retrieve_grid_basic_format())
+
+    def test_unsolvable_puzzle_stops_when_every_guess_was_tried(self):
+        string = "123456780" + "000000009" + "0" * 63
+        force = BruteForce()
+        force.solve_sudoku(string)
+        self.assertEquals(string, force.retrieve_grid_basic_format())
+
 if __name__ == '__main__':
     unittest.main()
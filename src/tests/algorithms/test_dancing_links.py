@@ -0,0 +1,93 @@
+"""
+This module is in charge of testing the Dancing Links algorithm class
+"""
+import unittest
+from ...algorithms.dancing_links import DancingLinks
+from ...game.sudoku_grid import SYMBOLS
+
+def pattern_puzzle(size, box_size):
+    """ Returns a solved board of any size and a puzzle with about 44% of its cells emptied."""
+    solution = ''.join(SYMBOLS[(box_size * (row % box_size) + row // box_size + column) % size]\
+        for row in range(size) for column in range(size))
+    puzzle = ''.join('0' if (index * 7) % 9 < 4 else char for index, char in enumerate(solution))
+    return puzzle, solution
+
+class TestDancingLinks(unittest.TestCase):
+
+    def test_dancing_links_can_be_created_with_no_arguments(self):
+        dancing_links = DancingLinks()
+        self.assertIsInstance(dancing_links, DancingLinks)
+
+    def test_candidate_row_covers_cell_row_column_and_block_constraints(self):
+        dancing_links = DancingLinks()
+        self.assertEquals((1, 82, 163, 244), dancing_links.row_columns(0))
+        self.assertEquals((81, 162, 243, 324), dancing_links.row_columns(728))
+
+    def test_puzzle_is_solved_correctly(self):
+        string = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(string)
+        expect = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+        self.assertEquals(expect, dancing_links.retrieve_grid_basic_format())
+
+    def test_hard_puzzle_is_solved_correctly(self):
+        string = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(string)
+        expect = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+        self.assertEquals(expect, dancing_links.retrieve_grid_basic_format())
+
+    def test_matrix_is_restored_for_the_next_puzzle(self):
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku("0" * 81)
+        self.assertEquals(0, dancing_links.retrieve_grid_basic_format().count('0'))
+        string = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+        dancing_links.solve_sudoku(string)
+        expect = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+        self.assertEquals(expect, dancing_links.retrieve_grid_basic_format())
+
+    def test_conflicting_givens_leave_the_puzzle_unsolved(self):
+        string = "110000000" + "0" * 72
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(string)
+        self.assertEquals(string, dancing_links.retrieve_grid_basic_format())
+
+    def test_solutions_are_counted_up_to_the_limit(self):
+        dancing_links = DancingLinks()
+        string = '000020007000340800201070090548000070720564000000090240072000014800003000605017000'
+        self.assertEquals(2, dancing_links.count_solutions(string))
+        self.assertEquals(1, dancing_links.count_solutions(string, limit=1))
+        self.assertEquals(5, dancing_links.count_solutions("0" * 81, limit=5))
+        self.assertEquals(0, dancing_links.count_solutions("11" + "0" * 79))
+    def test_16x16_puzzle_is_solved_with_symbols(self):
+        string = "00B008000C00000071000GB0F09000000A000007020460D00800915C000004000E0904051000F00" +\
+            "6F00576CB000GD0088C17E2AF6D3B4000GB06D91305F007000280000973000000070B000G0000CD00" +\
+            "0D500004000003A0060C0001000E000000740BF00009000E00E857000000G00D00630C0ED0A708000" +\
+            "000200800C00007"
+        expect = "34BE68D2ACG59F7171C24GBAF69D85E35A9G3FE782146CDB68FD915CB7E324GADE29G4851A7CFB3" +\
+            "6F3A576CB942GDE188C17E2AF6D3B4G95GB46D913E5F8A72C428FCD6973BAE15GE73B8A2G4951CD6F" +\
+            "9D51FE74CG86B3A2A6GCB5312FDE79841574ABFDG86932CECFE857963142GABD2G631C4EDBA758F9B" +\
+            "9DA23G85ECF1647"
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(string)
+        self.assertEquals(expect, dancing_links.retrieve_grid_basic_format())
+
+    def test_25x25_puzzle_is_solved_and_the_9x9_matrix_is_kept(self):
+        puzzle, solution = pattern_puzzle(25, 5)
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(puzzle)
+        self.assertEquals(solution, dancing_links.retrieve_grid_basic_format())
+        self.assertEquals(1, dancing_links.count_solutions(puzzle))
+        string = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+        dancing_links.solve_sudoku(string)
+        expect = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+        self.assertEquals(expect, dancing_links.retrieve_grid_basic_format())
+
+    def test_symbols_beyond_the_board_size_leave_the_puzzle_unsolved(self):
+        string = "G" + "0" * 80
+        dancing_links = DancingLinks()
+        dancing_links.solve_sudoku(string)
+        self.assertEquals(string, dancing_links.retrieve_grid_basic_format())
+
+if __name__ == '__main__':
+    unittest.main()
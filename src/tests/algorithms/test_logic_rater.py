@@ -0,0 +1,67 @@
+"""
+This module is in charge of testing the grading of puzzles by human solving techniques performed
+by the LogicRater class
+"""
+import unittest
+from ...algorithms.logic_rater import LogicRater
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+HIDDEN_PAIR = "007340600800502940000000810000900452009000300070006080200601000003000000040000000"
+X_WING = "100000569492056108056109240009640801064010000218035604040500016905061402621000005"
+NEEDS_SEARCH = "100007090030020008009600500005300900010080002600004000300000010040000007007000300"
+
+class TestLogicRater(unittest.TestCase):
+
+    def test_puzzle_resolved_with_singles_is_easy(self):
+        rating = LogicRater().rate(EASY)
+        self.assertTrue(rating.solved)
+        self.assertEquals(EASY_SOLVED, rating.grid)
+        self.assertEquals("Easy", rating.difficulty)
+        self.assertIn(rating.hardest, ("hidden_single", "naked_single"))
+
+    def test_puzzle_graded_by_its_hardest_technique(self):
+        rating = LogicRater().rate(HARD)
+        self.assertEquals(HARD_SOLVED, rating.grid)
+        self.assertEquals("pointing_pair", rating.hardest)
+        self.assertEquals("Medium", rating.difficulty)
+
+    def test_hidden_pair_puzzle_is_medium(self):
+        rating = LogicRater().rate(HIDDEN_PAIR)
+        self.assertTrue(rating.solved)
+        self.assertEquals("hidden_pair", rating.hardest)
+        self.assertEquals("Medium", rating.difficulty)
+
+    def test_x_wing_puzzle_is_hard(self):
+        rating = LogicRater().rate(X_WING)
+        self.assertTrue(rating.solved)
+        self.assertEquals("x_wing", rating.hardest)
+        self.assertEquals("Hard", rating.difficulty)
+
+    def test_puzzle_that_needs_search_is_expert_and_partially_resolved(self):
+        rating = LogicRater().rate(NEEDS_SEARCH)
+        self.assertFalse(rating.solved)
+        self.assertEquals("Expert", rating.difficulty)
+        self.assertTrue(rating.grid.count('0') < NEEDS_SEARCH.count('0'))
+
+    def test_puzzle_with_a_contradiction_has_no_difficulty(self):
+        rating = LogicRater().rate("11" + "0" * 79)
+        self.assertFalse(rating.solved)
+        self.assertEquals(None, rating.difficulty)
+
+    def test_reveal_adds_clues_until_the_difficulty_resolves_the_puzzle(self):
+        rater = LogicRater()
+        puzzle = rater.reveal(HARD, HARD_SOLVED, "Easy")
+        self.assertTrue(puzzle.count('0') < HARD.count('0'))
+        self.assertTrue(all(char in ('0', solved) for char, solved in zip(puzzle, HARD_SOLVED)))
+        self.assertEquals("Easy", rater.rate(puzzle).difficulty)
+        self.assertTrue(rater.resolves(puzzle, "Easy"))
+        self.assertFalse(rater.resolves(HARD, "Easy"))
+
+    def test_unknown_difficulty_raises_value_error(self):
+        self.assertRaises(ValueError, LogicRater().resolves, EASY, "Impossible")
+
+if __name__ == '__main__':
+    unittest.main()
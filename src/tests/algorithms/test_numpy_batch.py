@@ -0,0 +1,51 @@
+"""
+This module is in charge of testing the vectorized batch propagation performed by the
+NumPyBatchSolver class, the tests are skipped when numpy is not installed.
+"""
+import unittest
+from ...algorithms import numpy_batch
+from ...algorithms.numpy_batch import NumPyBatchSolver
+from ...algorithms.peter_norvig import PeterNorvig
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+CONFLICT = "110000000" + "0" * 72
+
+
+@unittest.skipIf(numpy_batch.numpy is None, "numpy is not installed")
+class TestNumPyBatchSolver(unittest.TestCase):
+
+    def test_puzzles_are_loaded_as_candidate_masks(self):
+        batch_solver = NumPyBatchSolver()
+        candidates = batch_solver.load_batch([EASY, HARD])
+        self.assertEquals((2, 81), candidates.shape)
+        self.assertEquals(0x1FF, candidates[0][0])
+        self.assertEquals(0b100, candidates[0][2])
+        self.assertEquals(0b1000, candidates[1][0])
+
+    def test_invalid_puzzles_are_rejected(self):
+        batch_solver = NumPyBatchSolver()
+        self.assertRaises(ValueError, batch_solver.load_batch, [EASY, "abc123"])
+
+    def test_propagation_solves_easy_puzzles_without_search(self):
+        batch_solver = NumPyBatchSolver()
+        self.assertEquals([EASY_SOLVED, EASY_SOLVED], batch_solver.solve_batch([EASY, EASY]))
+        self.assertEquals(2, batch_solver.propagated)
+        self.assertEquals(0, batch_solver.searched)
+
+    def test_undecided_puzzles_are_searched_by_the_fallback(self):
+        batch_solver = NumPyBatchSolver(PeterNorvig())
+        solutions = batch_solver.solve_batch([HARD, EASY, CONFLICT])
+        self.assertEquals([HARD_SOLVED, EASY_SOLVED, CONFLICT], solutions)
+        self.assertEquals(1, batch_solver.propagated)
+        self.assertEquals(1, batch_solver.searched)
+        self.assertEquals(1, batch_solver.contradictions)
+
+    def test_empty_batch_returns_no_solutions(self):
+        batch_solver = NumPyBatchSolver()
+        self.assertEquals([], batch_solver.solve_batch([]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,8 +2,10 @@
 This module is in charge of testing the different types of Grid generation for the Sudoku2015-C game 
 performed by the SudokuBuilder class.
 """
+import sys
 import unittest
 from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.algorithm import SearchBudgetExceeded
 from ...game.sudoku_grid import SudokuGrid
 
 class TestPeterNorvig(unittest.TestCase):
@@ -60,5 +62,78 @@ class TestPeterNorvig(unittest.TestCase):
         'D4': '1', 'D5': '3', 'B8': '2', 'B9': '1', 'D1': '5'}
         self.assertEquals(expected_result, peter_norvig_algorithm.parse_grid(grd_s))
 
+    def test_unknown_engine_is_rejected(self):
+        self.assertRaises(ValueError, PeterNorvig, "unknown")
+
+    def test_bitset_engine_converts_a_grid_to_candidate_masks(self):
+        peter_norvig_algorithm = PeterNorvig()
+        grd_s = '003020600900305001001806400008102900700000008006708200002609500800203009005010300'
+        cells = peter_norvig_algorithm.parse_grid_bits(grd_s)
+        self.assertEquals(81, len(cells))
+        self.assertEquals(peter_norvig_algorithm.parse_grid(grd_s),\
+            peter_norvig_algorithm.values_from_bits(cells))
+
+    def test_bitset_engine_detects_contradictions(self):
+        peter_norvig_algorithm = PeterNorvig()
+        grd_s = '110000000' + '0' * 72
+        self.assertFalse(peter_norvig_algorithm.parse_grid_bits(grd_s))
+
+    def test_bitset_and_string_engines_find_the_same_solution(self):
+        grd_s = '400000805030000000000700000020000060000080400000010000000603070500200000104000000'
+        bitset_algorithm = PeterNorvig("bitset")
+        bitset_algorithm.solve_sudoku(grd_s)
+        string_algorithm = PeterNorvig("string")
+        string_algorithm.solve_sudoku(grd_s)
+        expect = '417369825632158947958724316825437169791586432346912758289643571573291684164875293'
+        self.assertEquals(expect, bitset_algorithm.retrieve_grid_basic_format())
+        self.assertEquals(expect, string_algorithm.retrieve_grid_basic_format())
+
+    def test_bitset_search_does_not_depend_on_the_recursion_limit(self):
+        grd_s = '400000805030000000000700000020000060000080400000010000000603070500200000104000000'
+        peter_norvig_algorithm = PeterNorvig()
+        recursion_limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(100)
+        try:
+            cells = peter_norvig_algorithm.search_bits(peter_norvig_algorithm.parse_grid_bits(grd_s))
+        finally:
+            sys.setrecursionlimit(recursion_limit)
+        expect = '417369825632158947958724316825437169791586432346912758289643571573291684164875293'
+        self.assertEquals(expect, ''.join(peter_norvig_algorithm.values_from_bits(cells)[square]\
+            for square in peter_norvig_algorithm.sudoku_grid.squares))
+
+    def test_undo_bits_restores_the_masks_recorded_in_the_trail(self):
+        peter_norvig_algorithm = PeterNorvig()
+        grd_s = '400000805030000000000700000020000060000080400000010000000603070500200000104000000'
+        cells = peter_norvig_algorithm.parse_grid_bits(grd_s)
+        original = cells[:]
+        trail = []
+        index = peter_norvig_algorithm.select_cell_bits(cells)
+        peter_norvig_algorithm.assign_bits(cells, index, cells[index] & -cells[index], trail)
+        self.assertNotEquals(original, cells)
+        peter_norvig_algorithm.undo_bits(cells, trail, 0)
+        self.assertEquals(original, cells)
+        self.assertEquals([], trail)
+
+    def test_solutions_are_yielded_lazily(self):
+        peter_norvig_algorithm = PeterNorvig()
+        solutions = peter_norvig_algorithm.iter_solutions("0" * 81)
+        first, second = next(solutions), next(solutions)
+        self.assertNotEquals(first, second)
+        self.assertEquals(0, first.count('0'))
+
+    def test_solutions_are_counted_up_to_the_limit(self):
+        peter_norvig_algorithm = PeterNorvig()
+        grd_s = '000020007000340800201070090548000070720564000000090240072000014800003000605017000'
+        self.assertEquals(2, peter_norvig_algorithm.count_solutions(grd_s))
+        self.assertEquals(1, peter_norvig_algorithm.count_solutions(grd_s, limit=1))
+        self.assertEquals(5, peter_norvig_algorithm.count_solutions("0" * 81, limit=5))
+        self.assertEquals(0, peter_norvig_algorithm.count_solutions("11" + "0" * 79))
+
+    def test_iteration_stops_when_node_budget_is_exceeded(self):
+        peter_norvig = PeterNorvig()
+        peter_norvig.set_search_limits(max_nodes=200)
+        self.assertRaises(SearchBudgetExceeded, list, peter_norvig.iter_solutions("0" * 81))
+        self.assertEquals(201, peter_norvig.search_metrics().nodes)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+"""
+This module is in charge of testing the Portfolio Race algorithm class
+"""
+import unittest
+from ...algorithms.portfolio_race import PortfolioRace
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.brute_force import BruteForce
+from ...algorithms.dancing_links import DancingLinks
+from ...algorithms.algorithm_registry import create_algorithm
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+
+class TestPortfolioRace(unittest.TestCase):
+
+    def test_portfolio_race_is_selectable_by_its_settings_name(self):
+        self.assertIsInstance(create_algorithm("Portfolio Race"), PortfolioRace)
+
+    def test_portfolio_race_needs_an_engine(self):
+        self.assertRaises(ValueError, PortfolioRace, ())
+
+    def test_puzzle_is_solved_correctly(self):
+        portfolio_race = PortfolioRace()
+        portfolio_race.solve_sudoku(EASY)
+        self.assertEquals(EASY_SOLVED, portfolio_race.retrieve_grid_basic_format())
+        self.assertIn(portfolio_race.winner, ("PeterNorvig", "Backtracking", "BruteForce",\
+            "DancingLinks"))
+        self.assertEquals("PortfolioRace", portfolio_race.metrics.algorithm)
+
+    def test_hard_puzzle_does_not_wait_for_the_slowest_engine(self):
+        portfolio_race = PortfolioRace((BruteForce, DancingLinks))
+        portfolio_race.solve_sudoku(HARD)
+        self.assertEquals(HARD_SOLVED, portfolio_race.retrieve_grid_basic_format())
+        self.assertEquals("DancingLinks", portfolio_race.winner)
+        self.assertTrue(portfolio_race.metrics.elapsed_time < 10)
+
+    def test_unsolvable_puzzle_is_returned_unchanged(self):
+        string = "11" + "0" * 79
+        portfolio_race = PortfolioRace((PeterNorvig, DancingLinks))
+        portfolio_race.solve_sudoku(string)
+        self.assertEquals(string, portfolio_race.retrieve_grid_basic_format())
+        self.assertFalse(portfolio_race.budget_exceeded)
+
+    def test_engines_over_their_node_budget_do_not_win(self):
+        portfolio_race = PortfolioRace((BruteForce, PeterNorvig))
+        portfolio_race.set_search_limits(max_nodes=1000)
+        portfolio_race.solve_sudoku(HARD)
+        self.assertEquals(HARD_SOLVED, portfolio_race.retrieve_grid_basic_format())
+        self.assertEquals("PeterNorvig", portfolio_race.winner)
+
+    def test_race_is_stopped_by_its_time_limit(self):
+        portfolio_race = PortfolioRace((BruteForce,))
+        portfolio_race.set_search_limits(time_limit=0.2)
+        portfolio_race.solve_sudoku(HARD)
+        self.assertTrue(portfolio_race.budget_exceeded)
+        self.assertEquals(HARD, portfolio_race.retrieve_grid_basic_format())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+This module is in charge of testing the measurements reported by the algorithms into the
+SolveMetrics records and the MetricsCollector class.
+"""
+import unittest
+from StringIO import StringIO
+import json
+from ...algorithms.solve_metrics import SolveMetrics, MetricsCollector, collector
+from ...algorithms.brute_force import BruteForce
+from ...algorithms.backtracking import Backtracking
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.dancing_links import DancingLinks
+
+PUZZLE = "100920000524010000000000070050008102000000000402700090060000000000030945000071006"
+
+
+class TestSolveMetrics(unittest.TestCase):
+
+    def test_every_algorithm_reports_its_metrics(self):
+        for algorithm in (BruteForce(), Backtracking(), Backtracking("sequential"),\
+            PeterNorvig(), PeterNorvig("string"), DancingLinks()):
+            algorithm.solve_sudoku(PUZZLE)
+            metrics = algorithm.metrics
+            self.assertEquals(algorithm.__class__.__name__, metrics.algorithm)
+            self.assertEquals(PUZZLE, metrics.puzzle)
+            self.assertTrue(metrics.nodes > 0 and metrics.guesses > 0 and metrics.max_depth > 0)
+            self.assertTrue(metrics.backtracks > 0)
+            self.assertTrue(metrics.elapsed_time >= 0)
+            self.assertFalse(metrics.budget_exceeded)
+
+    def test_propagating_algorithms_count_propagation_steps(self):
+        for algorithm in (PeterNorvig(), PeterNorvig("string"), DancingLinks()):
+            algorithm.solve_sudoku(PUZZLE)
+            self.assertTrue(algorithm.metrics.propagations > 0)
+
+    def test_solves_are_reported_to_the_process_wide_collector(self):
+        collector.reset()
+        peter_norvig = PeterNorvig()
+        peter_norvig.solve_sudoku(PUZZLE)
+        peter_norvig.solve_sudoku(PUZZLE)
+        totals = collector.summary()["PeterNorvig"]
+        self.assertEquals(2, totals["solves"])
+        self.assertEquals(2 * peter_norvig.metrics.nodes, totals["nodes"])
+        self.assertEquals(2, len(collector.records))
+
+    def test_collector_queries_and_dumps_records(self):
+        metrics_collector = MetricsCollector(history=2)
+        for elapsed_time in (0.5, 0.1, 0.3):
+            metrics_collector.record(SolveMetrics("BruteForce", PUZZLE, elapsed_time,\
+                10, 5, 2, 0, 4, False))
+        self.assertEquals([0.3, 0.1], [metrics.elapsed_time for metrics in\
+            metrics_collector.slowest()])
+        self.assertEquals(0.5, metrics_collector.summary()["BruteForce"]["max_elapsed_time"])
+        output = StringIO()
+        metrics_collector.dump(output)
+        dumped = json.loads(output.getvalue())
+        self.assertEquals(3, dumped["summary"]["BruteForce"]["solves"])
+        self.assertEquals(2, len(dumped["records"]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+This module is in charge of testing the corpora, the measurements and the reports of the benchmark.
+"""
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from ...benchmark.benchmark import TIERS, generate_corpora, load_source_corpus, percentile,\
+    run_benchmark, build_report, write_report, compare_results
+from ...algorithms.algorithm_registry import ALGORITHMS, create_algorithm
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.dancing_links import DancingLinks
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_registry_creates_the_algorithms_by_their_settings_name(self):
+        self.assertEquals(["Backtracking", "Peter Norvig", "Brute Force", "Dancing Links",\
+            "Portfolio Race", "Auto"], list(ALGORITHMS.keys()))
+        self.assertIsInstance(create_algorithm("Peter Norvig"), PeterNorvig)
+        self.assertRaises(ValueError, create_algorithm, "Unknown")
+
+    def test_same_seed_generates_the_same_corpora(self):
+        corpora = generate_corpora(7, 3)
+        self.assertEquals(list(TIERS.keys()), list(corpora.keys()))
+        self.assertEquals(corpora, generate_corpora(7, 3))
+        self.assertNotEqual(corpora, generate_corpora(8, 3))
+        for tier, (minimum, maximum) in TIERS.items():
+            self.assertEquals(3, len(corpora[tier]))
+            for puzzle in corpora[tier]:
+                self.assertEquals(81, len(puzzle))
+                self.assertTrue(minimum <= 81 - puzzle.count('0') <= maximum)
+                self.assertEquals(1, DancingLinks().count_solutions(puzzle, 2))
+
+    def test_source_corpus_reads_every_txt_and_csv_file(self):
+        puzzles = load_source_corpus()
+        self.assertEquals(4, len(puzzles))
+        self.assertTrue(all(len(puzzle) == 81 and puzzle.isdigit() for puzzle in puzzles))
+
+    def test_percentile_uses_the_nearest_rank(self):
+        values = range(1, 21)
+        self.assertEquals(10, percentile(values, 0.5))
+        self.assertEquals(19, percentile(values, 0.95))
+        self.assertEquals(1, percentile(values, 0))
+        self.assertEquals(7, percentile([7], 0.95))
+
+    def test_run_benchmark_reports_time_and_nodes_per_tier(self):
+        corpora = {"easy": [EASY, EASY]}
+        results = run_benchmark(corpora, ["Peter Norvig", "Dancing Links"], repetitions=2)
+        self.assertEquals(["Peter Norvig", "Dancing Links"], list(results.keys()))
+        for tiers in results.values():
+            stats = tiers["easy"]
+            self.assertEquals(2, stats["puzzles"])
+            self.assertEquals(2, stats["solved"])
+            self.assertEquals(0, stats["timed_out"])
+            self.assertTrue(stats["time"]["median"] <= stats["time"]["p95"] <= stats["time"]["max"])
+            self.assertTrue(stats["nodes"]["median"] <= stats["nodes"]["max"])
+
+    def test_run_benchmark_counts_the_solves_over_the_time_limit(self):
+        results = run_benchmark({"empty": ["0" * 81]}, ["Brute Force"], repetitions=3,\
+            warmups=0, time_limit=0.0)
+        self.assertEquals(1, results["Brute Force"]["empty"]["timed_out"])
+        self.assertEquals(0, results["Brute Force"]["empty"]["solved"])
+        self.assertIsNone(results["Brute Force"]["empty"]["time"]["median"])
+
+    def test_run_benchmark_does_not_measure_the_failed_solves(self):
+        results = run_benchmark({"mixed": [EASY, "110000000" + "0" * 72, "1" * 81]},\
+            ["Peter Norvig", "Dancing Links"], repetitions=2)
+        for name, tiers in results.items():
+            stats = tiers["mixed"]
+            self.assertEquals((1, 2, 0), (stats["solved"], stats["failed"], stats["timed_out"]))
+            easy_only = run_benchmark({"mixed": [EASY]}, [name], repetitions=2)[name]["mixed"]
+            self.assertEquals(easy_only["nodes"], stats["nodes"])
+
+    def test_compare_results_divides_the_current_median_by_the_baseline(self):
+        directory = tempfile.mkdtemp()
+        try:
+            output = os.path.join(directory, "benchmark.json")
+            results = run_benchmark({"easy": [EASY]}, ["Dancing Links"], repetitions=1)
+            write_report(build_report(results, {"seed": 1}), output)
+            with open(output) as json_file:
+                baseline = json.load(json_file)["results"]
+        finally:
+            shutil.rmtree(directory)
+        rows = compare_results(baseline, results)
+        self.assertEquals(1, len(rows))
+        self.assertEquals(("Dancing Links", "easy"), rows[0][:2])
+        self.assertAlmostEqual(1.0, rows[0][4])
+
+if __name__ == '__main__':
+    unittest.main()
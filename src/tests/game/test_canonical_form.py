@@ -0,0 +1,49 @@
+"""
+This module is in charge of testing the canonical form of a grid under the sudoku symmetries
+computed by the canonical_form function and the GridTransform class.
+"""
+import unittest
+from ...game.canonical_form import canonical_form, GridTransform
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+TRANSFORMS = [GridTransform(False, (0, 1, 2, 3, 4, 5, 6, 7, 8), (0, 1, 2, 3, 4, 5, 6, 7, 8),\
+    (0, 9, 8, 7, 6, 5, 4, 3, 2, 1)),
+    GridTransform(True, (8, 6, 7, 3, 5, 4, 1, 0, 2), (4, 3, 5, 8, 7, 6, 0, 2, 1),\
+    (0, 2, 3, 1, 5, 6, 4, 8, 9, 7)),
+    GridTransform(False, (5, 3, 4, 2, 0, 1, 7, 6, 8), (2, 1, 0, 5, 4, 3, 8, 7, 6),\
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9))]
+
+
+class TestCanonicalForm(unittest.TestCase):
+
+    def test_invalid_grid_is_rejected(self):
+        self.assertRaises(ValueError, canonical_form, "abc123")
+
+    def test_transform_maps_grid_to_canonical_form(self):
+        canonical_grid, transform = canonical_form(HARD)
+        self.assertEquals(canonical_grid, transform.apply(HARD))
+        self.assertEquals(HARD, transform.invert().apply(canonical_grid))
+
+    def test_equivalent_grids_have_the_same_canonical_form(self):
+        canonical_grid = canonical_form(EASY)[0]
+        for transform in TRANSFORMS:
+            self.assertEquals(canonical_grid, canonical_form(transform.apply(EASY))[0])
+
+    def test_different_grids_have_different_canonical_forms(self):
+        self.assertNotEquals(canonical_form(EASY)[0], canonical_form(HARD)[0])
+
+    def test_canonical_solution_is_mapped_back_to_equivalent_puzzle(self):
+        puzzle = TRANSFORMS[1].apply(EASY)
+        canonical_grid, transform = canonical_form(EASY)
+        canonical_solution = transform.apply(EASY_SOLVED)
+        puzzle_transform = canonical_form(puzzle)[1]
+        self.assertEquals(TRANSFORMS[1].apply(EASY_SOLVED),\
+            puzzle_transform.invert().apply(canonical_solution))
+
+    def test_empty_grid_is_its_own_canonical_form(self):
+        self.assertEquals("0" * 81, canonical_form("0" * 81)[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+"""
+This module is in charge of testing the batch resolution of puzzles across several processes
+performed by the ParallelSolver class.
+"""
+import unittest
+from ...game.parallel_solver import ParallelSolver
+from ...game.sudoku_solver import SudokuSolver
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.dancing_links import DancingLinks
+
+PUZZLES = ["003020600900305001001806400008102900700000008006708200002609500800203009005010300",
+    "100920000524010000000000070050008102000000000402700090060000000000030945000071006",
+    "400000805030000000000700000020000060000080400000010000000603070500200000104000000",
+    "110000000" + "0" * 72,
+    "abc123"]
+
+
+class TestParallelSolver(unittest.TestCase):
+
+    def test_parallel_solver_can_be_created_with_no_arguments(self):
+        parallel_solver = ParallelSolver()
+        self.assertIsInstance(parallel_solver, ParallelSolver)
+        self.assertTrue(parallel_solver.workers >= 1)
+
+    def test_invalid_chunk_size_is_rejected(self):
+        self.assertRaises(ValueError, ParallelSolver, PeterNorvig, 2, 0)
+
+    def test_results_are_returned_in_input_order(self):
+        parallel_solver = ParallelSolver(PeterNorvig, workers=2, chunk_size=2)
+        results = list(parallel_solver.solve_many(iter(PUZZLES)))
+        expected = list(SudokuSolver(PeterNorvig()).solve_many(PUZZLES))
+        self.assertEquals([result.puzzle for result in expected], [result.puzzle for result in results])
+        self.assertEquals([result.solution for result in expected],\
+            [result.solution for result in results])
+        self.assertEquals(["solved", "solved", "solved", "unsolved", "invalid"],\
+            [result.status for result in results])
+
+    def test_results_can_be_returned_as_they_complete(self):
+        parallel_solver = ParallelSolver(DancingLinks, workers=2, chunk_size=1)
+        results = list(parallel_solver.solve_many(PUZZLES, ordered=False))
+        self.assertItemsEqual(PUZZLES, [result.puzzle for result in results])
+
+if __name__ == '__main__':
+    unittest.main()
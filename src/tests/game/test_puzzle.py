@@ -0,0 +1,62 @@
+"""
+This module is in charge of testing the compact Puzzle value type and its use by the algorithms
+and the SudokuSolver in place of the long strings.
+"""
+import pickle
+import unittest
+from ...game.puzzle import Puzzle, cell_values
+from ...game.sudoku_solver import SudokuSolver
+from ...game.solution_cache import SolutionCache
+from ...algorithms.backtracking import Backtracking
+from ...algorithms.brute_force import BruteForce
+from ...algorithms.dancing_links import DancingLinks
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.logic_rater import LogicRater
+
+EASY_GRID = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLUTION = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+
+
+class TestPuzzle(unittest.TestCase):
+
+    def test_cells_hold_the_values_of_the_symbols(self):
+        puzzle = Puzzle.from_string(EASY_GRID)
+        self.assertEquals(9, puzzle.size)
+        self.assertEquals(81, len(puzzle))
+        self.assertEquals([0, 0, 3, 0, 2], list(puzzle)[:5])
+        self.assertEquals(32, puzzle.clues())
+        self.assertEquals(EASY_GRID, str(puzzle))
+        self.assertEquals(bytearray([0, 0, 3]), cell_values("00\n3"))
+        self.assertIs(puzzle.cells, cell_values(puzzle))
+
+    def test_larger_boards_use_the_letters(self):
+        puzzle = Puzzle.from_string("1" + "0" * 254 + "G")
+        self.assertEquals((16, 16), (puzzle.size, puzzle[255]))
+        self.assertEquals("G", str(puzzle)[-1])
+        self.assertRaises(ValueError, Puzzle.from_string, "123")
+
+    def test_packed_form_keeps_two_cells_per_byte(self):
+        puzzle = Puzzle.from_string(EASY_GRID)
+        packed = puzzle.packed()
+        self.assertEquals(41, len(packed))
+        self.assertEquals(puzzle, Puzzle.from_packed(packed))
+        self.assertEquals(puzzle, pickle.loads(pickle.dumps(puzzle, 2)))
+        self.assertRaises(ValueError, Puzzle.from_string("0" * 256).packed)
+
+    def test_algorithms_read_the_puzzle_without_parsing(self):
+        for algorithm in (Backtracking(), BruteForce(), DancingLinks(), PeterNorvig()):
+            algorithm.solve_sudoku(Puzzle.from_string(EASY_GRID))
+            self.assertEquals(EASY_SOLUTION, algorithm.retrieve_grid_basic_format())
+        self.assertEquals("Easy", LogicRater().rate(Puzzle.from_string(EASY_GRID)).difficulty)
+
+    def test_solver_keys_the_cache_by_the_long_string(self):
+        cache = SolutionCache()
+        solver = SudokuSolver(PeterNorvig(), cache=cache)
+        result = solver.solve_string_grid(Puzzle.from_string(EASY_GRID))
+        self.assertEquals(EASY_SOLUTION, result.solution)
+        self.assertEquals(EASY_SOLUTION, cache.get(EASY_GRID))
+        results = list(solver.solve_many([Puzzle.from_string(EASY_GRID)]))
+        self.assertEquals(EASY_SOLUTION, results[0].solution)
+
+if __name__ == '__main__':
+    unittest.main()
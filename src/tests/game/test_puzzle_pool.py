@@ -0,0 +1,125 @@
+"""
+This module is in charge of testing the pools of ready puzzles per level kept by the PuzzlePool
+class.
+"""
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from collections import OrderedDict
+from ...game.puzzle_pool import PuzzlePool
+from ...game.sudoku_solver import SudokuSolver
+from ...algorithms.dancing_links import DancingLinks
+from ...algorithms.peter_norvig import PeterNorvig
+from ...algorithms.logic_rater import LogicRater
+
+LEVELS = OrderedDict([("Easy", (36, 41)), ("Medium", (30, 35))])
+
+
+class TestPuzzlePool(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.directory, "puzzle_pool.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assert_valid_entry(self, level, entry):
+        puzzle, solution = entry
+        minimum, maximum = LEVELS[level]
+        self.assertTrue(minimum <= 81 - puzzle.count('0') <= maximum)
+        self.assertEquals(1, DancingLinks().count_solutions(puzzle, 2))
+        self.assertNotIn('0', solution)
+        self.assertTrue(all(char in ('0', digit) for char, digit in zip(puzzle, solution)))
+
+    def test_default_pool_is_under_content_results(self):
+        puzzle_pool = PuzzlePool(LEVELS)
+        self.assertTrue(puzzle_pool.json_absolute_file_path.endswith(\
+            os.path.join("content", "results", "puzzle_pool.json")))
+
+    def test_refill_tops_up_every_level_and_pop_takes_a_ready_puzzle(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=2, seed=1)
+        puzzle_pool.refill()
+        self.assertEquals(4, len(puzzle_pool))
+        entry = puzzle_pool.pop("Medium")
+        self.assert_valid_entry("Medium", entry)
+        self.assertEquals(1, puzzle_pool.size("Medium"))
+        self.assertRaises(ValueError, puzzle_pool.pop, "Unknown")
+
+    def test_empty_pool_generates_the_puzzle_on_the_spot(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, seed=2)
+        self.assert_valid_entry("Easy", puzzle_pool.pop("Easy"))
+        self.assertEquals(0, len(puzzle_pool))
+
+    def test_levels_named_after_a_difficulty_are_graded(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=1, time_limit=None, seed=1)
+        puzzle_pool.refill()
+        for level in LEVELS:
+            entry = puzzle_pool.pop(level)
+            self.assert_valid_entry(level, entry)
+            self.assertEquals(level, LogicRater().rate(entry[0]).difficulty)
+
+    def test_pools_persist_between_runs(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=2, seed=3)
+        puzzle_pool.refill()
+        entry = puzzle_pool.pop("Easy")
+        second_pool = PuzzlePool(LEVELS, self.json_path, capacity=2)
+        self.assertEquals(3, len(second_pool))
+        self.assertNotEquals(entry, second_pool.pop("Easy"))
+
+    def test_puzzles_out_of_the_new_levels_are_dropped(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=2, seed=4)
+        puzzle_pool.refill()
+        puzzle_pool.set_levels({"Easy": (36, 41), "Hard": (24, 29)})
+        self.assertEquals(2, puzzle_pool.size("Easy"))
+        self.assertEquals(0, puzzle_pool.size("Medium"))
+        self.assertEquals(0, puzzle_pool.size("Hard"))
+
+    def test_background_thread_keeps_the_pools_topped_up(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=2, seed=5)
+        puzzle_pool.start()
+        try:
+            deadline = time.time() + 30
+            while len(puzzle_pool) < 4 and time.time() < deadline:
+                time.sleep(0.05)
+            self.assertEquals(4, len(puzzle_pool))
+            puzzle_pool.pop("Easy")
+            while len(puzzle_pool) < 4 and time.time() < deadline:
+                time.sleep(0.05)
+            self.assertEquals(2, puzzle_pool.size("Easy"))
+        finally:
+            puzzle_pool.stop()
+        self.assertIsNone(puzzle_pool.worker)
+
+    def test_levels_out_of_reach_of_the_builder_are_no_longer_refilled(self):
+        puzzle_pool = PuzzlePool({"Custom": (12, 15)}, self.json_path, time_limit=0.2, seed=7,\
+            max_misses=2)
+        puzzle_pool.refill()
+        self.assertEquals(0, len(puzzle_pool))
+        self.assertEquals(2, puzzle_pool.misses["Custom"])
+        self.assertIsNone(puzzle_pool.next_level())
+        self.assertFalse(puzzle_pool.fill_next())
+        puzzle_pool.start()
+        try:
+            time.sleep(0.5)
+            self.assertEquals(2, puzzle_pool.misses["Custom"])
+        finally:
+            puzzle_pool.stop(5)
+        puzzle_pool.set_levels({"Custom": (36, 41)})
+        self.assertEquals("Custom", puzzle_pool.next_level())
+
+    def test_solver_takes_the_solution_kept_by_the_pool(self):
+        puzzle_pool = PuzzlePool(LEVELS, self.json_path, capacity=1, seed=6)
+        puzzle_pool.refill()
+        solver = SudokuSolver(PeterNorvig())
+        solver.solve_sudoku_from_puzzle_pool(puzzle_pool, "Easy")
+        self.assertIsNone(solver.last_metrics)
+        self.assert_valid_entry("Easy", (solver.string_grid, solver.string_grid_resolved))
+        solver.solve_sudoku_from_puzzle_pool(puzzle_pool, "Medium", resolve=True)
+        self.assertEquals("PeterNorvig", solver.last_metrics.algorithm)
+        self.assert_valid_entry("Medium", (solver.string_grid, solver.string_grid_resolved))
+
+if __name__ == '__main__':
+    unittest.main()
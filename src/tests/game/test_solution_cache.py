@@ -0,0 +1,72 @@
+"""
+This module is in charge of testing the least recently used cache of puzzle solutions
+performed by the SolutionCache class.
+"""
+import unittest
+from ...game.solution_cache import SolutionCache
+from ...game.canonical_form import GridTransform
+from ...game.sudoku_solver import SudokuSolver
+from ...algorithms.peter_norvig import PeterNorvig
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+
+
+class TestSolutionCache(unittest.TestCase):
+
+    def test_invalid_capacity_is_rejected(self):
+        self.assertRaises(ValueError, SolutionCache, 0)
+
+    def test_hits_and_misses_are_counted(self):
+        cache = SolutionCache(4)
+        self.assertIsNone(cache.get(EASY))
+        cache.put(EASY, EASY_SOLVED)
+        self.assertEquals(EASY_SOLVED, cache.get(EASY))
+        statistics = cache.statistics()
+        self.assertEquals((1, 1, 1, 0), (statistics["size"], statistics["hits"],\
+            statistics["misses"], statistics["evictions"]))
+
+    def test_least_recently_used_puzzle_is_evicted(self):
+        cache = SolutionCache(2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertEquals(1, cache.evictions)
+
+    def test_byte_size_limit_evicts_puzzles(self):
+        entry_size = SolutionCache().entry_size(EASY, EASY_SOLVED)
+        cache = SolutionCache(10, max_bytes=entry_size + 1)
+        cache.put(EASY, EASY_SOLVED)
+        cache.put(HARD, HARD_SOLVED)
+        self.assertEquals([HARD], list(cache.entries))
+        self.assertEquals(entry_size, cache.current_bytes)
+
+    def test_solver_uses_cache_before_running_the_algorithm(self):
+        cache = SolutionCache()
+        solver = SudokuSolver(PeterNorvig(), cache)
+        results = list(solver.solve_many([HARD, HARD, EASY]))
+        self.assertEquals([HARD_SOLVED, HARD_SOLVED, EASY_SOLVED],\
+            [result.solution for result in results])
+        self.assertEquals((1, 2), (cache.hits, cache.misses))
+
+    def test_canonical_cache_shares_equivalent_puzzles(self):
+        cache = SolutionCache(canonical=True)
+        cache.put(EASY, EASY_SOLVED)
+        transform = GridTransform(True, (2, 1, 0, 3, 4, 5, 8, 6, 7), (3, 4, 5, 0, 1, 2, 6, 7, 8),\
+            (0, 5, 6, 7, 8, 9, 1, 2, 3, 4))
+        self.assertEquals(transform.apply(EASY_SOLVED), cache.get(transform.apply(EASY)))
+        self.assertEquals((1, 1), (len(cache), cache.hits))
+
+    def test_solver_does_not_cache_unsolved_puzzles(self):
+        cache = SolutionCache()
+        solver = SudokuSolver(PeterNorvig(), cache)
+        solver.solve_string_grid("110000000" + "0" * 72)
+        self.assertEquals(0, len(cache))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+This module is in charge of testing the persistent storage of puzzle solutions performed by the
+SolutionStore class.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from ...game.solution_store import SolutionStore
+from ...game.sudoku_solver import SudokuSolver
+from ...game.parallel_solver import ParallelSolver
+from ...algorithms.peter_norvig import PeterNorvig
+
+EASY = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_SOLVED = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+HARD = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+HARD_SOLVED = "417369825632158947958724316825437169791586432346912758289643571573291684164875293"
+
+
+class TestSolutionStore(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "solutions.db")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_default_store_is_under_content_results(self):
+        store = SolutionStore()
+        self.assertTrue(store.db_absolute_file_path.endswith(\
+            os.path.join("content", "results", "solutions.db")))
+
+    def test_solutions_persist_across_stores(self):
+        store = SolutionStore(self.db_path)
+        self.assertIsNone(store.get(EASY))
+        store.put(EASY, EASY_SOLVED, "PeterNorvig", 0.5)
+        store.close()
+        record = SolutionStore(self.db_path).get_record(EASY)
+        self.assertEquals(EASY_SOLVED, record["solution"])
+        self.assertEquals("PeterNorvig", record["algorithm"])
+        self.assertEquals(0.5, record["elapsed_time"])
+
+    def test_first_solution_stored_is_kept(self):
+        store = SolutionStore(self.db_path)
+        store.put(EASY, EASY_SOLVED, "PeterNorvig")
+        store.put(EASY, HARD_SOLVED, "BruteForce")
+        self.assertEquals(1, len(store))
+        self.assertEquals(EASY_SOLVED, store.get(EASY))
+
+    def test_solver_records_solutions_with_algorithm_name(self):
+        solver = SudokuSolver(PeterNorvig(), store=SolutionStore(self.db_path))
+        solver.solve_string_grid(HARD)
+        solver.solve_string_grid("110000000" + "0" * 72)
+        store = SolutionStore(self.db_path)
+        self.assertEquals(1, len(store))
+        self.assertEquals("PeterNorvig", store.get_record(HARD)["algorithm"])
+
+    def test_solver_does_not_record_grids_breaking_the_rules(self):
+        store = SolutionStore(self.db_path)
+        store.put(EASY, HARD_SOLVED)
+        solver = SudokuSolver(PeterNorvig(), store=store)
+        results = list(solver.solve_many(["1" * 81, "123456789" * 9, EASY]))
+        self.assertEquals(["invalid", "invalid", "solved"], [result.status for result in results])
+        self.assertEquals(EASY_SOLVED, results[2].solution)
+        self.assertEquals(1, len(store))
+
+    def test_solver_reads_stored_solutions(self):
+        SolutionStore(self.db_path).put(EASY, EASY_SOLVED)
+        solver = SudokuSolver(PeterNorvig(), store=SolutionStore(self.db_path))
+        self.assertEquals(EASY_SOLVED, solver.solve_string_grid(EASY).solution)
+
+    def test_worker_processes_share_the_store(self):
+        parallel_solver = ParallelSolver(PeterNorvig, workers=2, chunk_size=1,\
+            store_path=self.db_path)
+        results = list(parallel_solver.solve_many([EASY, HARD, EASY, HARD]))
+        self.assertEquals([EASY_SOLVED, HARD_SOLVED] * 2, [result.solution for result in results])
+        self.assertEquals(2, len(SolutionStore(self.db_path)))
+
+if __name__ == '__main__':
+    unittest.main()
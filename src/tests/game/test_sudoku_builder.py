@@ -4,6 +4,8 @@ performed by the SudokuBuilder class.
 """
 import unittest
 from ...game.sudoku_builder import SudokuBuilder
+from ...algorithms.logic_rater import LogicRater
+from ...algorithms.dancing_links import DancingLinks
 
 
 class TestSudokuBuilder(unittest.TestCase):
@@ -32,5 +34,106 @@ class TestSudokuBuilder(unittest.TestCase):
         actual_result = builder.shuffled(expected_result)
         self.assertItemsEqual(expected_result, actual_result)
 
+    def test_sudoku_builder_with_seed_generates_the_same_grids(self):
+        first_builder, second_builder = SudokuBuilder(30, seed=7), SudokuBuilder(30, seed=7)
+        first_grids = [first_builder.build_random_grid() for _ in range(3)]
+        self.assertEquals(first_grids, [second_builder.build_random_grid() for _ in range(3)])
+
+    def test_sudoku_builder_builds_grids_graded_with_the_target_difficulty(self):
+        builder = SudokuBuilder(30, seed=3)
+        for difficulty in ("Easy", "Medium"):
+            generated_string = builder.build_graded_grid(difficulty)
+            self.assertEquals(difficulty, LogicRater().rate(generated_string).difficulty)
+            self.assertGreaterEqual(81 - 30, generated_string.count('0'))
+        generated_string = SudokuBuilder(30, seed=43).build_graded_grid("Hard")
+        self.assertEquals("Hard", LogicRater().rate(generated_string).difficulty)
+        self.assertGreaterEqual(81 - 30, generated_string.count('0'))
+
+    def test_graded_grids_give_the_hardest_attempt_within_the_time_limit(self):
+        builder = SudokuBuilder(24, seed=0)
+        generated_string, solution = builder.build_graded_puzzle("Hard", time_limit=0.5)
+        rating = LogicRater().rate(generated_string)
+        self.assertTrue(rating.solved)
+        self.assertIn(rating.difficulty, ("Easy", "Medium"))
+        self.assertEquals(builder.stats.clues, 81 - generated_string.count('0'))
+        self.assertTrue(builder.stats.budget_exceeded)
+        self.assertTrue(builder.stats.elapsed_time < 1.5)
+        self.assertTrue(all(char in ('0', digit) for char, digit in zip(generated_string, solution)))
+        builder.build_graded_grid("Hard", time_limit=0)
+        self.assertEquals(1, builder.stats.attempts)
+        self.assertRaises(ValueError, builder.build_graded_grid, "Hard", None, 0)
+
+    def test_levels_named_after_a_difficulty_are_graded(self):
+        builder = SudokuBuilder(32, seed=1)
+        generated_string, solution = builder.build_level_puzzle("Medium", time_limit=2.0)
+        self.assertEquals("Medium", LogicRater().rate(generated_string).difficulty)
+        self.assertEquals([solution], list(DancingLinks().iter_solutions(generated_string)))
+        generated_string = builder.build_level_puzzle("Custom")[0]
+        self.assertEquals(32, 81 - generated_string.count('0'))
+        self.assertEquals(1, DancingLinks().count_solutions(generated_string, 2))
+
+    def test_sudoku_builder_generates_grids_of_other_board_sizes(self):
+        builder = SudokuBuilder(100, seed=5, size=16)
+        generated_string = builder.build_random_grid()
+        self.assertEquals(256, len(generated_string))
+        self.assertGreaterEqual(256 - 100, generated_string.count('0'))
+        self.assertTrue(set(generated_string) <= set("0123456789ABCDEFG"))
+
+    def test_sudoku_builder_builds_random_puzzles_with_a_solution(self):
+        builder = SudokuBuilder(25, seed=4)
+        for _ in range(5):
+            puzzle, solution = builder.build_random_puzzle()
+            self.assertGreaterEqual(81 - 25, puzzle.count('0'))
+            self.assertEquals(0, solution.count('0'))
+            self.assertTrue(all(char in ('0', digit) for char, digit in zip(puzzle, solution)))
+            self.assertIn(solution, DancingLinks().iter_solutions(puzzle))
+
+    def test_sudoku_builder_counts_the_singletons_while_propagating(self):
+        builder = SudokuBuilder(30, seed=8)
+        values = builder.propagate_random_grid()
+        singletons = [values[square_pos] for square_pos in builder.grid.squares\
+            if len(values[square_pos]) == 1]
+        self.assertEquals(len(singletons), builder.singletons)
+        self.assertEquals(len(set(singletons)), len(builder.singleton_digits))
+        self.assertGreaterEqual(builder.singletons, 30)
+
+    def test_sudoku_builder_builds_grids_with_a_single_solution(self):
+        builder = SudokuBuilder(30, seed=11)
+        generated_string, solution = builder.build_unique_puzzle()
+        self.assertEquals(30, 81 - generated_string.count('0'))
+        self.assertEquals([solution], list(DancingLinks().iter_solutions(generated_string)))
+        self.assertEquals(1, DancingLinks().count_solutions(generated_string, 2))
+        self.assertEquals(1, builder.stats.attempts)
+        self.assertEquals(30, builder.stats.clues)
+        self.assertFalse(builder.stats.budget_exceeded)
+
+    def test_sudoku_builder_keeps_the_fewest_clues_when_the_target_is_not_reached(self):
+        builder = SudokuBuilder(0, seed=11, size=4)
+        generated_string = builder.build_unique_grid(max_attempts=3)
+        self.assertEquals(3, builder.stats.attempts)
+        self.assertEquals(builder.stats.clues, 16 - generated_string.count('0'))
+        self.assertEquals(1, DancingLinks().count_solutions(generated_string, 2))
+
+    def test_sudoku_builder_stops_digging_at_its_time_limit(self):
+        builder = SudokuBuilder(0, seed=11, size=16)
+        generated_string = builder.build_unique_grid(time_limit=0.2)
+        self.assertTrue(builder.stats.budget_exceeded)
+        self.assertTrue(builder.stats.elapsed_time < 2)
+        self.assertEquals(1, DancingLinks().count_solutions(generated_string, 2))
+
+    def test_sudoku_builder_builds_valid_solution_grids(self):
+        builder = SudokuBuilder(0, seed=2, size=16)
+        solution = builder.build_solution_grid()
+        for unit in builder.grid.unitlist:
+            values = [solution[builder.grid.squares.index(square)] for square in unit]
+            self.assertEquals(sorted(builder.grid.digits), sorted(values))
+
+    def test_sudoku_builder_rejects_unknown_difficulties(self):
+        self.assertRaises(ValueError, SudokuBuilder(30).build_graded_grid, "Expert")
+
+    def test_sudoku_builder_needs_one_attempt_at_least(self):
+        self.assertRaises(ValueError, SudokuBuilder(30).build_unique_puzzle, max_attempts=0)
+        self.assertRaises(ValueError, SudokuBuilder(30).build_unique_grid, None, -1)
+
 if __name__ == '__main__':
     unittest.main()
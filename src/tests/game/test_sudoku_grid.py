@@ -3,7 +3,7 @@ This module is in charge of testing the different types of Grid for the Sudoku20
 performed by the SudokuGrid class.
 """
 import unittest
-from ...game.sudoku_grid import SudokuGrid
+from ...game.sudoku_grid import SudokuGrid, board_size
 
 
 class TestSudokuGrid(unittest.TestCase):
@@ -58,5 +58,31 @@ class TestSudokuGrid(unittest.TestCase):
         grid.load_grid_values(s_grid)
         self.assertEquals(expected_result, grid.display_2D_grid())
 
+    def test_16x16_grid_has_symbols_units_and_peers_of_its_size(self):
+        grid = SudokuGrid(16)
+        self.assertEquals("123456789ABCDEFG", grid.digits)
+        self.assertEquals(256, len(grid.squares))
+        self.assertEquals(48, len(grid.unitlist))
+        self.assertEquals(3 * 15 - 6, len(grid.peers['A1']))
+        self.assertTrue(all(len(unit) == 16 for unit in grid.unitlist))
+
+    def test_4x4_2D_formatting(self):
+        grid = SudokuGrid(4)
+        grid.load_grid_values("1234341221434321")
+        expected_result = "1 2 |3 4 \n3 4 |1 2 \n----+----\n2 1 |4 3 \n4 3 |2 1 \n"
+        self.assertEquals(expected_result, grid.display_2D_grid())
+        self.assertEquals("\n1234\n3412\n2143\n4321\n", grid.display_simple_grid())
+
+    def test_unsupported_board_size_raises_value_error(self):
+        self.assertRaises(ValueError, SudokuGrid, 10)
+
+    def test_board_size_is_taken_from_the_length_and_symbols(self):
+        self.assertEquals(9, board_size("0" * 81))
+        self.assertEquals(16, board_size("G" + "0" * 255))
+        self.assertEquals(25, board_size("P" * 625))
+        self.assertEquals(None, board_size("A" + "0" * 80))
+        self.assertEquals(None, board_size("0" * 80))
+        self.assertEquals(None, board_size("H" + "0" * 255))
+
 if __name__ == '__main__':
     unittest.main()
@@ -4,10 +4,12 @@ performed by the SudokuSolver class.
 """
 import unittest
 from ...game.sudoku_solver import SudokuSolver
+from ...game.solution_cache import SolutionCache
 from ...algorithms.algorithm import Algorithm
 from ...algorithms.brute_force import BruteForce
 from ...algorithms.peter_norvig import PeterNorvig
 from ...algorithms.backtracking import Backtracking
+from ...algorithms.dancing_links import DancingLinks
 
 
 class TestSudokuSolver(unittest.TestCase):
@@ -27,6 +29,15 @@ class TestSudokuSolver(unittest.TestCase):
         print (solver.display_grid_result_with_format("2D"))
         self.assertEquals(0, solver.string_grid_resolved.count('0'))
 
+    def test_solver_keeps_the_solution_of_the_generated_grid(self):
+        solver = SudokuSolver(BruteForce())
+        solver.solve_sudoku_from_grid_generated(30)
+        self.assertIsNone(solver.last_metrics)
+        self.assertEquals(0, solver.string_grid_resolved.count('0'))
+        self.assertTrue(all(char in ('0', digit) for char, digit in\
+            zip(solver.string_grid, solver.string_grid_resolved)))
+        self.assertEquals([solver.string_grid_resolved], list(solver.iter_solutions(solver.string_grid)))
+
     def test_solver_for_TXT_files_is_working_fine(self):
         solver = SudokuSolver(Backtracking())
         solver.solve_sudoku_from_txt_file("content/sources/file_t_001.txt")
@@ -58,5 +69,102 @@ class TestSudokuSolver(unittest.TestCase):
         self.assertFalse(bool(solver.is_string_grid_valid()))
 
 
+    def test_uniqueness_is_answered_with_any_algorithm(self):
+        solver = SudokuSolver(BruteForce())
+        string = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+        self.assertTrue(solver.has_unique_solution(string))
+        self.assertFalse(solver.has_unique_solution('000020007000340800201070090548000070720564000000090240072000014800003000605017000'))
+        self.assertEquals(3, solver.count_solutions("0" * 81, limit=3))
+
+    def test_solutions_are_iterated_with_the_algorithm_stored(self):
+        solver = SudokuSolver(PeterNorvig())
+        solutions = list(solver.iter_solutions('000020007000340800201070090548000070720564000000090240072000014800003000605017000'))
+        self.assertEquals(2, len(solutions))
+        self.assertIs(solver.algorithm, solver.retrieve_enumerator())
+
+    def test_iterating_solutions_of_an_invalid_string_raises_exception(self):
+        solver = SudokuSolver()
+        self.assertRaises(ValueError, solver.iter_solutions, "abc123")
+
+    def test_many_puzzles_are_solved_as_a_stream_of_records(self):
+        solver = SudokuSolver(PeterNorvig())
+        puzzles = ["003020600900305001001806400008102900700000008006708200002609500800203009005010300\n",
+            "110000000" + "0" * 72, "abc123"]
+        results = list(solver.solve_many(iter(puzzles)))
+        self.assertEquals(3, len(results))
+        expect = "483921657967345821251876493548132976729564138136798245372689514814253769695417382"
+        self.assertEquals(expect, results[0].solution)
+        self.assertEquals(puzzles[0].strip(), results[0].puzzle)
+        self.assertEquals("solved", results[0].status)
+        self.assertEquals("unsolved", results[1].status)
+        self.assertEquals("invalid", results[2].status)
+        self.assertIsNone(results[2].solution)
+        self.assertEquals("PeterNorvig", results[0].metrics.algorithm)
+        self.assertIsNone(results[2].metrics)
+
+    def test_unsolvable_puzzles_are_reported_by_every_algorithm(self):
+        for algorithm in (BruteForce(), Backtracking(), PeterNorvig()):
+            solver = SudokuSolver(algorithm)
+            result = next(solver.solve_many(["110000000" + "0" * 72]))
+            self.assertEquals("unsolved", result.status)
+
+    def test_complete_grids_breaking_the_rules_are_invalid(self):
+        for algorithm in (BruteForce(), Backtracking(), PeterNorvig(), DancingLinks()):
+            cache = SolutionCache()
+            solver = SudokuSolver(algorithm, cache=cache)
+            results = list(solver.solve_many(["1" * 81, "123456789" * 9]))
+            self.assertEquals(["invalid", "invalid"], [result.status for result in results])
+            self.assertIsNone(cache.get("1" * 81))
+            self.assertIsNone(cache.get("123456789" * 9))
+
+    def test_node_budget_stops_every_algorithm(self):
+        puzzle = "100920000524010000000000070050008102000000000402700090060000000000030945000071006"
+        for algorithm in (BruteForce(), Backtracking(), PeterNorvig(), PeterNorvig("string"),\
+            DancingLinks()):
+            algorithm.set_search_limits(max_nodes=3)
+            solver = SudokuSolver(algorithm)
+            result = next(solver.solve_many([puzzle]))
+            self.assertEquals("budget_exceeded", result.status)
+            self.assertEquals(puzzle, result.solution)
+            self.assertEquals(4, algorithm.search_metrics().nodes)
+            algorithm.set_search_limits()
+            self.assertEquals("solved", next(solver.solve_many([puzzle])).status)
+
+    def test_deadline_stops_a_long_search(self):
+        hard = "400000805030000000000700000020000060000080400000010000000603070500200000104000000"
+        algorithm = Backtracking("sequential")
+        algorithm.set_search_limits(time_limit=0.2)
+        result = next(SudokuSolver(algorithm).solve_many([hard]))
+        self.assertEquals("budget_exceeded", result.status)
+        self.assertTrue(result.elapsed_time < 5)
+        self.assertTrue(algorithm.search_metrics().budget_exceeded)
+
+    def test_status_of_the_last_puzzle_is_given_by_its_solution_and_metrics(self):
+        algorithm = PeterNorvig()
+        solver = SudokuSolver(algorithm)
+        solver.solve_sudoku_from_string_provided("110000000" + "0" * 72)
+        self.assertEquals("unsolved", solver.solution_status(solver.string_grid_resolved,\
+            solver.string_grid))
+        algorithm.set_search_limits(max_nodes=3)
+        solver.solve_sudoku_from_string_provided(\
+            "100920000524010000000000070050008102000000000402700090060000000000030945000071006")
+        self.assertEquals("budget_exceeded", solver.solution_status(solver.string_grid_resolved,\
+            solver.string_grid))
+        solver.solve_sudoku_from_string_provided("abc123")
+        self.assertIsNone(solver.last_metrics)
+        self.assertEquals("invalid", solver.solution_status(solver.string_grid_resolved,\
+            solver.string_grid))
+
+    def test_larger_boards_are_solved_with_dancing_links(self):
+        solver = SudokuSolver(BruteForce())
+        solver.solve_sudoku_from_grid_generated(120, size=16, resolve=True)
+        self.assertEquals(256, len(solver.string_grid_resolved))
+        self.assertEquals(0, solver.string_grid_resolved.count('0'))
+        self.assertEquals("DancingLinks", solver.last_metrics.algorithm)
+        self.assertEquals(16, solver.sudoku_grid.size)
+        result = solver.solve_string_grid("1000001000020000")
+        self.assertEquals("solved", result.status)
+        self.assertEquals(1, solver.count_solutions("1234341221434321"))
+
 if __name__ == '__main__':
     unittest.main()
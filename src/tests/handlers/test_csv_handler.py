@@ -3,9 +3,13 @@ This module is in charge of testing the basic I/O functionality required to load
 and save properly the CSV files for the Sudoku2015-C game
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from ...handlers.csv_handler import CSVHandler
+from ...handlers.puzzle_reader import PuzzleFormatError
 
 class TestCSVHandler(unittest.TestCase):
 
@@ -28,6 +32,20 @@ class TestCSVHandler(unittest.TestCase):
         actual_result = csv.retrieve_csv_grid()
         self.assertEquals(expect, actual_result)
 
+    def test_handler_streams_every_puzzle_of_a_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "puzzles.csv")
+            expect = '003020600900305001001806400008102900700000008006708200002609500800203009005010300'
+            with open(path, "w") as csv_opened:
+                csv_opened.write("%s\n%s\n1,2,3,4\n" % (",".join(expect), ",".join(expect)))
+            errors = []
+            self.assertEquals([expect, expect], list(CSVHandler().iter_puzzles(path, errors)))
+            self.assertEquals([3], [error.line_number for error in errors])
+            self.assertRaises(PuzzleFormatError, list, CSVHandler().iter_puzzles(path))
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == '__main__':
         unittest.main()
@@ -0,0 +1,59 @@
+"""
+This module is in charge of testing the line by line reader of the files holding many puzzles
+shared by the TXT and CSV handlers.
+"""
+import itertools
+import unittest
+from ...handlers.puzzle_reader import read_puzzles, PuzzleFormatError
+
+EASY_GRID = "003020600900305001001806400008102900700000008006708200002609500800203009005010300"
+EASY_ROWS = [EASY_GRID[index:index + 9] + "\n" for index in range(0, 81, 9)]
+
+
+class TestPuzzleReader(unittest.TestCase):
+
+    def test_lines_and_blocks_can_be_mixed_with_comments(self):
+        lines = ["# Easy puzzles\n", EASY_GRID + "\n", "\n", EASY_GRID.replace("0", ".") + "\n"]\
+            + EASY_ROWS + ["   # 9 lines with the boxes drawn\n"]\
+            + [" ".join(row[:3]) + " | " + " ".join(row[3:6]) + " | " + " ".join(row[6:])\
+            for row in EASY_ROWS]
+        lines.insert(-3, "------+-------+------\n")
+        self.assertEquals([EASY_GRID] * 4, list(read_puzzles(lines)))
+
+    def test_larger_boards_are_read_by_their_length(self):
+        puzzle = "G" + "0" * 254 + "1"
+        block = [puzzle[index:index + 16] for index in range(0, 256, 16)]
+        self.assertEquals([puzzle, puzzle, "1000000000000004"],\
+            list(read_puzzles([puzzle] + block + ["1000", "0000", "0000", "0004"])))
+
+    def test_csv_separators_are_skipped(self):
+        lines = [",".join(EASY_GRID) + "\r\n"] + [",".join(row) for row in EASY_ROWS]
+        self.assertEquals([EASY_GRID] * 2, list(read_puzzles(lines, ",")))
+
+    def test_malformed_records_are_reported_with_their_line_number(self):
+        lines = ["# corpus\n", EASY_GRID[:80] + "x\n", "12345\n"] + EASY_ROWS[:8] + ["\n"]\
+            + EASY_ROWS[:2] + [EASY_GRID + "\n"] + EASY_ROWS[3:] + [EASY_GRID]
+        errors = []
+        self.assertEquals([EASY_GRID] * 2, list(read_puzzles(lines, errors=errors)))
+        self.assertEquals([2, 3, 4, 13, 16], [error.line_number for error in errors])
+        self.assertEquals("Line 4: 8 rows in a block of 9", str(errors[2]))
+        self.assertEquals("2 rows in a block of 9", errors[3].reason)
+        try:
+            list(read_puzzles(lines))
+            self.fail("The malformed record should be raised")
+        except PuzzleFormatError as error:
+            self.assertEquals(2, error.line_number)
+
+    def test_a_stray_row_does_not_swallow_the_puzzles_that_follow(self):
+        errors = []
+        puzzles = list(read_puzzles(["12345678x\n"] + [EASY_GRID + "\n"] * 12, errors=errors))
+        self.assertEquals([EASY_GRID] * 12, puzzles)
+        self.assertEquals(["Line 1: 1 rows in a block of 9"], [str(error) for error in errors])
+
+    def test_puzzles_are_read_one_at_a_time(self):
+        lines = itertools.cycle([EASY_GRID + "\n"])
+        puzzles = read_puzzles(lines)
+        self.assertEquals([EASY_GRID] * 3, list(itertools.islice(puzzles, 3)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,9 +3,13 @@ This module is in charge of testing the basic I/O functionality required to load
 and save properly the TXT files for the Sudoku2015-C game
 """
 
+import os
+import shutil
+import tempfile
 import unittest
 
 from ...handlers.txt_handler import TXTHandler
+from ...handlers.puzzle_reader import PuzzleFormatError
 
 class TestTXTHandler(unittest.TestCase):
 
@@ -28,6 +32,21 @@ class TestTXTHandler(unittest.TestCase):
         actual_result = txt.retrieve_txt_grid()
         self.assertEquals(expect, actual_result)
 
+    def test_handler_streams_every_puzzle_of_a_file(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "puzzles.txt")
+            expect = '003020600900305001001806400008102900700000008006708200002609500800203009005010300'
+            with open(path, "w") as txt_opened:
+                txt_opened.write("# two puzzles\n%s\n\n%s\n1234\n" %\
+                    (expect, expect.replace("0", ".")))
+            errors = []
+            self.assertEquals([expect, expect], list(TXTHandler().iter_puzzles(path, errors)))
+            self.assertEquals([5], [error.line_number for error in errors])
+            self.assertRaises(PuzzleFormatError, list, TXTHandler().iter_puzzles(path))
+        finally:
+            shutil.rmtree(directory)
+
 
 if __name__ == '__main__':
         unittest.main()
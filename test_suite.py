@@ -4,29 +4,62 @@ from src.settings import settings
 from src.tests.handlers.test_xml_handler import TestXMLHandler
 from src.tests.handlers.test_txt_handler import TestTXTHandler
 from src.tests.handlers.test_csv_handler import TestCSVHandler
+from src.tests.handlers.test_puzzle_reader import TestPuzzleReader
 from src.tests.game.test_sudoku_builder import TestSudokuBuilder
 from src.tests.game.test_sudoku_grid import TestSudokuGrid
 from src.tests.game.test_sudoku_solver import TestSudokuSolver
+from src.tests.game.test_parallel_solver import TestParallelSolver
+from src.tests.game.test_solution_cache import TestSolutionCache
+from src.tests.game.test_canonical_form import TestCanonicalForm
+from src.tests.game.test_solution_store import TestSolutionStore
+from src.tests.game.test_puzzle_pool import TestPuzzlePool
+from src.tests.game.test_puzzle import TestPuzzle
 from src.tests.algorithms.test_algorithm import TestAlgorithm
 from src.tests.algorithms.test_brute_force import TestBruteForce
 from src.tests.algorithms.test_peter_norvig import TestPeterNorvig
 from src.tests.algorithms.test_backtracking import TestBacktracking
+from src.tests.algorithms.test_dancing_links import TestDancingLinks
+from src.tests.algorithms.test_numpy_batch import TestNumPyBatchSolver
+from src.tests.algorithms.test_solve_metrics import TestSolveMetrics
+from src.tests.algorithms.test_portfolio_race import TestPortfolioRace
+from src.tests.algorithms.test_auto_select import TestAutoSelect
+from src.tests.algorithms.test_logic_rater import TestLogicRater
+from src.tests.algorithms.test_board_topology import TestBoardTopology
+from src.tests.benchmark.test_benchmark import TestBenchmark
 
 settings.init()
 
 xml_suite = unittest.TestLoader().loadTestsFromTestCase(TestXMLHandler)
 txt_suite = unittest.TestLoader().loadTestsFromTestCase(TestTXTHandler)
 csv_suite = unittest.TestLoader().loadTestsFromTestCase(TestCSVHandler)
+puzzle_reader_suite = unittest.TestLoader().loadTestsFromTestCase(TestPuzzleReader)
 sudoku_builder_suite = unittest.TestLoader().loadTestsFromTestCase(TestSudokuBuilder)
 sudoku_grid_suite = unittest.TestLoader().loadTestsFromTestCase(TestSudokuGrid)
 sudoku_solver_suite = unittest.TestLoader().loadTestsFromTestCase(TestSudokuSolver)
+parallel_solver_suite = unittest.TestLoader().loadTestsFromTestCase(TestParallelSolver)
+solution_cache_suite = unittest.TestLoader().loadTestsFromTestCase(TestSolutionCache)
+canonical_form_suite = unittest.TestLoader().loadTestsFromTestCase(TestCanonicalForm)
+solution_store_suite = unittest.TestLoader().loadTestsFromTestCase(TestSolutionStore)
+puzzle_pool_suite = unittest.TestLoader().loadTestsFromTestCase(TestPuzzlePool)
+puzzle_suite = unittest.TestLoader().loadTestsFromTestCase(TestPuzzle)
 algorithm_suite = unittest.TestLoader().loadTestsFromTestCase(TestAlgorithm)
 brute_force_suite = unittest.TestLoader().loadTestsFromTestCase(TestBruteForce)
 peter_norvig_suite = unittest.TestLoader().loadTestsFromTestCase(TestPeterNorvig)
 backtracking_suite = unittest.TestLoader().loadTestsFromTestCase(TestBacktracking)
+dancing_links_suite = unittest.TestLoader().loadTestsFromTestCase(TestDancingLinks)
+numpy_batch_suite = unittest.TestLoader().loadTestsFromTestCase(TestNumPyBatchSolver)
+solve_metrics_suite = unittest.TestLoader().loadTestsFromTestCase(TestSolveMetrics)
+portfolio_race_suite = unittest.TestLoader().loadTestsFromTestCase(TestPortfolioRace)
+auto_select_suite = unittest.TestLoader().loadTestsFromTestCase(TestAutoSelect)
+logic_rater_suite = unittest.TestLoader().loadTestsFromTestCase(TestLogicRater)
+board_topology_suite = unittest.TestLoader().loadTestsFromTestCase(TestBoardTopology)
+benchmark_suite = unittest.TestLoader().loadTestsFromTestCase(TestBenchmark)
 
-alltests = unittest.TestSuite([xml_suite, txt_suite, csv_suite, sudoku_builder_suite,\
-sudoku_grid_suite, sudoku_solver_suite, algorithm_suite, brute_force_suite, \
-peter_norvig_suite, backtracking_suite])
+alltests = unittest.TestSuite([xml_suite, txt_suite, csv_suite, puzzle_reader_suite,\
+sudoku_builder_suite, sudoku_grid_suite, sudoku_solver_suite, parallel_solver_suite, solution_cache_suite, \
+canonical_form_suite, solution_store_suite, puzzle_pool_suite, puzzle_suite, algorithm_suite, brute_force_suite, \
+peter_norvig_suite, backtracking_suite, dancing_links_suite, numpy_batch_suite, solve_metrics_suite, \
+portfolio_race_suite, auto_select_suite, \
+logic_rater_suite, board_topology_suite, benchmark_suite])
 
 unittest.TextTestRunner(verbosity=1).run(alltests)